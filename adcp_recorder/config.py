@@ -10,6 +10,10 @@ CONFIG_DIR_NAME = ".adcp-recorder"
 CONFIG_FILE_NAME = "config.json"
 LOGGER = logging.getLogger(__name__)
 
+# Parsed config file contents keyed by (path, mtime_ns, size). Only the file data
+# is cached: every load() still builds a fresh instance and applies env overrides.
+_FILE_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
+
 
 def get_default_output_dir() -> str:
     """Returns the default data output directory."""
@@ -76,12 +80,17 @@ class RecorderConfig:
             return cls._apply_env_overrides(cls())
 
         try:
-            with open(config_path) as f:
-                data = json.load(f)
-            # Filter out keys that might not be in the dataclass anymore
-            # This is a basic way to handle schema evolution/extra keys
-            valid_keys = cls.__annotations__.keys()
-            filtered_data = {k: v for k, v in data.items() if k in valid_keys}
+            stat = config_path.stat()
+            cache_key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+            filtered_data = _FILE_CACHE.get(cache_key)
+            if filtered_data is None:
+                with open(config_path) as f:
+                    data = json.load(f)
+                # Filter out keys that might not be in the dataclass anymore
+                # This is a basic way to handle schema evolution/extra keys
+                valid_keys = cls.__annotations__.keys()
+                filtered_data = {k: v for k, v in data.items() if k in valid_keys}
+                _FILE_CACHE[cache_key] = filtered_data
             config = cls(**filtered_data)
         except (json.JSONDecodeError, OSError) as e:
             # Fallback to default if corrupted, maybe log warning in future
@@ -124,6 +133,8 @@ class RecorderConfig:
 
         with open(config_path, "w") as f:
             json.dump(self._to_persisted_dict(), f, indent=4)
+        # The rewrite may land within the filesystem's mtime granularity
+        _FILE_CACHE.clear()
 
     def update(self, **kwargs: Any) -> None:
         """Updates configuration with provided values."""
@@ -3,6 +3,15 @@
 Implements NMEA 0183 sentence parsing, checksum validation, and binary data detection.
 """
 
+from functools import lru_cache, reduce
+from operator import xor
+
+# Bytes allowed in an NMEA sentence: printable ASCII (0x20-0x7E) plus CR and LF
+_NMEA_BYTES = bytes(range(0x20, 0x7F)) + b"\r\n"
+
+# Leading characters of a sentence that extract_prefix caches on
+_PREFIX_HEAD_LENGTH = 16
+
 
 def compute_checksum(sentence: str) -> str:
     """Compute NMEA checksum (XOR of characters between $ and *).
@@ -25,12 +34,24 @@ def compute_checksum(sentence: str) -> str:
     if "*" in sentence:
         sentence = sentence.split("*", 1)[0]
 
-    # XOR all characters
-    checksum = 0
-    for char in sentence:
-        checksum ^= ord(char)
+    try:
+        payload = sentence.encode("latin-1")
+    except UnicodeEncodeError:
+        # Not byte-sized characters; fall back to XOR-ing code points
+        checksum = 0
+        for char in sentence:
+            checksum ^= ord(char)
+        return f"{checksum:02X}"
+
+    # SWAR: XOR 8 bytes at a time as 64-bit words (zero padding is a no-op),
+    # then fold the word down to one byte
+    payload += bytes(-len(payload) % 8)
+    word = reduce(xor, memoryview(payload).cast("Q"), 0)
+    word ^= word >> 32
+    word ^= word >> 16
+    word ^= word >> 8
 
-    return f"{checksum:02X}"
+    return f"{word & 0xFF:02X}"
 
 
 def validate_checksum(sentence: str) -> bool:
@@ -74,15 +95,26 @@ def extract_prefix(sentence: str) -> str:
         'PNORI'
 
     """
-    sentence = sentence.strip()
+    # Only the head decides the prefix, and the same few heads recur on every
+    # line, so look them up in a cache. Heads without a comma (long prefixes or
+    # malformed lines) take the uncached path so junk cannot bloat the cache.
+    head = sentence.lstrip()[:_PREFIX_HEAD_LENGTH]
+    if "," in head:
+        return _prefix_of(head)
+    return _prefix_of.__wrapped__(sentence.strip())
+
 
+@lru_cache(maxsize=4096)
+def _prefix_of(sentence: str) -> str:
     if not sentence.startswith("$"):
         raise ValueError("NMEA sentence must start with '$'")
 
-    if "," not in sentence:
+    # Slice up to the first comma rather than splitting (and copying) the whole body
+    comma = sentence.find(",", 1)
+    if comma < 0:
         raise ValueError("NMEA sentence must contain fields separated by ','")
 
-    return sentence[1:].split(",", 1)[0].upper()
+    return sentence[1:comma].upper()
 
 
 def split_sentence(sentence: str) -> tuple[list[str], str | None]:
@@ -104,15 +136,18 @@ def split_sentence(sentence: str) -> tuple[list[str], str | None]:
     sentence = sentence.strip()
 
     # Extract checksum if present
-    checksum = None
-    if "*" in sentence:
-        data_part, checksum = sentence.rsplit("*", 1)
-        checksum = checksum.strip().upper()
+    checksum: str | None
+    data_part, star, tail = sentence.rpartition("*")
+    if star:
+        checksum = tail.strip().upper()
     else:
-        data_part = sentence
+        data_part, checksum = sentence, None
 
-    # Split fields and trim whitespace
-    fields = [f.strip() for f in data_part.split(",")]
+    fields = data_part.split(",")
+    # Instrument output rarely pads fields, so only trim when there is whitespace
+    # to remove; isprintable() is False for every whitespace character but space
+    if " " in data_part or not data_part.isprintable():
+        fields = [f.strip() for f in fields]
 
     return fields, checksum
 
@@ -137,13 +172,9 @@ def is_binary_data(data: bytes, threshold: int = 1024) -> bool:
     """
     # NMEA valid characters: printable ASCII (0x20-0x7E) + CR (0x0D) + LF (0x0A)
     scan_length = min(len(data), threshold)
-    non_nmea_count = 0
 
-    # Count non-NMEA characters
-    for byte in data[:scan_length]:
-        # Allow printable ASCII, CR, LF
-        if not (0x20 <= byte <= 0x7E or byte in (0x0D, 0x0A)):
-            non_nmea_count += 1
+    # Count non-NMEA characters: delete the allowed ones in C and measure what is left
+    non_nmea_count = len(data[:scan_length].translate(None, _NMEA_BYTES))
 
     # If more than 10% of scanned bytes are non-NMEA, treat as binary
     max_allowed = scan_length // 10
@@ -2,7 +2,6 @@ import logging
 import threading
 import time
 from pathlib import Path
-from queue import Queue
 
 from adcp_recorder.config import RecorderConfig
 from adcp_recorder.db import DatabaseManager
@@ -33,6 +32,7 @@ from adcp_recorder.parsers import (
 from adcp_recorder.serial.consumer import MessageRouter, SerialConsumer
 from adcp_recorder.serial.port_manager import SerialConnectionManager
 from adcp_recorder.serial.producer import SerialProducer
+from adcp_recorder.serial.ring_buffer import RingBufferQueue
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +53,7 @@ class AdcpRecorder:
         self.db_manager = DatabaseManager(self.db_path)
 
         # Shared Queue
-        self.queue: Queue = Queue(maxsize=1000)
+        self.queue = RingBufferQueue(maxsize=1000)
 
         # Setup Connection Manager and Producer
         self.connection_manager = SerialConnectionManager(
@@ -160,7 +160,9 @@ class AdcpRecorder:
         """Runs the recorder and blocks until interrupted."""
         self.start()
         try:
-            while not self._stop_event.is_set():
-                time.sleep(0.1)
+            # Park on the event instead of polling; the timeout keeps Ctrl+C
+            # responsive on platforms where a blocked wait is not interruptible
+            while not self._stop_event.wait(1.0):
+                pass
         except KeyboardInterrupt:
             self.stop()
@@ -4,10 +4,23 @@ This package provides database management, schema definitions, and operations
 for persisting NMEA telemetry data in DuckDB.
 """
 
+from .batch_writer import BatchedWriter
 from .db import DatabaseManager
 from .migration import migrate_database
 from .operations import (
     batch_insert_raw_lines,
+    build_header_insert,
+    build_parse_error_insert,
+    build_pnora_insert,
+    build_pnorb_insert,
+    build_pnore_insert,
+    build_pnorf_insert,
+    build_pnori_insert,
+    build_pnorw_insert,
+    build_pnorwd_insert,
+    build_raw_line_insert,
+    build_sensor_insert,
+    build_velocity_insert,
     expand_coefficients,
     expand_energy_densities,
     expand_pnorwd_values,
@@ -42,6 +55,7 @@ from .operations import (
 
 __all__ = [
     "DatabaseManager",
+    "BatchedWriter",
     "insert_raw_line",
     "batch_insert_raw_lines",
     "insert_parse_error",
@@ -70,6 +84,18 @@ __all__ = [
     "query_pnore_data",
     "insert_echo_data",  # Backwards compatibility alias
     "query_echo_data",  # Backwards compatibility alias
+    "build_raw_line_insert",
+    "build_parse_error_insert",
+    "build_pnori_insert",
+    "build_sensor_insert",
+    "build_velocity_insert",
+    "build_header_insert",
+    "build_pnorw_insert",
+    "build_pnorb_insert",
+    "build_pnorf_insert",
+    "build_pnorwd_insert",
+    "build_pnora_insert",
+    "build_pnore_insert",
     "expand_energy_densities",
     "expand_coefficients",
     "expand_pnorwd_values",
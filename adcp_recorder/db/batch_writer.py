@@ -0,0 +1,232 @@
+"""Buffered writer that batches INSERTs per statement.
+
+Every ``insert_*`` helper runs one statement through the full DuckDB
+parse/plan/execute path and commits. For the high-rate ingest path the
+consumer instead collects ``(sql, params)`` pairs from the ``build_*_insert``
+helpers and flushes them in bulk.
+
+Bulk writes register the buffered rows as NumPy columns and run a single
+``INSERT ... SELECT`` over them, letting DuckDB's vectorized executor do the
+work instead of binding parameters row by row (``executemany`` and multi-row
+``VALUES`` both cost roughly a millisecond per row).
+"""
+
+import functools
+import logging
+import re
+import time
+from typing import Any
+
+import duckdb
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Name of the temporary view the buffered columns are registered under
+_BUFFER_VIEW = "_batched_writer_rows"
+
+_PLACEHOLDER = re.compile(r"\?")
+
+# Value types a column may mix and still be scanned as float64
+_FLOAT_COLUMN_TYPES = frozenset({float, int, type(None)})
+
+_TARGET_TABLE = re.compile(r"INSERT\s+INTO\s+(\w+)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=64)
+def _insert_select_sql(sql: str) -> str:
+    """Rewrite ``INSERT ... VALUES (expr, ?, ...)`` as ``INSERT ... SELECT`` from the buffer.
+
+    Each ``?`` becomes a reference to the matching buffer column (c0, c1, ...);
+    other expressions such as ``nextval(...)`` are kept as-is.
+    """
+    head, values = sql.rsplit("VALUES", 1)
+    columns = iter(range(values.count("?")))
+    select_list = _PLACEHOLDER.sub(lambda _: f"c{next(columns)}", values.strip()[1:-1])
+    return f"{head}SELECT {select_list} FROM {_BUFFER_VIEW}"
+
+
+def _column_array(column: tuple[Any, ...]) -> np.ndarray | None:
+    """Build a typed NumPy array for one buffered column.
+
+    Float columns become float64 with None as NaN and all-int columns become
+    int64, so DuckDB scans them as numbers; anything else stays an object
+    array, which DuckDB reads as VARCHAR and casts on insert. Returns None if
+    a float column holds a real NaN, which the scan would turn into NULL.
+    """
+    count = len(column)
+    types = set(map(type, column))
+    if float in types and types <= _FLOAT_COLUMN_TYPES:
+        array = np.fromiter(
+            (np.nan if value is None else value for value in column),
+            dtype=np.float64,
+            count=count,
+        )
+        if np.count_nonzero(np.isnan(array)) != column.count(None):
+            return None
+        return array
+    if types == {int}:
+        try:
+            return np.fromiter(column, dtype=np.int64, count=count)
+        except OverflowError:
+            pass
+    return np.fromiter(column, dtype=object, count=count)
+
+
+class BatchedWriter:
+    """Buffers INSERT parameters per SQL statement and flushes them in bulk.
+
+    Rows are grouped by statement text, so each flush issues one
+    ``INSERT ... SELECT`` per target table, all in a single transaction. A
+    flush happens automatically once ``batch_size`` rows are pending or the
+    oldest pending row is older than ``max_age`` seconds; callers should also
+    flush when they go idle and before closing the connection.
+
+    Example:
+        >>> writer = BatchedWriter(conn, batch_size=1000, max_age=0.5)
+        >>> writer.append(*build_raw_line_insert("$PNORI,...*2E", "OK", "PNORI", True))
+        >>> writer.flush()
+
+    """
+
+    def __init__(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        batch_size: int = 1000,
+        max_age: float = 0.5,
+    ):
+        """Initialize batched writer.
+
+        Args:
+            conn: DuckDB connection to write through
+            batch_size: Pending row count that triggers a flush
+            max_age: Seconds a row may stay buffered before a flush is forced
+
+        """
+        self._conn = conn
+        self._batch_size = batch_size
+        self._max_age = max_age
+        self._pending: dict[str, list[tuple[Any, ...]]] = {}
+        self._count = 0
+        self._first_pending_at = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows not yet written."""
+        return self._count
+
+    def append(self, sql: str, params: tuple[Any, ...]) -> None:
+        """Buffer one row, flushing if the batch is full or stale.
+
+        Args:
+            sql: INSERT statement with positional placeholders
+            params: Parameters for a single row
+
+        """
+        rows = self._pending.get(sql)
+        if rows is None:
+            rows = self._pending[sql] = []
+        rows.append(params)
+
+        if self._count == 0:
+            self._first_pending_at = time.monotonic()
+        self._count += 1
+
+        if self._count >= self._batch_size or self._is_stale():
+            self.flush()
+
+    def flush_if_due(self) -> None:
+        """Flush if the oldest buffered row has exceeded max_age."""
+        if self._count and self._is_stale():
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered rows to the database.
+
+        Every statement's rows are written inside one transaction, so a flush
+        pays for a single commit however many tables it touches. If anything
+        fails the transaction is rolled back and each statement is retried in
+        its own transaction, replaying rows one by one where needed, so a
+        single bad row only loses itself. If the transaction cannot even be
+        started the error propagates and the rows stay buffered for the next
+        flush.
+        """
+        if not self._count:
+            return
+
+        conn = self._conn
+        conn.execute("BEGIN TRANSACTION")
+
+        pending = self._pending
+        self._pending = {}
+        self._count = 0
+        try:
+            for sql, rows in pending.items():
+                if len(rows) == 1:
+                    conn.execute(sql, rows[0])
+                else:
+                    self._insert_columns(sql, rows)
+            conn.commit()
+            return
+        except Exception as e:
+            conn.rollback()
+            logger.warning(f"Batched flush failed ({e}), retrying per statement")
+
+        for sql, rows in pending.items():
+            self._flush_statement(sql, rows)
+
+    def _flush_statement(self, sql: str, rows: list[tuple[Any, ...]]) -> None:
+        """Write one statement's rows in their own transaction, replaying singly on failure."""
+        if len(rows) == 1:
+            self._replay(sql, rows)
+            return
+
+        conn = self._conn
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            self._insert_columns(sql, rows)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.warning(f"Batch insert of {len(rows)} rows failed ({e}), retrying singly")
+            self._replay(sql, rows)
+
+    def _insert_columns(self, sql: str, rows: list[tuple[Any, ...]]) -> None:
+        """Insert rows in one statement by registering them as NumPy columns.
+
+        DuckDB reads a NumPy NaN as NULL, whereas a bound parameter keeps it,
+        so a batch holding a real NaN is bound row by row instead.
+        """
+        conn = self._conn
+        buffer = {}
+        for i, column in enumerate(zip(*rows, strict=True)):
+            array = _column_array(column)
+            if array is None:
+                for params in rows:
+                    conn.execute(sql, params)
+                return
+            buffer[f"c{i}"] = array
+
+        conn.register(_BUFFER_VIEW, buffer)
+        try:
+            conn.execute(_insert_select_sql(sql))
+        finally:
+            conn.unregister(_BUFFER_VIEW)
+
+    def _replay(self, sql: str, rows: list[tuple[Any, ...]]) -> None:
+        """Execute rows individually, logging and skipping the ones that fail.
+
+        The consumer buffers a typed row and its ``raw_lines`` row separately,
+        so a dropped typed row leaves the raw line marked OK; the log names
+        the table and the parameters, which carry the original sentence.
+        """
+        for params in rows:
+            try:
+                self._conn.execute(sql, params)
+            except Exception as e:
+                match = _TARGET_TABLE.search(sql)
+                table = match.group(1) if match else "unknown table"
+                logger.error(f"Dropping row for {table} that failed to insert ({e}): {params!r}")
+
+    def _is_stale(self) -> bool:
+        return time.monotonic() - self._first_pending_at >= self._max_age
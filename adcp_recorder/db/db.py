@@ -8,6 +8,9 @@ from .schema import ALL_SCHEMA_SQL
 
 logger = logging.getLogger(__name__)
 
+# Every schema statement ends with ';', so they can be submitted as one script
+_SCHEMA_SCRIPT = "\n".join(ALL_SCHEMA_SQL)
+
 
 class DatabaseManager:
     """Manages DuckDB database connections and schema initialization.
@@ -73,7 +76,31 @@ class DatabaseManager:
 
         conn = self.get_connection()
 
-        # Execute all schema creation statements
+        # Submit the whole schema as one script in one transaction; a commit
+        # per DDL statement roughly doubles start-up time on a file database
+        try:
+            conn.execute("BEGIN TRANSACTION")
+        except Exception as e:
+            # No transaction of ours was opened, so there is nothing to roll
+            # back; report the real error and go straight to the per-statement path
+            logger.warning(f"Schema transaction not started ({e}), creating per statement")
+            self._initialize_schema_per_statement(conn)
+        else:
+            try:
+                conn.execute(_SCHEMA_SCRIPT)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                # Fall back to one statement at a time so a single failure is skipped
+                self._initialize_schema_per_statement(conn)
+        self._schema_initialized = True
+
+        # After structural schema is ready, attempt to link DuckLake (Parquet)
+        self.initialize_ducklake()
+
+    @staticmethod
+    def _initialize_schema_per_statement(conn: duckdb.DuckDBPyConnection) -> None:
+        """Run each schema statement on its own, logging and skipping failures."""
         for sql_statement in ALL_SCHEMA_SQL:
             try:
                 conn.execute(sql_statement)
@@ -83,10 +110,6 @@ class DatabaseManager:
                 logger.warning(f"Schema initialization warning: {e}")
 
         conn.commit()
-        self._schema_initialized = True
-
-        # After structural schema is ready, attempt to link DuckLake (Parquet)
-        self.initialize_ducklake()
 
     def initialize_ducklake(self) -> None:
         """Initialize DuckLake views pointing to Parquet files if they exist."""
@@ -103,19 +126,37 @@ class DatabaseManager:
 
         logger.info(f"Initializing DuckLake views from {parquet_path}")
 
-        # Register a view for each record type found in parquet folder
+        # Register a view for each record type found in parquet folder,
+        # submitted as one script in one transaction. Directories without any
+        # Parquet file yet are skipped: read_parquet fails on an empty glob,
+        # which would roll back every other view in the script.
         try:
+            statements = []
             for record_type_dir in parquet_path.iterdir():
                 if record_type_dir.is_dir():
+                    if next(iter(record_type_dir.rglob("*.parquet")), None) is None:
+                        logger.debug(f"Skipping DuckLake view for empty {record_type_dir}")
+                        continue
                     prefix = record_type_dir.name.lower()
                     view_name = f"view_{prefix}"
                     parquet_glob = str(record_type_dir / "**" / "*.parquet")
 
-                    conn.execute(
+                    statements.append(
                         f"CREATE OR REPLACE VIEW {view_name} "
                         f"AS SELECT * FROM read_parquet('{parquet_glob}')"
                     )
-                    logger.debug(f"Created DuckLake view: {view_name}")
+
+            if not statements:
+                return
+
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.execute(";\n".join(statements) + ";")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            logger.debug(f"Created {len(statements)} DuckLake views")
         except Exception as e:
             logger.warning(f"Failed to initialize some DuckLake views: {e}")
 
@@ -137,8 +178,8 @@ class DatabaseManager:
         optimizes the database by analyzing tables for better query performance.
         """
         conn = self.get_connection()
-        conn.execute("CHECKPOINT;")
-        conn.execute("ANALYZE;")
+        # One call for both statements; DuckDB runs multi-statement strings in order
+        conn.execute("CHECKPOINT;\nANALYZE;")
         conn.commit()
 
     def vacuum(self) -> None:
@@ -9,6 +9,40 @@ from typing import Any
 
 import duckdb
 
+RAW_LINE_INSERT_SQL = """
+    INSERT INTO raw_lines (
+        line_id, raw_sentence, parse_status, record_type, checksum_valid, error_message
+    )
+    VALUES (nextval('raw_lines_seq'), ?, ?, ?, ?, ?)
+"""
+
+PARSE_ERROR_INSERT_SQL = """
+    INSERT INTO parse_errors (
+        error_id, raw_sentence, error_type, error_message,
+        attempted_prefix, checksum_expected, checksum_actual
+    )
+    VALUES (nextval('parse_errors_seq'), ?, ?, ?, ?, ?, ?)
+"""
+
+
+def build_raw_line_insert(
+    sentence: str,
+    parse_status: str = "PENDING",
+    record_type: str | None = None,
+    checksum_valid: bool | None = None,
+    error_message: str | None = None,
+) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT statement and parameters for a raw_lines record.
+
+    Arguments match insert_raw_line(). The returned pair can be executed
+    directly or handed to a BatchedWriter.
+
+    Returns:
+        Tuple of (sql, params)
+
+    """
+    return RAW_LINE_INSERT_SQL, (sentence, parse_status, record_type, checksum_valid, error_message)
+
 
 def insert_raw_line(
     conn: duckdb.DuckDBPyConnection,
@@ -35,16 +69,10 @@ def insert_raw_line(
         >>> line_id = insert_raw_line(conn, "$PNORI,4,Test*2E", "OK", "PNORI", True)
 
     """
-    result = conn.execute(
-        """
-        INSERT INTO raw_lines (
-            line_id, raw_sentence, parse_status, record_type, checksum_valid, error_message
-        )
-        VALUES (nextval('raw_lines_seq'), ?, ?, ?, ?, ?)
-        RETURNING line_id
-        """,
-        [sentence, parse_status, record_type, checksum_valid, error_message],
-    ).fetchone()
+    sql, params = build_raw_line_insert(
+        sentence, parse_status, record_type, checksum_valid, error_message
+    )
+    result = conn.execute(sql + " RETURNING line_id", params).fetchone()
 
     conn.commit()
     return result[0] if result else -1
@@ -116,6 +144,32 @@ def batch_insert_raw_lines(conn: duckdb.DuckDBPyConnection, records: list[dict[s
     return len(records)
 
 
+def build_parse_error_insert(
+    sentence: str,
+    error_type: str,
+    error_message: str | None = None,
+    attempted_prefix: str | None = None,
+    checksum_expected: str | None = None,
+    checksum_actual: str | None = None,
+) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT statement and parameters for a parse_errors record.
+
+    Arguments match insert_parse_error().
+
+    Returns:
+        Tuple of (sql, params)
+
+    """
+    return PARSE_ERROR_INSERT_SQL, (
+        sentence,
+        error_type,
+        error_message,
+        attempted_prefix,
+        checksum_expected,
+        checksum_actual,
+    )
+
+
 def insert_parse_error(
     conn: duckdb.DuckDBPyConnection,
     sentence: str,
@@ -145,24 +199,10 @@ def insert_parse_error(
         ...                               checksum_actual="FF")
 
     """
-    result = conn.execute(
-        """
-        INSERT INTO parse_errors (
-            error_id, raw_sentence, error_type, error_message,
-            attempted_prefix, checksum_expected, checksum_actual
-        )
-        VALUES (nextval('parse_errors_seq'), ?, ?, ?, ?, ?, ?)
-        RETURNING error_id
-        """,
-        [
-            sentence,
-            error_type,
-            error_message,
-            attempted_prefix,
-            checksum_expected,
-            checksum_actual,
-        ],
-    ).fetchone()
+    sql, params = build_parse_error_insert(
+        sentence, error_type, error_message, attempted_prefix, checksum_expected, checksum_actual
+    )
+    result = conn.execute(sql + " RETURNING error_id", params).fetchone()
 
     conn.commit()
     return result[0] if result else -1
@@ -348,6 +388,74 @@ def query_parse_errors(
 # PNORI Configuration Operations
 
 
+PNORI_INSERT_SQL = """
+    INSERT INTO pnori (
+        config_id, original_sentence,
+        instrument_type_name, instrument_type_code, head_id,
+        beam_count, cell_count, blanking_distance, cell_size,
+        coord_system_name, coord_system_code, checksum
+    )
+    VALUES (
+        nextval('pnori_seq'), ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?
+    )
+"""
+
+PNORI12_INSERT_SQL = """
+    INSERT INTO pnori12 (
+        config_id, data_format, original_sentence,
+        instrument_type_name, instrument_type_code, head_id,
+        beam_count, cell_count, blanking_distance, cell_size,
+        coord_system_name, coord_system_code, checksum
+    )
+    VALUES (
+        nextval('pnori12_seq'), ?, ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?
+    )
+"""
+
+
+def build_pnori_insert(
+    original_sentence: str, pnori_dict: dict[str, Any]
+) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for a PNORI/PNORI1/PNORI2 configuration - routes to correct table.
+
+    Returns:
+        Tuple of (sql, params)
+
+    Raises:
+        ValueError: If the sentence type is not a PNORI family member
+
+    """
+    sentence_type = pnori_dict["sentence_type"]
+    if sentence_type not in ("PNORI", "PNORI1", "PNORI2"):
+        raise ValueError(f"Unknown PNORI sentence type: {sentence_type}")
+
+    fields = (
+        original_sentence,
+        pnori_dict["instrument_type_name"],
+        pnori_dict["instrument_type_code"],
+        pnori_dict["head_id"],
+        pnori_dict["beam_count"],
+        pnori_dict["cell_count"],
+        pnori_dict["blanking_distance"],
+        pnori_dict["cell_size"],
+        pnori_dict["coord_system_name"],
+        pnori_dict["coord_system_code"],
+        pnori_dict["checksum"],
+    )
+
+    # Route to correct table based on sentence type
+    if sentence_type == "PNORI":
+        return PNORI_INSERT_SQL, fields
+    data_format = 101 if sentence_type == "PNORI1" else 102
+    return PNORI12_INSERT_SQL, (data_format, *fields)
+
+
 def insert_pnori_configuration(
     conn: duckdb.DuckDBPyConnection, pnori_dict: dict[str, Any], original_sentence: str
 ) -> int:
@@ -361,75 +469,8 @@ def insert_pnori_configuration(
     Returns:
         The generated config_id for the inserted record
     """
-    sentence_type = pnori_dict["sentence_type"]
-
-    # Route to correct table based on sentence type
-    if sentence_type == "PNORI":
-        result = conn.execute(
-            """
-            INSERT INTO pnori (
-                config_id, original_sentence,
-                instrument_type_name, instrument_type_code, head_id,
-                beam_count, cell_count, blanking_distance, cell_size,
-                coord_system_name, coord_system_code, checksum
-            )
-            VALUES (
-                nextval('pnori_seq'), ?,
-                ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?
-            )
-            RETURNING config_id
-            """,
-            [
-                original_sentence,
-                pnori_dict["instrument_type_name"],
-                pnori_dict["instrument_type_code"],
-                pnori_dict["head_id"],
-                pnori_dict["beam_count"],
-                pnori_dict["cell_count"],
-                pnori_dict["blanking_distance"],
-                pnori_dict["cell_size"],
-                pnori_dict["coord_system_name"],
-                pnori_dict["coord_system_code"],
-                pnori_dict["checksum"],
-            ],
-        ).fetchone()
-    elif sentence_type in ("PNORI1", "PNORI2"):
-        data_format = 101 if sentence_type == "PNORI1" else 102
-        result = conn.execute(
-            """
-            INSERT INTO pnori12 (
-                config_id, data_format, original_sentence,
-                instrument_type_name, instrument_type_code, head_id,
-                beam_count, cell_count, blanking_distance, cell_size,
-                coord_system_name, coord_system_code, checksum
-            )
-            VALUES (
-                nextval('pnori12_seq'), ?, ?,
-                ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?
-            )
-            RETURNING config_id
-            """,
-            [
-                data_format,
-                original_sentence,
-                pnori_dict["instrument_type_name"],
-                pnori_dict["instrument_type_code"],
-                pnori_dict["head_id"],
-                pnori_dict["beam_count"],
-                pnori_dict["cell_count"],
-                pnori_dict["blanking_distance"],
-                pnori_dict["cell_size"],
-                pnori_dict["coord_system_name"],
-                pnori_dict["coord_system_code"],
-                pnori_dict["checksum"],
-            ],
-        ).fetchone()
-    else:
-        raise ValueError(f"Unknown PNORI sentence type: {sentence_type}")
+    sql, params = build_pnori_insert(original_sentence, pnori_dict)
+    result = conn.execute(sql + " RETURNING config_id", params).fetchone()
 
     conn.commit()
     return result[0] if result else -1
@@ -524,24 +565,50 @@ def query_pnori_configurations(
     return [dict(zip(columns, row, strict=False)) for row in result]
 
 
-def insert_sensor_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
-    """Insert sensor data - routes to correct table based on sentence type."""
+PNORS_DF100_INSERT_SQL = """
+    INSERT INTO pnors_df100 (
+        record_id, original_sentence, measurement_date, measurement_time,
+        error_code, status_code, battery, sound_speed, heading, pitch, roll,
+        pressure, temperature, analog1, analog2, checksum
+    ) VALUES (
+        nextval('pnors_df100_seq'), ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+PNORS12_INSERT_SQL = """
+    INSERT INTO pnors12 (
+        record_id, data_format, original_sentence, measurement_date, measurement_time,
+        error_code, status_code, battery, sound_speed, heading_std_dev,
+        heading, pitch, pitch_std_dev, roll, roll_std_dev,
+        pressure, pressure_std_dev, temperature, checksum
+    ) VALUES (
+        nextval('pnors12_seq'), ?, ?, ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?, ?, ?
+    )
+"""
+
+PNORS34_INSERT_SQL = """
+    INSERT INTO pnors34 (
+        record_id, data_format, original_sentence, measurement_date, measurement_time,
+        battery, sound_speed, heading, pitch, roll, pressure, temperature, checksum
+    ) VALUES (
+        nextval('pnors34_seq'), ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+
+def build_sensor_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for sensor data - routes to correct table based on sentence type."""
     sentence_type = data["sentence_type"]
 
     # Route to correct table based on data format
     if sentence_type == "PNORS":
         # DF100 - keep separate
-        query = """
-        INSERT INTO pnors_df100 (
-            record_id, original_sentence, measurement_date, measurement_time,
-            error_code, status_code, battery, sound_speed, heading, pitch, roll,
-            pressure, temperature, analog1, analog2, checksum
-        ) VALUES (
-            nextval('pnors_df100_seq'), ?, ?, ?,
-            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-        ) RETURNING record_id;
-        """
-        params_df100 = (
+        return PNORS_DF100_INSERT_SQL, (
             original_sentence,
             data["date"],
             data["time"],
@@ -558,24 +625,10 @@ def insert_sensor_data(conn: duckdb.DuckDBPyConnection, original_sentence: str,
             data.get("analog2"),
             data.get("checksum"),
         )
-        result = conn.execute(query, params_df100).fetchone()
-    elif sentence_type in ("PNORS1", "PNORS2"):
+    if sentence_type in ("PNORS1", "PNORS2"):
         # DF101/102 consolidated into pnors12
         data_format = 101 if sentence_type == "PNORS1" else 102
-        query = """
-        INSERT INTO pnors12 (
-            record_id, data_format, original_sentence, measurement_date, measurement_time,
-            error_code, status_code, battery, sound_speed, heading_std_dev,
-            heading, pitch, pitch_std_dev, roll, roll_std_dev,
-            pressure, pressure_std_dev, temperature, checksum
-        ) VALUES (
-            nextval('pnors12_seq'), ?, ?, ?, ?,
-            ?, ?, ?, ?, ?,
-            ?, ?, ?, ?, ?,
-            ?, ?, ?, ?
-        ) RETURNING record_id;
-        """
-        params_df101 = (
+        return PNORS12_INSERT_SQL, (
             data_format,
             original_sentence,
             data["date"],
@@ -595,20 +648,10 @@ def insert_sensor_data(conn: duckdb.DuckDBPyConnection, original_sentence: str,
             data.get("temperature"),
             data.get("checksum"),
         )
-        result = conn.execute(query, params_df101).fetchone()
-    elif sentence_type in ("PNORS3", "PNORS4"):
+    if sentence_type in ("PNORS3", "PNORS4"):
         # DF103/104 consolidated into pnors34
         data_format = 103 if sentence_type == "PNORS3" else 104
-        query = """
-        INSERT INTO pnors34 (
-            record_id, data_format, original_sentence, measurement_date, measurement_time,
-            battery, sound_speed, heading, pitch, roll, pressure, temperature, checksum
-        ) VALUES (
-            nextval('pnors34_seq'), ?, ?, ?, ?,
-            ?, ?, ?, ?, ?, ?, ?, ?
-        ) RETURNING record_id;
-        """
-        params_df103 = (
+        return PNORS34_INSERT_SQL, (
             data_format,
             original_sentence,
             data["date"],
@@ -622,35 +665,60 @@ def insert_sensor_data(conn: duckdb.DuckDBPyConnection, original_sentence: str,
             data.get("temperature"),
             data.get("checksum"),
         )
-        result = conn.execute(query, params_df103).fetchone()
-    else:
-        raise ValueError(f"Unknown sensor sentence type: {sentence_type}")
+    raise ValueError(f"Unknown sensor sentence type: {sentence_type}")
 
+
+def insert_sensor_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
+    """Insert sensor data - routes to correct table based on sentence type."""
+    sql, params = build_sensor_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
     conn.commit()
     return result[0] if result else -1
 
 
-def insert_velocity_data(
-    conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict
-) -> int:
-    """Insert velocity data - routes to correct table based on sentence type."""
+PNORC_DF100_INSERT_SQL = """
+    INSERT INTO pnorc_df100 (
+        record_id, original_sentence, measurement_date, measurement_time,
+        cell_index, vel1, vel2, vel3, vel4, speed, direction, amp_unit,
+        amp1, amp2, amp3, amp4, corr1, corr2, corr3, corr4, checksum
+    ) VALUES (
+        nextval('pnorc_df100_seq'), ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+PNORC12_INSERT_SQL = """
+    INSERT INTO pnorc12 (
+        record_id, data_format, original_sentence, measurement_date, measurement_time,
+        cell_index, cell_distance, vel1, vel2, vel3, vel4,
+        amp1, amp2, amp3, amp4, corr1, corr2, corr3, corr4, checksum
+    ) VALUES (
+        nextval('pnorc12_seq'), ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+PNORC34_INSERT_SQL = """
+    INSERT INTO pnorc34 (
+        record_id, data_format, original_sentence, measurement_date, measurement_time,
+        cell_index, cell_distance, speed, direction, checksum
+    ) VALUES (
+        nextval('pnorc34_seq'), ?, ?, ?, ?,
+        ?, ?, ?, ?, ?
+    )
+"""
+
+
+def build_velocity_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for velocity data - routes to correct table based on sentence type."""
     sentence_type = data["sentence_type"]
 
     # Route to correct table based on data format
     if sentence_type == "PNORC":
         # DF100 - keep separate
-        query = """
-        INSERT INTO pnorc_df100 (
-            record_id, original_sentence, measurement_date, measurement_time,
-            cell_index, vel1, vel2, vel3, vel4, speed, direction, amp_unit,
-            amp1, amp2, amp3, amp4, corr1, corr2, corr3, corr4, checksum
-        ) VALUES (
-            nextval('pnorc_df100_seq'), ?, ?, ?,
-            ?, ?, ?, ?, ?, ?, ?, ?,
-            ?, ?, ?, ?, ?, ?, ?, ?, ?
-        ) RETURNING record_id;
-        """
-        params_df100 = (
+        return PNORC_DF100_INSERT_SQL, (
             original_sentence,
             data["date"],
             data["time"],
@@ -672,22 +740,10 @@ def insert_velocity_data(
             data["corr4"],
             data.get("checksum"),
         )
-        result = conn.execute(query, params_df100).fetchone()
-    elif sentence_type in ("PNORC1", "PNORC2"):
+    if sentence_type in ("PNORC1", "PNORC2"):
         # DF101/102 consolidated into pnorc12
         data_format = 101 if sentence_type == "PNORC1" else 102
-        query = """
-        INSERT INTO pnorc12 (
-            record_id, data_format, original_sentence, measurement_date, measurement_time,
-            cell_index, cell_distance, vel1, vel2, vel3, vel4,
-            amp1, amp2, amp3, amp4, corr1, corr2, corr3, corr4, checksum
-        ) VALUES (
-            nextval('pnorc12_seq'), ?, ?, ?, ?,
-            ?, ?, ?, ?, ?, ?,
-            ?, ?, ?, ?, ?, ?, ?, ?, ?
-        ) RETURNING record_id;
-        """
-        params_df101 = (
+        return PNORC12_INSERT_SQL, (
             data_format,
             original_sentence,
             data["date"],
@@ -708,20 +764,10 @@ def insert_velocity_data(
             data["corr4"],
             data.get("checksum"),
         )
-        result = conn.execute(query, params_df101).fetchone()
-    elif sentence_type in ("PNORC3", "PNORC4"):
+    if sentence_type in ("PNORC3", "PNORC4"):
         # DF103/104 consolidated into pnorc34
         data_format = 103 if sentence_type == "PNORC3" else 104
-        query = """
-        INSERT INTO pnorc34 (
-            record_id, data_format, original_sentence, measurement_date, measurement_time,
-            cell_index, cell_distance, speed, direction, checksum
-        ) VALUES (
-            nextval('pnorc34_seq'), ?, ?, ?, ?,
-            ?, ?, ?, ?, ?
-        ) RETURNING record_id;
-        """
-        params_df103 = (
+        return PNORC34_INSERT_SQL, (
             data_format,
             original_sentence,
             data["date"],
@@ -732,60 +778,58 @@ def insert_velocity_data(
             data["direction"],
             data.get("checksum"),
         )
-        result = conn.execute(query, params_df103).fetchone()
-    else:
-        raise ValueError(f"Unknown velocity sentence type: {sentence_type}")
+    raise ValueError(f"Unknown velocity sentence type: {sentence_type}")
 
+
+def insert_velocity_data(
+    conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict
+) -> int:
+    """Insert velocity data - routes to correct table based on sentence type."""
+    sql, params = build_velocity_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
     conn.commit()
     return result[0] if result else -1
 
 
-def insert_header_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
-    """Insert header data - routes to consolidated pnorh table."""
+PNORH_INSERT_SQL = """
+    INSERT INTO pnorh (
+        record_id, data_format, original_sentence,
+        measurement_date, measurement_time,
+        error_code, status_code, checksum
+    ) VALUES (
+        nextval('pnorh_seq'), ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+
+def build_header_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for header data - routes to consolidated pnorh table."""
     sentence_type = data["sentence_type"]
 
-    if sentence_type in ("PNORH3", "PNORH4"):
-        data_format = 103 if sentence_type == "PNORH3" else 104
-        query = """
-        INSERT INTO pnorh (
-            record_id, data_format, original_sentence,
-            measurement_date, measurement_time,
-            error_code, status_code, checksum
-        ) VALUES (
-            nextval('pnorh_seq'), ?, ?, ?, ?, ?, ?, ?
-        ) RETURNING record_id;
-        """
-        params = (
-            data_format,
-            original_sentence,
-            data["date"],
-            data["time"],
-            data["error_code"],
-            data["status_code"],
-            data.get("checksum"),
-        )
-    else:
+    if sentence_type not in ("PNORH3", "PNORH4"):
         raise ValueError(f"Unknown header sentence type: {sentence_type}")
 
-    result = conn.execute(query, params).fetchone()
-    conn.commit()
-    return result[0] if result else -1
-
+    data_format = 103 if sentence_type == "PNORH3" else 104
+    return PNORH_INSERT_SQL, (
+        data_format,
+        original_sentence,
+        data["date"],
+        data["time"],
+        data["error_code"],
+        data["status_code"],
+        data.get("checksum"),
+    )
 
-def insert_pnore_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
-    """Insert wave energy density spectrum into pnore_data table.
 
-    Args:
-        conn: DuckDB connection
-        original_sentence: Original NMEA sentence
-        data: Dictionary from PNORE.to_dict() containing spectrum_basis,
-              frequencies, and energy_densities array
+def insert_header_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
+    """Insert header data - routes to consolidated pnorh table."""
+    sql, params = build_header_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
+    conn.commit()
+    return result[0] if result else -1
 
-    Returns:
-        The generated record_id
 
-    """
-    query = """
+PNORE_INSERT_SQL = """
     INSERT INTO pnore_data (
         record_id, original_sentence, sentence_type,
         measurement_date, measurement_time,
@@ -796,13 +840,16 @@ def insert_pnore_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         ?, ?,
         ?, ?, ?, ?,
         ?, ?
-    ) RETURNING record_id;
-    """
+    )
+"""
+
 
+def build_pnore_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for a wave energy density spectrum (pnore_data)."""
     # Serialize energy_densities list to JSON string
     energy_json = json.dumps(data["energy_densities"])
 
-    params = (
+    return PNORE_INSERT_SQL, (
         original_sentence,
         data["sentence_type"],
         data["date"],
@@ -815,14 +862,27 @@ def insert_pnore_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         data.get("checksum"),
     )
 
-    result = conn.execute(query, params).fetchone()
+
+def insert_pnore_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
+    """Insert wave energy density spectrum into pnore_data table.
+
+    Args:
+        conn: DuckDB connection
+        original_sentence: Original NMEA sentence
+        data: Dictionary from PNORE.to_dict() containing spectrum_basis,
+              frequencies, and energy_densities array
+
+    Returns:
+        The generated record_id
+
+    """
+    sql, params = build_pnore_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
     conn.commit()
     return result[0] if result else -1
 
 
-def insert_pnorw_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
-    """Insert into pnorw_data table."""
-    query = """
+PNORW_INSERT_SQL = """
     INSERT INTO pnorw_data (
         record_id, original_sentence, sentence_type,
         measurement_date, measurement_time,
@@ -845,9 +905,13 @@ def insert_pnorw_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         ?, ?,
         ?, ?,
         ?, ?
-    ) RETURNING record_id;
-    """
-    params = (
+    )
+"""
+
+
+def build_pnorw_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for pnorw_data."""
+    return PNORW_INSERT_SQL, (
         original_sentence,
         data["sentence_type"],
         data["date"],
@@ -873,24 +937,17 @@ def insert_pnorw_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         data.get("wave_error_code"),
         data.get("checksum"),
     )
-    result = conn.execute(query, params).fetchone()
-    conn.commit()
-    return result[0] if result else -1
 
 
-def insert_pnorb_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
-    """Insert PNORB wave band parameters into pnorb_data table.
-
-    Args:
-        conn: DuckDB connection
-        original_sentence: Original NMEA sentence
-        data: Dictionary from PNORB.to_dict() containing wave band parameters
+def insert_pnorw_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
+    """Insert into pnorw_data table."""
+    sql, params = build_pnorw_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
+    conn.commit()
+    return result[0] if result else -1
 
-    Returns:
-        The generated record_id
 
-    """
-    query = """
+PNORB_INSERT_SQL = """
     INSERT INTO pnorb_data (
         record_id, original_sentence, sentence_type,
         measurement_date, measurement_time,
@@ -907,10 +964,13 @@ def insert_pnorb_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         ?, ?, ?,
         ?, ?, ?,
         ?, ?
-    ) RETURNING record_id;
-    """
+    )
+"""
+
 
-    params = (
+def build_pnorb_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for PNORB wave band parameters (pnorb_data)."""
+    return PNORB_INSERT_SQL, (
         original_sentence,
         data["sentence_type"],
         data["date"],
@@ -929,27 +989,26 @@ def insert_pnorb_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         data.get("checksum"),
     )
 
-    result = conn.execute(query, params).fetchone()
-    conn.commit()
-    return result[0] if result else -1
 
-
-def insert_pnorf_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
-    """Insert Fourier coefficient spectra into pnorf_data table.
+def insert_pnorb_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
+    """Insert PNORB wave band parameters into pnorb_data table.
 
     Args:
         conn: DuckDB connection
         original_sentence: Original NMEA sentence
-        data: Dictionary from PNORF.to_dict() containing coefficient_flag,
-              spectrum_basis, frequencies, and coefficients array
+        data: Dictionary from PNORB.to_dict() containing wave band parameters
 
     Returns:
         The generated record_id
 
     """
-    import json
+    sql, params = build_pnorb_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
+    conn.commit()
+    return result[0] if result else -1
 
-    query = """
+
+PNORF_INSERT_SQL = """
     INSERT INTO pnorf_data (
         record_id, original_sentence, sentence_type,
         coefficient_flag, measurement_date, measurement_time,
@@ -960,13 +1019,16 @@ def insert_pnorf_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         ?, ?, ?,
         ?, ?, ?, ?,
         ?, ?
-    ) RETURNING record_id;
-    """
+    )
+"""
 
+
+def build_pnorf_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for Fourier coefficient spectra (pnorf_data)."""
     # Serialize coefficients list to JSON string
     coefficients_json = json.dumps(data["coefficients"])
 
-    params = (
+    return PNORF_INSERT_SQL, (
         original_sentence,
         data["sentence_type"],
         data["coefficient_flag"],
@@ -979,27 +1041,28 @@ def insert_pnorf_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         coefficients_json,
         data.get("checksum"),
     )
-    result = conn.execute(query, params).fetchone()
-    conn.commit()
-    return result[0] if result else -1
 
 
-def insert_pnorwd_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
-    """Insert wave directional spectra into pnorwd_data table.
+def insert_pnorf_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
+    """Insert Fourier coefficient spectra into pnorf_data table.
 
     Args:
         conn: DuckDB connection
         original_sentence: Original NMEA sentence
-        data: Dictionary from PNORWD.to_dict() containing direction_type,
-              spectrum_basis, frequencies, and values array
+        data: Dictionary from PNORF.to_dict() containing coefficient_flag,
+              spectrum_basis, frequencies, and coefficients array
 
     Returns:
         The generated record_id
 
     """
-    import json
+    sql, params = build_pnorf_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
+    conn.commit()
+    return result[0] if result else -1
 
-    query = """
+
+PNORWD_INSERT_SQL = """
     INSERT INTO pnorwd_data (
         record_id, original_sentence, sentence_type,
         direction_type, measurement_date, measurement_time,
@@ -1010,13 +1073,16 @@ def insert_pnorwd_data(conn: duckdb.DuckDBPyConnection, original_sentence: str,
         ?, ?, ?,
         ?, ?, ?, ?,
         ?, ?
-    ) RETURNING record_id;
-    """
+    )
+"""
+
 
+def build_pnorwd_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for wave directional spectra (pnorwd_data)."""
     # Serialize values list to JSON string
     values_json = json.dumps(data["values"])
 
-    params = (
+    return PNORWD_INSERT_SQL, (
         original_sentence,
         data["sentence_type"],
         data["direction_type"],
@@ -1029,14 +1095,28 @@ def insert_pnorwd_data(conn: duckdb.DuckDBPyConnection, original_sentence: str,
         values_json,
         data.get("checksum"),
     )
-    result = conn.execute(query, params).fetchone()
+
+
+def insert_pnorwd_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
+    """Insert wave directional spectra into pnorwd_data table.
+
+    Args:
+        conn: DuckDB connection
+        original_sentence: Original NMEA sentence
+        data: Dictionary from PNORWD.to_dict() containing direction_type,
+              spectrum_basis, frequencies, and values array
+
+    Returns:
+        The generated record_id
+
+    """
+    sql, params = build_pnorwd_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
     conn.commit()
     return result[0] if result else -1
 
 
-def insert_pnora_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
-    """Insert into pnora_data table."""
-    query = """
+PNORA_INSERT_SQL = """
     INSERT INTO pnora_data (
         record_id, original_sentence, sentence_type,
         measurement_date, measurement_time,
@@ -1049,9 +1129,13 @@ def insert_pnora_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         ?, ?, ?, ?,
         ?, ?,
         ?
-    ) RETURNING record_id;
-    """
-    params = (
+    )
+"""
+
+
+def build_pnora_insert(original_sentence: str, data: dict) -> tuple[str, tuple[Any, ...]]:
+    """Build the INSERT for pnora_data."""
+    return PNORA_INSERT_SQL, (
         original_sentence,
         data["sentence_type"],
         data["date"],
@@ -1064,7 +1148,12 @@ def insert_pnora_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, d
         data["roll"],
         data.get("checksum"),
     )
-    result = conn.execute(query, params).fetchone()
+
+
+def insert_pnora_data(conn: duckdb.DuckDBPyConnection, original_sentence: str, data: dict) -> int:
+    """Insert into pnora_data table."""
+    sql, params = build_pnora_insert(original_sentence, data)
+    result = conn.execute(sql + " RETURNING record_id", params).fetchone()
     conn.commit()
     return result[0] if result else -1
 
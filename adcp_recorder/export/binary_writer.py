@@ -3,6 +3,10 @@
 This writer creates a dedicated `errors_binary` folder under the provided
 base path and writes binary data into timestamped files with a sequential
 identifier when multiple blobs start in the same second.
+
+Chunks are buffered and written out when the caller flushes (the consumer
+does so once per drained batch), so a binary storm costs one write per batch
+rather than one per chunk.
 """
 
 import os
@@ -10,6 +14,9 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import BinaryIO
 
+# Buffered bytes per blob file; a fuller buffer is written out without waiting for flush()
+_WRITE_BUFFER_SIZE = 65536
+
 
 class BinaryBlobWriter:
     def __init__(self, base_path: str):
@@ -43,9 +50,8 @@ class BinaryBlobWriter:
             self.finish_blob()
 
         path = self._next_filepath()
-        f = open(path, "wb")
+        f = open(path, "wb", buffering=_WRITE_BUFFER_SIZE)
         f.write(initial_chunk)
-        f.flush()
 
         self._current_file = f
         self._current_filepath = path
@@ -59,7 +65,11 @@ class BinaryBlobWriter:
             return
 
         self._current_file.write(chunk)
-        self._current_file.flush()
+
+    def flush(self) -> None:
+        """Write buffered chunks of the open blob to disk."""
+        if self._current_file is not None:
+            self._current_file.flush()
 
     def finish_blob(self) -> str | None:
         """Finish current blob and close file. Returns path or None."""
@@ -9,6 +9,11 @@ from adcp_recorder.export.parquet_writer import ParquetWriter
 
 logger = logging.getLogger(__name__)
 
+# Prefixes with their own {prefix}_error_{date}.nmea file; anything else goes to ERROR_{date}.nmea
+_KNOWN_ERROR_PREFIXES = frozenset(
+    ("PNORI", "PNORS", "PNORC", "PNORH", "PNORW", "PNORB", "PNORE", "PNORF", "PNORWD", "PNORA")
+)
+
 
 class FileWriter:
     """Writes NMEA sentences to files and structured records to Parquet.
@@ -28,6 +33,7 @@ class FileWriter:
         self._files: dict[str, TextIO] = {}
         self._current_date = datetime.now().date()
         self._closed = False
+        self._created_dirs: set[str] = set()
         self._ensure_base_path()
         self.parquet_writer = ParquetWriter(base_path)
 
@@ -35,6 +41,12 @@ class FileWriter:
         """Ensure base directory exists."""
         os.makedirs(self.base_path, exist_ok=True)
 
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory once; later calls for the same path skip the filesystem."""
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
     def _get_filename(self, prefix: str) -> str:
         """Get filename for a message type and current date."""
 
@@ -43,7 +55,7 @@ class FileWriter:
 
         # Ensure directory exists
         file_dir = os.path.join(self.base_path, "nmea", prefix)
-        os.makedirs(file_dir, exist_ok=True)
+        self._ensure_dir(file_dir)
 
         return os.path.join(file_dir, f"{prefix}_{date_str}.nmea")
 
@@ -124,26 +136,14 @@ class FileWriter:
         if self._closed or not prefix or not data:
             return
 
+        error_dir = os.path.join(self.base_path, "errors", "nmea")
         try:
             date_str = self._current_date.strftime("%d%m%y")
-            error_dir = os.path.join(self.base_path, "errors", "nmea")
-            os.makedirs(error_dir, exist_ok=True)
+            self._ensure_dir(error_dir)
 
             # Consolidate BINARY and unknown prefixes into ERROR_{date}.nmea
             # Known prefixes (PNORI, PNORS, etc.) use {prefix}_error_{date}.nmea
-            known_prefixes = {
-                "PNORI",
-                "PNORS",
-                "PNORC",
-                "PNORH",
-                "PNORW",
-                "PNORB",
-                "PNORE",
-                "PNORF",
-                "PNORWD",
-                "PNORA",
-            }
-            if prefix == "BINARY" or prefix not in known_prefixes:
+            if prefix not in _KNOWN_ERROR_PREFIXES:
                 filename = os.path.join(error_dir, f"ERROR_{date_str}.nmea")
             else:
                 filename = os.path.join(error_dir, f"{prefix}_error_{date_str}.nmea")
@@ -157,6 +157,8 @@ class FileWriter:
                     f.write("\n")
                 f.flush()
         except Exception as e:
+            # The directory may have been removed underneath us; recreate it next time
+            self._created_dirs.discard(error_dir)
             logger.error(f"Failed to write invalid record for {prefix}: {e}")
 
     def write_error(self, message: str) -> None:
@@ -6,6 +6,8 @@ Implements parser for:
 
 from dataclasses import dataclass, field
 
+from adcp_recorder.core.nmea import split_sentence
+
 from .utils import (
     validate_date_yy_mm_dd,
     validate_hex_string,
@@ -41,13 +43,7 @@ class PNORA:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORA":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if fields[0] != "$PNORA":
             raise ValueError(f"Invalid prefix: {fields[0]}")
 
@@ -11,6 +11,8 @@ Implements parsers for:
 from dataclasses import dataclass, field
 from typing import Any
 
+from adcp_recorder.core.nmea import split_sentence
+
 from .utils import (
     parse_tagged_field,
     validate_date_mm_dd_yy,
@@ -44,6 +46,33 @@ def _validate_distance(value: float) -> None:
     validate_range(value, "Distance", 0.0, 1000.0)
 
 
+def _cell_values_in_range(msg: Any) -> bool:
+    """Return True if the velocity, amplitude and correlation fields are all in range.
+
+    Each ``__post_init__`` ANDs its own field checks with this one combined test
+    on the happy path, which needs only plain chained comparisons and no
+    error-message formatting. Only when it fails do callers run the per-field
+    validators, to report which field was out of range.
+    """
+    return (
+        -100.0 <= msg.vel1 <= 100.0
+        and -100.0 <= msg.vel2 <= 100.0
+        and -100.0 <= msg.vel3 <= 100.0
+        and -100.0 <= msg.vel4 <= 100.0
+        and 0.0 <= msg.amp1 <= 255.0
+        and 0.0 <= msg.amp2 <= 255.0
+        and 0.0 <= msg.amp3 <= 255.0
+        and 0.0 <= msg.amp4 <= 255.0
+        and 0 <= msg.corr1 <= 100
+        and 0 <= msg.corr2 <= 100
+        and 0 <= msg.corr3 <= 100
+        and 0 <= msg.corr4 <= 100
+    )
+
+
+_VALID_AMP_UNITS = frozenset(("C", "D"))
+
+
 @dataclass(frozen=True)
 class PNORC:
     """PNORC base current velocity message (DF=100).
@@ -74,12 +103,22 @@ class PNORC:
     def __post_init__(self):
         validate_date_mm_dd_yy(self.date)
         validate_time_string(self.time)
+        if (
+            1 <= self.cell_index <= 1000
+            and 0.0 <= self.speed <= 100.0
+            and 0.0 <= self.direction <= 360.0
+            and _cell_values_in_range(self)
+        ):
+            if self.amp_unit not in _VALID_AMP_UNITS:
+                raise ValueError(f"Invalid amplitude unit: {self.amp_unit}")
+            return
+
         _validate_cell_index(self.cell_index)
         for i, v in enumerate([self.vel1, self.vel2, self.vel3, self.vel4], 1):
             _validate_velocity(v, i)
         validate_range(self.speed, "Speed", 0.0, 100.0)
         validate_range(self.direction, "Direction", 0.0, 360.0)
-        if self.amp_unit not in {"C", "D"}:
+        if self.amp_unit not in _VALID_AMP_UNITS:
             raise ValueError(f"Invalid amplitude unit: {self.amp_unit}")
         for i, a in enumerate([self.amp1, self.amp2, self.amp3, self.amp4], 1):
             _validate_amplitude(float(a), i)
@@ -88,13 +127,7 @@ class PNORC:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORC":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) != 19:
             raise ValueError(f"Expected 19 fields for PNORC, got {len(fields)}")
         if fields[0] != "$PNORC":
@@ -175,6 +208,13 @@ class PNORC1:
     def __post_init__(self):
         validate_date_mm_dd_yy(self.date)
         validate_time_string(self.time)
+        if (
+            1 <= self.cell_index <= 1000
+            and 0.0 <= self.distance <= 1000.0
+            and _cell_values_in_range(self)
+        ):
+            return
+
         _validate_cell_index(self.cell_index)
         _validate_distance(self.distance)
         for i, v in enumerate([self.vel1, self.vel2, self.vel3, self.vel4], 1):
@@ -186,13 +226,7 @@ class PNORC1:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORC1":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) != 17:
             raise ValueError(f"Expected 17 fields for PNORC1, got {len(fields)}")
         if fields[0] != "$PNORC1":
@@ -288,6 +322,13 @@ class PNORC2:
     def __post_init__(self):
         validate_date_mm_dd_yy(self.date)
         validate_time_string(self.time)
+        if (
+            1 <= self.cell_index <= 1000
+            and 0.0 <= self.distance <= 1000.0
+            and _cell_values_in_range(self)
+        ):
+            return
+
         _validate_cell_index(self.cell_index)
         _validate_distance(self.distance)
         for i, v in enumerate([self.vel1, self.vel2, self.vel3, self.vel4], 1):
@@ -299,13 +340,7 @@ class PNORC2:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORC2":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if fields[0] != "$PNORC2":
             raise ValueError(f"Invalid prefix: {fields[0]}")
 
@@ -411,13 +446,7 @@ class PNORC3:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORC3":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if fields[0] != "$PNORC3":
             raise ValueError(f"Invalid prefix: {fields[0]}")
 
@@ -472,13 +501,7 @@ class PNORC4:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORC4":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) != 6:
             raise ValueError(f"Expected 6 fields for PNORC4, got {len(fields)}")
         if fields[0] != "$PNORC4":
@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass, field
 
+from adcp_recorder.core.nmea import split_sentence
+
 from .utils import (
     parse_optional_float,
     validate_date_mm_dd_yy,
@@ -42,13 +44,7 @@ class PNORE:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORE":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) < 8:
             raise ValueError(f"Expected at least 8 fields for PNORE, got {len(fields)}")
         if fields[0] != "$PNORE":
@@ -8,6 +8,8 @@ Implements parsers for:
 from dataclasses import dataclass, field
 from typing import Any
 
+from adcp_recorder.core.nmea import split_sentence
+
 from .utils import (
     parse_tagged_field,
     validate_date_yy_mm_dd,
@@ -56,13 +58,7 @@ class PNORH3:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORH3":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if fields[0] != "$PNORH3":
             raise ValueError(f"Invalid prefix: {fields[0]}")
 
@@ -114,13 +110,7 @@ class PNORH4:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORH4":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) != 5:
             raise ValueError(f"Expected 5 fields for PNORH4, got {len(fields)}")
         if fields[0] != "$PNORH4":
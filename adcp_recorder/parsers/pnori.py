@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
 from adcp_recorder.core.enums import CoordinateSystem, InstrumentType
-from adcp_recorder.core.nmea import compute_checksum
+from adcp_recorder.core.nmea import compute_checksum, split_sentence
 
 
 # Shared validation functions
@@ -104,17 +104,7 @@ class PNORI:
             ValueError: If sentence format is invalid or fields fail validation
 
         """
-        sentence = sentence.strip()
-
-        # Extract checksum if present
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-        else:
-            data_part, checksum = sentence, None
-
-        # Split fields
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
 
         if len(fields) != 8:
             raise ValueError(f"Expected 8 fields, got {len(fields)}")
@@ -228,17 +218,7 @@ class PNORI1:
             ValueError: If sentence format is invalid or fields fail validation
 
         """
-        sentence = sentence.strip()
-
-        # Extract checksum if present
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-        else:
-            data_part, checksum = sentence, None
-
-        # Split fields
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
 
         if len(fields) != 8:
             raise ValueError(f"Expected 8 fields, got {len(fields)}")
@@ -395,17 +375,7 @@ class PNORI2:
             ValueError: If sentence format is invalid or fields fail validation
 
         """
-        sentence = sentence.strip()
-
-        # Extract checksum if present
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-        else:
-            data_part, checksum = sentence, None
-
-        # Split fields
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
 
         if len(fields) < 8:
             raise ValueError(f"Expected at least 8 fields, got {len(fields)}")
@@ -10,6 +10,8 @@ Implements parsers for:
 
 from dataclasses import dataclass, field
 
+from adcp_recorder.core.nmea import split_sentence
+
 from .utils import (
     parse_tagged_field,
     validate_date_mm_dd_yy,
@@ -89,13 +91,7 @@ class PNORS:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORS":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) != 14:
             raise ValueError(f"Expected 14 fields for PNORS, got {len(fields)}")
         if fields[0] != "$PNORS":
@@ -177,13 +173,7 @@ class PNORS1:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORS1":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) != 16:
             raise ValueError(f"Expected 16 fields for PNORS1, got {len(fields)}")
         if fields[0] != "$PNORS1":
@@ -287,13 +277,7 @@ class PNORS2:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORS2":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if fields[0] != "$PNORS2":
             raise ValueError(f"Invalid prefix: {fields[0]}")
 
@@ -386,13 +370,7 @@ class PNORS3:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORS3":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if fields[0] != "$PNORS3":
             raise ValueError(f"Invalid prefix: {fields[0]}")
 
@@ -449,13 +427,7 @@ class PNORS4:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORS4":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) != 8:
             raise ValueError(f"Expected 8 fields for PNORS4, got {len(fields)}")
         if fields[0] != "$PNORS4":
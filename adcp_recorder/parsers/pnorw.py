@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass, field
 
+from adcp_recorder.core.nmea import split_sentence
+
 from .utils import (
     parse_optional_float,
     validate_date_mm_dd_yy,
@@ -55,13 +57,7 @@ class PNORW:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORW":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) != 22:
             raise ValueError(f"Expected 22 fields for PNORW, got {len(fields)}")
         if fields[0] != "$PNORW":
@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass, field
 
+from adcp_recorder.core.nmea import split_sentence
+
 from .utils import (
     parse_optional_float,
     validate_date_mm_dd_yy,
@@ -9,6 +11,9 @@ from .utils import (
     validate_time_string,
 )
 
+_VALID_DIRECTION_TYPES = frozenset(("MD", "DS"))
+_VALID_SPECTRUM_BASES = frozenset((0, 1, 3))
+
 
 @dataclass(frozen=True)
 class PNORWD:
@@ -29,13 +34,19 @@ class PNORWD:
     def __post_init__(self):
         validate_date_mm_dd_yy(self.date)
         validate_time_string(self.time)
-        if self.direction_type not in ("MD", "DS"):
+        if self.direction_type not in _VALID_DIRECTION_TYPES:
             raise ValueError(f"Invalid direction type: {self.direction_type}")
-        if self.spectrum_basis not in {0, 1, 3}:
+        if self.spectrum_basis not in _VALID_SPECTRUM_BASES:
             raise ValueError(f"Invalid spectrum basis: {self.spectrum_basis}")
-        validate_range(self.start_frequency, "Start frequency", 0.0, 10.0)
-        validate_range(self.step_frequency, "Step frequency", 0.0, 10.0)
-        validate_range(self.num_frequencies, "Number of frequencies", 1, 999)
+        # The three ranges are tested together; validate_range only runs to name the failure
+        if not (
+            0.0 <= self.start_frequency <= 10.0
+            and 0.0 <= self.step_frequency <= 10.0
+            and 1 <= self.num_frequencies <= 999
+        ):
+            validate_range(self.start_frequency, "Start frequency", 0.0, 10.0)
+            validate_range(self.step_frequency, "Step frequency", 0.0, 10.0)
+            validate_range(self.num_frequencies, "Number of frequencies", 1, 999)
 
         if len(self.values) != self.num_frequencies:
             raise ValueError(
@@ -44,19 +55,14 @@ class PNORWD:
 
     @classmethod
     def from_nmea(cls, sentence: str) -> "PNORWD":
-        sentence = sentence.strip()
-        data_part, checksum = sentence, None
-        if "*" in sentence:
-            data_part, checksum = sentence.rsplit("*", 1)
-            checksum = checksum.strip().upper()
-
-        fields = [f.strip() for f in data_part.split(",")]
+        fields, checksum = split_sentence(sentence)
         if len(fields) < 9:
             raise ValueError(f"Expected at least 9 fields for PNORWD, got {len(fields)}")
         if fields[0] != "$PNORWD":
             raise ValueError(f"Invalid prefix: {fields[0]}")
 
         num_freq = int(fields[7])
+
         if len(fields) < 8 + num_freq:
             raise ValueError(f"Missing value: expected {num_freq}, got {len(fields) - 8}")
 
@@ -1,36 +1,47 @@
 """Common utilities and validation for NMEA parsers."""
 
+import functools
 import re
 from datetime import datetime
 
+_SIX_DIGITS = re.compile(r"^\d{6}$")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_datetime(value: str, fmt: str) -> bool:
+    """Return True if ``value`` parses with ``fmt``.
+
+    Every cell of an ensemble repeats the same date and time, so caching the
+    result avoids running ``strptime`` once per sentence.
+    """
+    try:
+        datetime.strptime(value, fmt)
+    except ValueError:
+        return False
+    return True
+
 
 def validate_date_mm_dd_yy(date_str: str) -> None:
     """Validate MMDDYY date string."""
-    if not re.match(r"^\d{6}$", date_str):
+    if not _SIX_DIGITS.match(date_str):
         raise ValueError(f"Invalid date format (MMDDYY): {date_str}")
-    try:
-        datetime.strptime(date_str, "%m%d%y")
-    except ValueError:
+    if not _is_valid_datetime(date_str, "%m%d%y"):
         raise ValueError(f"Invalid date: {date_str}")
 
 
 def validate_date_yy_mm_dd(date_str: str) -> None:
     """Validate YYMMDD date string."""
-    if not re.match(r"^\d{6}$", date_str):
+    if not _SIX_DIGITS.match(date_str):
         raise ValueError(f"Invalid date format (YYMMDD): {date_str}")
-    try:
-        datetime.strptime(date_str, "%y%m%d")
-    except ValueError:
+    if not _is_valid_datetime(date_str, "%y%m%d"):
         raise ValueError(f"Invalid date: {date_str}")
 
 
 def validate_time_string(time_str: str) -> None:
     """Validate HHMMSS time string."""
-    if not re.match(r"^\d{6}$", time_str):
+    if not _SIX_DIGITS.match(time_str):
         raise ValueError(f"Invalid time format (HHMMSS): {time_str}")
-    try:
-        datetime.strptime(time_str, "%H%M%S")
-    except ValueError:
+    if not _is_valid_datetime(time_str, "%H%M%S"):
         raise ValueError(f"Invalid time: {time_str}")
 
 
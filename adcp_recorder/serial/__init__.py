@@ -9,13 +9,16 @@ from adcp_recorder.serial.port_manager import (
     SerialConnectionManager,
     list_serial_ports,
 )
-from adcp_recorder.serial.producer import SerialProducer
+from adcp_recorder.serial.producer import SerialMultiplexProducer, SerialProducer
+from adcp_recorder.serial.ring_buffer import RingBufferQueue
 
 __all__ = [
     "PortInfo",
     "SerialConnectionManager",
     "list_serial_ports",
     "SerialProducer",
+    "SerialMultiplexProducer",
     "SerialConsumer",
     "MessageRouter",
+    "RingBufferQueue",
 ]
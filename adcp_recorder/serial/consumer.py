@@ -8,33 +8,55 @@ import contextlib
 import logging
 import threading
 import time
+from collections.abc import Callable
 from queue import Empty, Queue
 from typing import Any, Protocol, runtime_checkable
 
-import duckdb
-
 from adcp_recorder.core.nmea import extract_prefix, is_binary_data
 from adcp_recorder.db import (
+    BatchedWriter,
     DatabaseManager,
-    insert_header_data,
-    insert_parse_error,
-    insert_pnora_data,
-    insert_pnorb_data,
-    insert_pnore_data,
-    insert_pnorf_data,
-    insert_pnori_configuration,
-    insert_pnorw_data,
-    insert_pnorwd_data,
-    insert_raw_line,
-    insert_sensor_data,
-    insert_velocity_data,
+    build_header_insert,
+    build_parse_error_insert,
+    build_pnora_insert,
+    build_pnorb_insert,
+    build_pnore_insert,
+    build_pnorf_insert,
+    build_pnori_insert,
+    build_pnorw_insert,
+    build_pnorwd_insert,
+    build_raw_line_insert,
+    build_sensor_insert,
+    build_velocity_insert,
 )
 from adcp_recorder.export.binary_writer import BinaryBlobWriter
 from adcp_recorder.export.file_writer import FileWriter
 from adcp_recorder.serial.binary_chunk import BinaryChunk
+from adcp_recorder.serial.ring_buffer import RingBufferQueue
 
 logger = logging.getLogger(__name__)
 
+# Prefix -> (sentence, data) -> (sql, params); built once so storing is a single lookup
+_INSERT_BUILDERS: dict[str, Callable[[str, dict], tuple[str, tuple[Any, ...]]]] = {
+    **dict.fromkeys(("PNORI", "PNORI1", "PNORI2"), build_pnori_insert),
+    **dict.fromkeys(("PNORS", "PNORS1", "PNORS2", "PNORS3", "PNORS4"), build_sensor_insert),
+    **dict.fromkeys(("PNORC", "PNORC1", "PNORC2", "PNORC3", "PNORC4"), build_velocity_insert),
+    **dict.fromkeys(("PNORH3", "PNORH4"), build_header_insert),
+    "PNORW": build_pnorw_insert,
+    "PNORB": build_pnorb_insert,
+    "PNORE": build_pnore_insert,
+    "PNORF": build_pnorf_insert,
+    "PNORWD": build_pnorwd_insert,
+    "PNORA": build_pnora_insert,
+}
+
+# Max items pulled from the queue per wakeup; the rest are taken with get_nowait()
+_DRAIN_BATCH_SIZE = 256
+
+# Line processing errors logged (with traceback) per window; the rest are only counted
+_ERROR_LOG_BURST = 10
+_ERROR_LOG_WINDOW = 1.0
+
 
 @runtime_checkable
 class NMEAParser(Protocol):
@@ -74,13 +96,14 @@ class MessageRouter:
 
         """
         self._parsers[prefix.upper()] = parser_class
-        logger.debug(f"Registered parser for {prefix}")
+        logger.debug("Registered parser for %s", prefix)
 
-    def route(self, sentence: str) -> Any | None:
+    def route(self, sentence: str, prefix: str | None = None) -> Any | None:
         """Route sentence to appropriate parser.
 
         Args:
             sentence: NMEA sentence string
+            prefix: Uppercase prefix already extracted by the caller, if any
 
         Returns:
             Parsed message object or None if parser not found
@@ -89,15 +112,13 @@ class MessageRouter:
             ValueError: If parsing fails
 
         """
-        prefix = extract_prefix(sentence)
         if prefix is None:
-            return None
+            prefix = extract_prefix(sentence)
 
-        prefix = prefix.upper()
-        if prefix not in self._parsers:
+        parser_class = self._parsers.get(prefix)
+        if parser_class is None:
             return None
 
-        parser_class = self._parsers[prefix]
         return parser_class.from_nmea(sentence)
 
 
@@ -115,7 +136,7 @@ class SerialConsumer:
 
     Example:
         >>> from adcp_recorder.parsers import PNORI
-        >>> queue = Queue(maxsize=1000)
+        >>> queue = RingBufferQueue(maxsize=1000)
         >>> db = DatabaseManager(':memory:')
         >>> router = MessageRouter()
         >>> router.register_parser('PNORI', PNORI)
@@ -128,11 +149,13 @@ class SerialConsumer:
 
     def __init__(
         self,
-        queue: Queue,
+        queue: Queue | RingBufferQueue,
         db_manager: DatabaseManager,
         router: MessageRouter,
         heartbeat_interval: float = 5.0,
         file_writer: FileWriter | None = None,
+        batch_size: int = 1000,
+        flush_interval: float = 0.5,
     ):
         """Initialize serial consumer.
 
@@ -141,6 +164,9 @@ class SerialConsumer:
             db_manager: Database manager
             router: Message router
             heartbeat_interval: Seconds between heartbeat updates
+            file_writer: Optional writer for per-type text and Parquet output
+            batch_size: Buffered rows that trigger a database flush
+            flush_interval: Max seconds a row stays buffered while data keeps arriving
 
         """
         self._queue = queue
@@ -148,6 +174,8 @@ class SerialConsumer:
         self._router = router
         self._heartbeat_interval = heartbeat_interval
         self._file_writer = file_writer
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
         if file_writer and isinstance(file_writer.base_path, str):
             bp = file_writer.base_path
         else:
@@ -156,7 +184,11 @@ class SerialConsumer:
 
         self._running = False
         self._thread: threading.Thread | None = None
-        self._last_heartbeat = time.time()
+        self._last_heartbeat = time.monotonic()
+
+        self._error_window_start = 0.0
+        self._errors_in_window = 0
+        self._suppressed_errors = 0
 
     @property
     def is_running(self) -> bool:
@@ -165,7 +197,7 @@ class SerialConsumer:
 
     @property
     def last_heartbeat(self) -> float:
-        """Get timestamp of last heartbeat update."""
+        """Get ``time.monotonic()`` timestamp of last heartbeat update."""
         return self._last_heartbeat
 
     def start(self) -> None:
@@ -192,21 +224,23 @@ class SerialConsumer:
         logger.info("Serial consumer stopped")
 
     def _update_heartbeat(self) -> None:
-        """Update heartbeat timestamp."""
-        self._last_heartbeat = time.time()
+        """Update heartbeat timestamp (called once per drained batch)."""
+        self._last_heartbeat = time.monotonic()
 
     def _consume_loop(self) -> None:
         """Main consume loop (runs in thread)."""
         logger.info("Consumer loop starting")
         conn = self._db_manager.get_connection()
+        writer = BatchedWriter(conn, self._batch_size, self._flush_interval)
 
         try:
             while True:
                 try:
                     # Pull from queue - use short timeout if stopping to drain quickly
                     limit = 1.0 if self._running else 0.1
-                    item = self._queue.get(timeout=limit)
+                    batch = [self._queue.get(timeout=limit)]
                 except Empty:
+                    self._flush(writer)
                     # Queue empty - if we are stopping, we are done
                     if not self._running:
                         logger.debug("Queue empty and stopping, exiting loop")
@@ -215,106 +249,166 @@ class SerialConsumer:
                 except Exception as e:
                     logger.error(f"Unexpected error getting from queue: {e}", exc_info=True)
                     continue
-                # Binary chunk streaming handling
+
+                # Drain whatever else is already queued without blocking again
                 try:
-                    if isinstance(item, BinaryChunk):
-                        # Start of blob
-                        if item.start:
-                            # record parse error/marker once at blob start
-                            insert_parse_error(
-                                conn,
-                                "<BINARY_BLOB>",
-                                error_type="BINARY_DATA",
-                                error_message="Binary blob captured",
-                            )
-                            insert_raw_line(
-                                conn,
-                                "<BINARY_BLOB>",
-                                parse_status="FAIL",
-                                error_message="Binary blob captured",
-                            )
-                            # start file
-                            self._binary_writer.start_blob(item.data)
-                            if self._file_writer:
-                                self._file_writer.write_invalid_record(
-                                    "BINARY", item.data.decode("ascii", errors="replace")
-                                )
-                        elif item.end:
-                            path = self._binary_writer.finish_blob()
-                            logger.info(f"Binary blob saved to {path}")
-                        else:
-                            # middle chunk
-                            self._binary_writer.append_chunk(item.data)
-
-                        self._update_heartbeat()
-                        continue
-
-                    # Otherwise it's a normal line (bytes)
-                    line_bytes = item
-
-                    # Process line
-                    try:
-                        self._process_line(conn, line_bytes)
-                    except Exception as e:
-                        logger.error(f"Error processing line: {e}", exc_info=True)
-                        # Try to keep going
+                    for _ in range(_DRAIN_BATCH_SIZE - 1):
+                        batch.append(self._queue.get_nowait())
+                except Empty:
+                    pass
                 except Exception as e:
-                    logger.error(f"Consumer loop processing error: {e}", exc_info=True)
+                    logger.error(f"Unexpected error draining queue: {e}", exc_info=True)
+
+                for item in batch:
+                    self._handle_item(writer, item)
+
+                try:
+                    # One write for all binary chunks in the batch
+                    self._binary_writer.flush()
+                except Exception as e:
+                    logger.error(f"Binary blob write failed: {e}")
 
                 try:
                     self._update_heartbeat()
                 except Exception as e:
                     logger.error(f"Heartbeat update failed: {e}")
+
+                # Write out as soon as the queue drains; batch while it is busy
+                if self._queue.empty():
+                    self._flush(writer)
+                else:
+                    writer.flush_if_due()
         finally:
+            self._flush(writer)
             with contextlib.suppress(Exception):
                 self._binary_writer.finish_blob()
             self._db_manager.close()
             logger.info("Consumer loop exiting")
 
-    def _process_line(self, conn: duckdb.DuckDBPyConnection, line_bytes: bytes) -> None:
+    def _handle_item(self, writer: BatchedWriter, item: bytes | BinaryChunk) -> None:
+        """Process one queued item, logging instead of raising.
+
+        Args:
+            writer: Batched writer for database rows
+            item: Line bytes or a binary blob chunk
+
+        """
+        # Binary chunk streaming handling
+        try:
+            if isinstance(item, BinaryChunk):
+                # Start of blob
+                if item.start:
+                    # record parse error/marker once at blob start
+                    writer.append(
+                        *build_parse_error_insert(
+                            "<BINARY_BLOB>",
+                            error_type="BINARY_DATA",
+                            error_message="Binary blob captured",
+                        )
+                    )
+                    writer.append(
+                        *build_raw_line_insert(
+                            "<BINARY_BLOB>",
+                            parse_status="FAIL",
+                            error_message="Binary blob captured",
+                        )
+                    )
+                    # start file
+                    self._binary_writer.start_blob(item.data)
+                    if self._file_writer:
+                        self._file_writer.write_invalid_record(
+                            "BINARY", item.data.decode("ascii", errors="replace")
+                        )
+                elif item.end:
+                    path = self._binary_writer.finish_blob()
+                    logger.info(f"Binary blob saved to {path}")
+                else:
+                    # middle chunk
+                    self._binary_writer.append_chunk(item.data)
+                return
+
+            # Otherwise it's a normal line (bytes)
+            line_bytes = item
+
+            # Process line
+            try:
+                self._process_line(writer, line_bytes)
+            except Exception as e:
+                self._log_line_error(e)
+                # Try to keep going
+        except Exception as e:
+            logger.error(f"Consumer loop processing error: {e}", exc_info=True)
+
+    def _log_line_error(self, error: Exception) -> None:
+        """Log a line processing error, throttled so a burst of garbage cannot stall the loop."""
+        now = time.monotonic()
+        if now - self._error_window_start >= _ERROR_LOG_WINDOW:
+            if self._suppressed_errors:
+                logger.error(
+                    "Suppressed %d further line processing errors", self._suppressed_errors
+                )
+            self._error_window_start = now
+            self._errors_in_window = 0
+            self._suppressed_errors = 0
+
+        if self._errors_in_window < _ERROR_LOG_BURST:
+            self._errors_in_window += 1
+            logger.error("Error processing line: %s", error, exc_info=True)
+        else:
+            self._suppressed_errors += 1
+
+    def _flush(self, writer: BatchedWriter) -> None:
+        """Flush buffered database rows, logging instead of raising."""
+        try:
+            writer.flush()
+        except Exception as e:
+            logger.error(f"Database flush failed: {e}", exc_info=True)
+
+    def _process_line(self, writer: BatchedWriter, line_bytes: bytes) -> None:
         """Process a single line from the queue.
 
         Args:
-            conn: Database connection
+            writer: Batched writer for database rows
             line_bytes: Line data as bytes
 
         """
         # Check for binary data
         if is_binary_data(line_bytes):
             logger.warning("Binary data in queue, logging to errors")
-            insert_parse_error(
-                conn,
-                line_bytes.decode("ascii", errors="replace"),
-                error_type="BINARY_DATA",
-                error_message="Binary data detected",
+            decoded = line_bytes.decode("ascii", errors="replace")
+            writer.append(
+                *build_parse_error_insert(
+                    decoded,
+                    error_type="BINARY_DATA",
+                    error_message="Binary data detected",
+                )
             )
-            insert_raw_line(
-                conn,
-                line_bytes.decode("ascii", errors="replace"),
-                parse_status="FAIL",
-                error_message="Binary data",
+            writer.append(
+                *build_raw_line_insert(
+                    decoded,
+                    parse_status="FAIL",
+                    error_message="Binary data",
+                )
             )
             if self._file_writer:
-                self._file_writer.write_invalid_record(
-                    "BINARY", line_bytes.decode("ascii", errors="replace")
-                )
+                self._file_writer.write_invalid_record("BINARY", decoded)
             return
 
         # Decode to string
         try:
             sentence = line_bytes.decode("ascii").strip()
         except UnicodeDecodeError as e:
-            logger.error(f"Failed to decode line: {e}")
-            insert_parse_error(
-                conn,
-                line_bytes.decode("ascii", errors="replace"),
-                error_type="DECODE_ERROR",
-                error_message=str(e),
+            logger.error("Failed to decode line: %s", e)
+            decoded = line_bytes.decode("ascii", errors="replace")
+            writer.append(
+                *build_parse_error_insert(
+                    decoded,
+                    error_type="DECODE_ERROR",
+                    error_message=str(e),
+                )
             )
             if self._file_writer:
-                self._file_writer.write_error(
-                    f"Decode error: {line_bytes.decode('ascii', errors='replace')} - {e}"
-                )
+                self._file_writer.write_error(f"Decode error: {decoded} - {e}")
             return
 
         if not sentence:
@@ -326,33 +420,36 @@ class SerialConsumer:
             # Extract prefix
             prefix = extract_prefix(sentence)
 
-            parsed = self._router.route(sentence)
+            parsed = self._router.route(sentence, prefix)
 
             if parsed is None:
                 # Unknown message type
-                logger.debug(f"Unknown message type: {prefix}")
-                insert_raw_line(
-                    conn,
-                    sentence,
-                    parse_status="PENDING",
-                    record_type=prefix,
-                    checksum_valid=None,
-                    error_message=f"No parser for {prefix}",
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Unknown message type: %s", prefix)
+                writer.append(
+                    *build_raw_line_insert(
+                        sentence,
+                        parse_status="PENDING",
+                        record_type=prefix,
+                        checksum_valid=None,
+                        error_message=f"No parser for {prefix}",
+                    )
                 )
                 if self._file_writer:
                     self._file_writer.write(prefix, sentence)
                 return
 
             # Successfully parsed - insert to database
-            self._store_parsed_message(conn, sentence, prefix, parsed)
+            self._store_parsed_message(writer, sentence, prefix, parsed)
 
             # Also insert to raw_lines
-            insert_raw_line(
-                conn,
-                sentence,
-                parse_status="OK",
-                record_type=prefix,
-                checksum_valid=True,
+            writer.append(
+                *build_raw_line_insert(
+                    sentence,
+                    parse_status="OK",
+                    record_type=prefix,
+                    checksum_valid=True,
+                )
             )
 
             if self._file_writer:
@@ -360,27 +457,29 @@ class SerialConsumer:
 
         except ValueError as e:
             # Parse failed
-            logger.warning(f"Parse failed for {prefix}: {e}")
-            insert_parse_error(
-                conn,
-                sentence,
-                error_type="PARSE_ERROR",
-                error_message=str(e),
-                attempted_prefix=prefix,
+            logger.warning("Parse failed for %s: %s", prefix, e)
+            writer.append(
+                *build_parse_error_insert(
+                    sentence,
+                    error_type="PARSE_ERROR",
+                    error_message=str(e),
+                    attempted_prefix=prefix,
+                )
             )
-            insert_raw_line(
-                conn,
-                sentence,
-                parse_status="FAIL",
-                record_type=prefix,
-                error_message=str(e),
+            writer.append(
+                *build_raw_line_insert(
+                    sentence,
+                    parse_status="FAIL",
+                    record_type=prefix,
+                    error_message=str(e),
+                )
             )
 
             if self._file_writer:
                 self._file_writer.write_invalid_record(prefix, sentence)
 
     def _store_parsed_message(
-        self, conn: duckdb.DuckDBPyConnection, sentence: str, prefix: str, parsed: Any
+        self, writer: BatchedWriter, sentence: str, prefix: str, parsed: Any
     ) -> None:
         """Store parsed message to appropriate table and export to Parquet."""
         data = parsed.to_dict()
@@ -389,25 +488,8 @@ class SerialConsumer:
         if self._file_writer:
             self._file_writer.write_record(prefix, data)
 
-        if prefix in ("PNORI", "PNORI1", "PNORI2"):
-            insert_pnori_configuration(conn, data, sentence)
-        elif prefix in ("PNORS", "PNORS1", "PNORS2", "PNORS3", "PNORS4"):
-            insert_sensor_data(conn, sentence, data)
-        elif prefix in ("PNORC", "PNORC1", "PNORC2", "PNORC3", "PNORC4"):
-            insert_velocity_data(conn, sentence, data)
-        elif prefix in ("PNORH3", "PNORH4"):
-            insert_header_data(conn, sentence, data)
-        elif prefix == "PNORW":
-            insert_pnorw_data(conn, sentence, data)
-        elif prefix == "PNORB":
-            insert_pnorb_data(conn, sentence, data)
-        elif prefix == "PNORE":
-            insert_pnore_data(conn, sentence, data)
-        elif prefix == "PNORF":
-            insert_pnorf_data(conn, sentence, data)
-        elif prefix == "PNORWD":
-            insert_pnorwd_data(conn, sentence, data)
-        elif prefix == "PNORA":
-            insert_pnora_data(conn, sentence, data)
+        build = _INSERT_BUILDERS.get(prefix)
+        if build is not None:
+            writer.append(*build(sentence, data))
         else:
-            logger.warning(f"No database insert for {prefix}")
+            logger.warning("No database insert for %s", prefix)
@@ -6,12 +6,22 @@ Provides functionality for:
 - Reconnection logic with exponential backoff
 """
 
+import os
+import select
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 import serial
 import serial.tools.list_ports
 
+# Max bytes taken from the OS per read when reading the file descriptor directly
+_FD_READ_SIZE = 65536
+
+# Buffered bytes after which an unterminated line is handed back as-is, so a
+# binary burst without newlines cannot grow the receive buffer without bound
+_MAX_BUFFERED_LINE = 65536
+
 
 @dataclass(frozen=True)
 class PortInfo:
@@ -53,6 +63,36 @@ def list_serial_ports() -> list[PortInfo]:
     return ports
 
 
+def _native_fd(serial_conn: serial.Serial) -> int | None:
+    """Return the descriptor to read directly, or None to fall back to pyserial."""
+    if os.name != "posix":
+        return None
+    try:
+        fd = serial_conn.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    return fd if isinstance(fd, int) else None
+
+
+def _read_fd(fd: int, timeout: float | None) -> bytes:
+    """Wait up to timeout for the descriptor to be readable and read what is there.
+
+    Returns:
+        The bytes read, or b"" on timeout
+
+    Raises:
+        serial.SerialException: If the device hung up (readable but no data)
+
+    """
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if not ready:
+        return b""
+    data = os.read(fd, _FD_READ_SIZE)
+    if not data:
+        raise serial.SerialException("Device disconnected (read returned no data)")
+    return data
+
+
 class SerialConnectionManager:
     """Manages serial port connections with reconnection logic.
 
@@ -102,6 +142,10 @@ class SerialConnectionManager:
         self._parity = parity
         self._stopbits = stopbits
         self._serial: serial.Serial | None = None
+        # Bytes read from the port but not yet returned as a complete line
+        self._rxbuf = bytearray()
+        # OS file descriptor read directly on POSIX; None means go through pyserial
+        self._fd: int | None = None
 
     @property
     def port(self) -> str:
@@ -152,6 +196,7 @@ class SerialConnectionManager:
                 parity=self._parity,
                 stopbits=self._stopbits,
             )
+            self._fd = _native_fd(self._serial)
             return True
         except (serial.SerialException, OSError):
             self._serial = None
@@ -162,6 +207,17 @@ class SerialConnectionManager:
         if self._serial is not None and self._serial.is_open:
             self._serial.close()
         self._serial = None
+        self._fd = None
+        self._rxbuf.clear()
+
+    def fileno(self) -> int | None:
+        """Return the port's OS file descriptor, or None if reads go through pyserial.
+
+        The descriptor is only used on POSIX, after pyserial has configured
+        the port. It can be registered with ``select``/``selectors`` to wait
+        on several ports at once.
+        """
+        return self._fd
 
     def is_connected(self) -> bool:
         """Check if serial connection is open.
@@ -203,11 +259,20 @@ class SerialConnectionManager:
     def read_line(self, timeout: float | None = None) -> bytes | None:
         """Read a single line from the serial port.
 
+        ``Serial.readline()`` issues one ``read(1)`` per byte. Instead, whatever
+        the driver has buffered is read in one call and split here; lines
+        beyond the first stay buffered for the next call. On POSIX the file
+        descriptor is read directly with ``os.read`` after a ``select`` wait,
+        skipping pyserial's per-call overhead; elsewhere ``Serial.read`` is
+        given ``in_waiting`` bytes.
+
         Args:
             timeout: Optional timeout override (uses default if None)
 
         Returns:
-            Line as bytes (including line terminator) or None if timeout/error
+            Line as bytes (including line terminator) or None if timeout/error.
+            On timeout any buffered partial line is returned as-is, matching
+            ``readline()``.
 
         Example:
             >>> manager = SerialConnectionManager('/dev/ttyUSB0')
@@ -221,20 +286,111 @@ class SerialConnectionManager:
         if serial_conn is None or not serial_conn.is_open:
             return None
 
-        try:
-            # Temporarily override timeout if specified
-            if timeout is not None:
-                old_timeout = serial_conn.timeout
-                serial_conn.timeout = timeout
-
-            line = serial_conn.readline()
+        rxbuf = self._rxbuf
+        nl = rxbuf.find(b"\n")
+        if nl < 0:
+            fd = self._fd
+            try:
+                if fd is not None:
+                    wait = self._timeout if timeout is None else timeout
+                    while nl < 0 and len(rxbuf) < _MAX_BUFFERED_LINE:
+                        scanned = len(rxbuf)
+                        chunk = _read_fd(fd, wait)
+                        if not chunk:
+                            break
+                        rxbuf += chunk
+                        nl = rxbuf.find(b"\n", scanned)
+                else:
+                    # Temporarily override timeout if specified
+                    if timeout is not None:
+                        old_timeout = serial_conn.timeout
+                        serial_conn.timeout = timeout
+
+                    while nl < 0 and len(rxbuf) < _MAX_BUFFERED_LINE:
+                        scanned = len(rxbuf)
+                        chunk = serial_conn.read(serial_conn.in_waiting or 1)
+                        if not chunk:
+                            break
+                        rxbuf += chunk
+                        nl = rxbuf.find(b"\n", scanned)
+
+                    # Restore original timeout
+                    if timeout is not None:
+                        serial_conn.timeout = old_timeout
+
+            except (serial.SerialException, OSError):
+                self.disconnect()
+                return None
+
+            if nl < 0:
+                # Timed out or overlong; hand back the partial line like readline() does
+                line = bytes(rxbuf)
+                rxbuf.clear()
+                return line if line else None
+
+        line = bytes(rxbuf[: nl + 1])
+        del rxbuf[: nl + 1]
+        return line
+
+    def read_available(self) -> list[bytes]:
+        """Read what the port already has without waiting and return complete lines.
+
+        Meant for callers that have already seen the descriptor become
+        readable (see ``fileno``). A trailing partial line stays buffered until
+        its terminator arrives, unless it reaches ``_MAX_BUFFERED_LINE`` bytes,
+        in which case it is returned as-is like ``read_line`` does.
 
-            # Restore original timeout
-            if timeout is not None:
-                serial_conn.timeout = old_timeout
+        Returns:
+            Complete lines as bytes (including line terminators), possibly empty
 
-            return line if line else None
+        """
+        serial_conn = self._serial
+        if serial_conn is None or not serial_conn.is_open:
+            return []
 
+        try:
+            if self._fd is not None:
+                chunk = _read_fd(self._fd, 0)
+            else:
+                waiting = serial_conn.in_waiting
+                chunk = serial_conn.read(waiting) if waiting else b""
         except (serial.SerialException, OSError):
             self.disconnect()
-            return None
+            return []
+
+        rxbuf = self._rxbuf
+        rxbuf += chunk
+        lines: list[bytes] = []
+        end = rxbuf.rfind(b"\n")
+        if end >= 0:
+            complete = bytes(rxbuf[: end + 1])
+            del rxbuf[: end + 1]
+            # Split on "\n" only, as read_line does; a bare "\r" stays inside its line
+            lines = [line + b"\n" for line in complete.split(b"\n")[:-1]]
+
+        if len(rxbuf) >= _MAX_BUFFERED_LINE:
+            # Overlong unterminated data; hand it back as-is like read_line does
+            lines.append(bytes(rxbuf))
+            rxbuf.clear()
+        return lines
+
+    def read_lines(self, timeout: float | None = None) -> Iterator[bytes]:
+        """Yield every complete line available from one read burst.
+
+        Waits (up to timeout) for the first line like ``read_line`` and then
+        yields the further complete lines already buffered, without touching
+        the port again.
+
+        Args:
+            timeout: Optional timeout override for the first line
+
+        Yields:
+            Lines as bytes (including line terminator)
+
+        """
+        line = self.read_line(timeout)
+        while line is not None:
+            yield line
+            if b"\n" not in self._rxbuf:
+                return
+            line = self.read_line()
@@ -5,6 +5,7 @@ port and buffering lines to push to a FIFO queue for consumption by the parser.
 """
 
 import logging
+import selectors
 import threading
 import time
 from queue import Full, Queue
@@ -12,6 +13,7 @@ from queue import Full, Queue
 from adcp_recorder.core.nmea import is_binary_data
 from adcp_recorder.serial.binary_chunk import BinaryChunk
 from adcp_recorder.serial.port_manager import SerialConnectionManager
+from adcp_recorder.serial.ring_buffer import RingBufferQueue
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,7 @@ class SerialProducer:
 
     Example:
         >>> manager = SerialConnectionManager('/dev/ttyUSB0')
-        >>> queue = Queue(maxsize=1000)
+        >>> queue = RingBufferQueue(maxsize=1000)
         >>> producer = SerialProducer(manager, queue)
         >>> producer.start()
         >>> # ... later ...
@@ -42,7 +44,7 @@ class SerialProducer:
     def __init__(
         self,
         connection_manager: SerialConnectionManager,
-        queue: Queue,
+        queue: Queue | RingBufferQueue,
         heartbeat_interval: float = 5.0,
         max_line_length: int = 1024,
     ):
@@ -62,8 +64,8 @@ class SerialProducer:
 
         self._running = False
         self._thread: threading.Thread | None = None
-        self._last_heartbeat = time.time()
-        self._line_buffer = b""
+        self._last_heartbeat = time.monotonic()
+        self._hb_next = 0.0
         self._blob_mode = False
 
     @property
@@ -73,9 +75,14 @@ class SerialProducer:
 
     @property
     def last_heartbeat(self) -> float:
-        """Get timestamp of last heartbeat update."""
+        """Get ``time.monotonic()`` timestamp of last heartbeat update."""
         return self._last_heartbeat
 
+    @property
+    def connection_manager(self) -> SerialConnectionManager:
+        """Get the connection manager this producer reads from."""
+        return self._connection_manager
+
     def start(self) -> None:
         """Start the producer thread."""
         if self._running:
@@ -98,8 +105,11 @@ class SerialProducer:
         logger.info("Serial producer stopped")
 
     def _update_heartbeat(self) -> None:
-        """Update heartbeat timestamp."""
-        self._last_heartbeat = time.time()
+        """Update heartbeat timestamp at most every half heartbeat interval."""
+        now = time.monotonic()
+        if now >= self._hb_next:
+            self._last_heartbeat = now
+            self._hb_next = now + self._heartbeat_interval * 0.5
 
     def _read_loop(self) -> None:
         """Main read loop (runs in thread)."""
@@ -125,49 +135,60 @@ class SerialProducer:
                 # Empty line - continue
                 continue
 
-            # Check for binary data
-            if is_binary_data(line_bytes):
-                logger.warning(f"Binary data detected: {line_bytes[:50]!r}")
-                # Enter blob mode and stream binary chunks to the consumer
-                if not self._blob_mode:
-                    self._blob_mode = True
-                    chunk = BinaryChunk(data=line_bytes, start=True)
-                else:
-                    chunk = BinaryChunk(data=line_bytes)
+            self.handle_line(line_bytes)
 
-                self._push_to_queue(chunk)
-                self._update_heartbeat()
-                continue
+        logger.info("Producer read loop exiting")
 
-            # Decode and buffer
-            try:
-                line_str = line_bytes.decode("ascii").strip()
-            except UnicodeDecodeError:
-                logger.warning(f"Failed to decode ASCII: {line_bytes[:50]!r}")
-                # Treat as binary (enter blob mode)
-                if not self._blob_mode:
-                    self._blob_mode = True
-                    chunk = BinaryChunk(data=line_bytes, start=True)
-                else:
-                    chunk = BinaryChunk(data=line_bytes)
+    def handle_line(self, line_bytes: bytes) -> None:
+        """Classify one line read from the port and push it to the queue.
 
-                self._push_to_queue(chunk)
-                self._update_heartbeat()
-                continue
+        Called by the read loop, or by ``SerialMultiplexProducer`` for lines it
+        read on this producer's behalf.
 
-            # Push complete line
-            if line_str:
-                # If we were in blob mode but now have a printable line, mark blob end
-                if self._blob_mode:
-                    # push explicit end marker then the recovered line
-                    end_chunk = BinaryChunk(data=b"", end=True)
-                    self._push_to_queue(end_chunk)
-                    self._blob_mode = False
+        Args:
+            line_bytes: Line as read from the port (including terminator)
 
-                self._push_to_queue(line_str.encode("ascii"))
-                self._update_heartbeat()
+        """
+        # Check for binary data
+        if is_binary_data(line_bytes):
+            logger.warning("Binary data detected: %r", line_bytes[:50])
+            # Enter blob mode and stream binary chunks to the consumer
+            if not self._blob_mode:
+                self._blob_mode = True
+                chunk = BinaryChunk(data=line_bytes, start=True)
+            else:
+                chunk = BinaryChunk(data=line_bytes)
+
+            self._push_to_queue(chunk)
+            self._update_heartbeat()
+            return
 
-        logger.info("Producer read loop exiting")
+        # Non-ASCII lines cannot be NMEA; stay in bytes rather than decode/re-encode
+        if not line_bytes.isascii():
+            logger.warning("Failed to decode ASCII: %r", line_bytes[:50])
+            # Treat as binary (enter blob mode)
+            if not self._blob_mode:
+                self._blob_mode = True
+                chunk = BinaryChunk(data=line_bytes, start=True)
+            else:
+                chunk = BinaryChunk(data=line_bytes)
+
+            self._push_to_queue(chunk)
+            self._update_heartbeat()
+            return
+
+        # Push complete line
+        line = line_bytes.strip()
+        if line:
+            # If we were in blob mode but now have a printable line, mark blob end
+            if self._blob_mode:
+                # push explicit end marker then the recovered line
+                end_chunk = BinaryChunk(data=b"", end=True)
+                self._push_to_queue(end_chunk)
+                self._blob_mode = False
+
+            self._push_to_queue(line)
+            self._update_heartbeat()
 
     def _push_to_queue(self, data: bytes | BinaryChunk) -> None:
         """Push data to queue, dropping oldest if full.
@@ -176,6 +197,12 @@ class SerialProducer:
             data: Line data to push (as bytes or BinaryChunk)
 
         """
+        if isinstance(self._queue, RingBufferQueue):
+            # Bounded deque drops the oldest item itself, no get/put retry needed
+            if self._queue.put_overwrite(data):
+                logger.warning("Queue full, dropping oldest item")
+            return
+
         try:
             # Non-blocking put
             self._queue.put_nowait(data)
@@ -187,3 +214,138 @@ class SerialProducer:
                 self._queue.put_nowait(data)  # Add new
             except Exception as e:
                 logger.error(f"Failed to push to queue: {e}")
+
+
+class SerialMultiplexProducer:
+    """Reads several serial ports from a single thread using ``selectors``.
+
+    Each port's descriptor (``SerialConnectionManager.fileno``) is registered
+    with a ``selectors.DefaultSelector`` (epoll on Linux). The registered data
+    is an unstarted ``SerialProducer`` for that port, so line classification,
+    blob mode and heartbeat stay per port while one thread does all the
+    waiting. Ports that are closed or drop out are retried every
+    ``reconnect_interval`` seconds without blocking the others.
+
+    Requires POSIX file descriptors; on other platforms run one
+    ``SerialProducer`` per port instead.
+
+    Example:
+        >>> managers = [SerialConnectionManager('/dev/ttyUSB0'),
+        ...             SerialConnectionManager('/dev/ttyUSB1')]
+        >>> producer = SerialMultiplexProducer(managers, RingBufferQueue(maxsize=1000))
+        >>> producer.start()
+        >>> # ... later ...
+        >>> producer.stop()
+
+    """
+
+    def __init__(
+        self,
+        connection_managers: list[SerialConnectionManager],
+        queue: Queue | RingBufferQueue,
+        heartbeat_interval: float = 5.0,
+        max_line_length: int = 1024,
+        reconnect_interval: float = 5.0,
+    ):
+        """Initialize multiplexing producer.
+
+        Args:
+            connection_managers: One manager per serial port
+            queue: Queue to push lines to
+            heartbeat_interval: Seconds between heartbeat updates
+            max_line_length: Maximum allowed line length (for safety)
+            reconnect_interval: Seconds between attempts to (re)open a port
+
+        """
+        self._ports = [
+            SerialProducer(manager, queue, heartbeat_interval, max_line_length)
+            for manager in connection_managers
+        ]
+        self._reconnect_interval = reconnect_interval
+
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if producer is running."""
+        return self._running
+
+    @property
+    def last_heartbeat(self) -> float:
+        """Get the most recent ``time.monotonic()`` heartbeat across all ports."""
+        return max(port.last_heartbeat for port in self._ports)
+
+    def start(self) -> None:
+        """Start the producer thread."""
+        if self._running:
+            logger.warning("Producer already running")
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+        logger.info("Serial multiplex producer started for %s ports", len(self._ports))
+
+    def stop(self) -> None:
+        """Stop the producer thread gracefully."""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        logger.info("Serial multiplex producer stopped")
+
+    def _read_loop(self) -> None:
+        """Main read loop (runs in thread)."""
+        logger.info("Multiplex read loop starting")
+        selector = selectors.DefaultSelector()
+        registered: set[SerialProducer] = set()
+        next_attempt = dict.fromkeys(self._ports, 0.0)
+
+        try:
+            while self._running:
+                self._register_ports(selector, registered, next_attempt)
+
+                events = selector.select(timeout=1.0)
+                for key, _ in events:
+                    port = key.data
+                    manager = port.connection_manager
+                    for line_bytes in manager.read_available():
+                        port.handle_line(line_bytes)
+
+                    if not manager.is_connected():
+                        logger.warning("Lost connection to %s", manager.port)
+                        selector.unregister(key.fd)
+                        registered.discard(port)
+                        next_attempt[port] = time.monotonic() + self._reconnect_interval
+        finally:
+            selector.close()
+            logger.info("Multiplex read loop exiting")
+
+    def _register_ports(
+        self,
+        selector: selectors.BaseSelector,
+        registered: set[SerialProducer],
+        next_attempt: dict[SerialProducer, float],
+    ) -> None:
+        """Open and register every port that is due for a (re)connection attempt."""
+        now = time.monotonic()
+        for port in self._ports:
+            if port in registered or now < next_attempt[port]:
+                continue
+
+            manager = port.connection_manager
+            fd = manager.fileno() if manager.connect() else None
+            if fd is None:
+                if manager.is_connected():
+                    logger.error("%s has no file descriptor, cannot multiplex it", manager.port)
+                    manager.disconnect()
+                else:
+                    logger.warning("Could not open %s, retrying later", manager.port)
+                next_attempt[port] = now + self._reconnect_interval
+                continue
+
+            selector.register(fd, selectors.EVENT_READ, port)
+            registered.add(port)
@@ -0,0 +1,141 @@
+"""Deque-backed FIFO for the single-producer/single-consumer serial pipeline.
+
+``queue.Queue`` takes a mutex and notifies a condition variable on every
+put/get. The recorder only ever has one producer thread and one consumer
+thread, so a ``collections.deque`` (whose ``append``/``popleft`` are atomic
+under the GIL) plus a ``threading.Event`` for wakeups is sufficient.
+
+The deque is created with ``maxlen``, so ``put_overwrite`` can drop the
+oldest item and append the new one in a single atomic step.
+"""
+
+import threading
+import time
+from collections import deque
+from queue import Empty, Full
+from typing import Any
+
+
+class RingBufferQueue:
+    """Bounded FIFO with the subset of the ``queue.Queue`` API the pipeline uses.
+
+    ``put``/``put_nowait``/``get``/``get_nowait``/``qsize``/``empty``/``full``
+    behave like their ``queue.Queue`` counterparts (including raising
+    ``queue.Empty`` and ``queue.Full``), so producer, consumer and tests can
+    use either implementation interchangeably.
+
+    Example:
+        >>> q = RingBufferQueue(maxsize=1000)
+        >>> q.put_nowait(b"$PNORI,...")
+        >>> q.get(timeout=1.0)
+        b'$PNORI,...'
+
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """Initialize ring buffer queue.
+
+        Args:
+            maxsize: Maximum number of items held; 0 or less means unbounded
+
+        """
+        self.maxsize = maxsize
+        self._items: deque[Any] = deque(maxlen=maxsize if maxsize > 0 else None)
+        self._data_event = threading.Event()
+
+    def qsize(self) -> int:
+        """Return the number of items currently queued."""
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """Return True if the queue holds no items."""
+        return not self._items
+
+    def full(self) -> bool:
+        """Return True if the queue has reached maxsize."""
+        return 0 < self.maxsize <= len(self._items)
+
+    def put_nowait(self, item: Any) -> None:
+        """Append an item without blocking.
+
+        Raises:
+            Full: If the queue has reached maxsize
+
+        """
+        if 0 < self.maxsize <= len(self._items):
+            raise Full
+        self._items.append(item)
+        self._data_event.set()
+
+    def put_overwrite(self, item: Any) -> bool:
+        """Append an item, discarding the oldest one if the queue is full.
+
+        Returns:
+            True if an item was discarded to make room
+
+        """
+        items = self._items
+        dropped = len(items) == items.maxlen
+        items.append(item)
+        self._data_event.set()
+        return dropped
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        """Append an item, waiting for free space if the queue is full.
+
+        Raises:
+            Full: If no space became available within timeout (or block is False)
+
+        """
+        if not block or self.maxsize <= 0:
+            self.put_nowait(item)
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._items) >= self.maxsize:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise Full
+            time.sleep(0.001)
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        """Remove and return the oldest item without blocking.
+
+        Raises:
+            Empty: If the queue is empty
+
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise Empty from None
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """Remove and return the oldest item, waiting for one if necessary.
+
+        Raises:
+            Empty: If no item arrived within timeout (or block is False)
+
+        """
+        items = self._items
+        try:
+            return items.popleft()
+        except IndexError:
+            if not block:
+                raise Empty from None
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Clear before re-checking so a concurrent put() cannot be missed
+            self._data_event.clear()
+            try:
+                return items.popleft()
+            except IndexError:
+                pass
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Empty
+            self._data_event.wait(remaining)
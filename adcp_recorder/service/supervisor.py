@@ -1,14 +1,40 @@
 import logging
+import logging.handlers
+import queue
 import signal
 import sys
 import threading
-import time
 
 from adcp_recorder.config import RecorderConfig
 from adcp_recorder.core.recorder import AdcpRecorder
 
 logger = logging.getLogger(__name__)
 
+# Seconds between component health checks while waiting for shutdown
+_HEALTH_CHECK_INTERVAL = 1.0
+
+# Log records held before a write; errors, and records once the oldest held one
+# is older than the interval, flush immediately
+_LOG_BUFFER_CAPACITY = 512
+_LOG_FLUSH_INTERVAL = 1.0
+_LOG_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_MESSAGE_ONLY_FORMATTER = logging.Formatter("%(message)s")
+
+
+class _BufferedLogHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes once its oldest buffered record is stale.
+
+    The service's log stream is redirected to a file, so writing every record
+    costs a syscall; buffering batches them without holding a line back for
+    more than ``_LOG_FLUSH_INTERVAL`` while the log is active.
+    """
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:  # noqa: N802 (logging API name)
+        return (
+            super().shouldFlush(record)
+            or record.created - self.buffer[0].created >= _LOG_FLUSH_INTERVAL
+        )
+
 
 class ServiceSupervisor:
     """Supervises the ADCP Recorder execution.
@@ -19,27 +45,32 @@ class ServiceSupervisor:
 
     def __init__(self, config: RecorderConfig):
         self.config = config
-        self.recorder = AdcpRecorder(config)
         self._shutdown_event = threading.Event()
 
-        # Setup signal handlers
+        # Setup signal handlers before building the recorder (which opens the
+        # database) so a stop request sent during startup is honored
         signal.signal(signal.SIGINT, self._handle_signal)
         signal.signal(signal.SIGTERM, self._handle_signal)
 
+        self.recorder = AdcpRecorder(config)
+
     def _handle_signal(self, signum, frame) -> None:
         """Handle incoming signals."""
         sig_name = signal.Signals(signum).name
-        logger.info(f"Received signal {sig_name}, initiating shutdown...")
+        logger.info("Received signal %s, initiating shutdown...", sig_name)
         self._shutdown_event.set()
 
     def run(self):
         """Run the service loop."""
         try:
             logger.info("Service supervisor starting...")
+            if self._shutdown_event.is_set():
+                logger.info("Shutdown requested during startup, not starting recorder")
+                return
             self.recorder.start()
 
-            # Monitoring loop
-            while not self._shutdown_event.is_set():
+            # Monitoring loop; the wait returns as soon as a signal sets the event
+            while True:
                 # Check health of components
                 if not self.recorder.is_running:
                     logger.error("Recorder stopped unexpectedly!")
@@ -50,10 +81,11 @@ class ServiceSupervisor:
                 if hasattr(self.recorder, "producer") and not self.recorder.producer.is_running:
                     logger.warning("Producer thread is dead!")
 
-                time.sleep(1.0)
+                if self._shutdown_event.wait(_HEALTH_CHECK_INTERVAL):
+                    break
 
         except Exception as e:
-            logger.error(f"Service crashed: {e}", exc_info=True)
+            logger.error("Service crashed: %s", e, exc_info=True)
             sys.exit(1)
         finally:
             self._shutdown()
@@ -64,19 +96,64 @@ class ServiceSupervisor:
         try:
             self.recorder.stop()
         except Exception as e:
-            logger.error(f"Error during shutdown: {e}")
+            logger.error("Error during shutdown: %s", e)
         logger.info("Service stopped.")
 
 
-def main():
-    """Entry point for the service."""
-    logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+def _setup_logging(config: RecorderConfig) -> logging.handlers.QueueListener | None:
+    """Send log records to stderr from a background thread, buffered.
+
+    Logging calls only enqueue the record; a ``QueueListener`` thread owns the
+    buffering handler and the stderr writes. Like ``logging.basicConfig`` this
+    does nothing if the root logger is already configured.
+
+    Args:
+        config: Loaded configuration; its ``log_level`` sets the root level
+
+    Returns:
+        The running listener, or None if logging was already configured
+
+    """
+    if logging.getLogger().handlers:
+        return None
+
+    stream = logging.StreamHandler()
+    stream.setFormatter(_LOG_FORMATTER)
+    buffered = _BufferedLogHandler(
+        _LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=stream, flushOnClose=True
     )
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, buffered, respect_handler_level=True)
+
+    # The queue handler only renders the message; the stderr handler adds the layout
+    enqueue = logging.handlers.QueueHandler(log_queue)
+    enqueue.setFormatter(_MESSAGE_ONLY_FORMATTER)
+    level = logging.getLevelNamesMapping().get(str(config.log_level).upper(), logging.INFO)
+    logging.basicConfig(level=level, handlers=[enqueue])
+    listener.start()
+    return listener
 
+
+def _stop_logging(listener: logging.handlers.QueueListener | None) -> None:
+    """Drain the log queue and write out everything still buffered."""
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def main():
+    """Entry point for the service."""
+    # Load once; the same instance configures logging and the recorder
     config = RecorderConfig.load()
-    supervisor = ServiceSupervisor(config)
-    supervisor.run()
+    log_listener = _setup_logging(config)
+
+    try:
+        supervisor = ServiceSupervisor(config)
+        supervisor.run()
+    finally:
+        _stop_logging(log_listener)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,15 @@
 import os
+import sys
 
 import pytest
 
 from adcp_recorder.config import RecorderConfig
 
+# Environment variables RecorderConfig reads, minus the output dir each test sets itself
+_CONFIG_ENV_VARS = frozenset(
+    f"{RecorderConfig.ENV_PREFIX}{attr.upper()}" for attr in RecorderConfig.ENV_OVERRIDES
+) - {"ADCP_RECORDER_OUTPUT_DIR"}
+
 
 @pytest.fixture(autouse=True)
 def isolate_test_env(tmp_path, monkeypatch):
@@ -22,8 +28,26 @@ def isolate_test_env(tmp_path, monkeypatch):
     monkeypatch.setenv("ADCP_RECORDER_OUTPUT_DIR", test_output_dir)
 
     # Clear other environment variables that might interfere
-    for env_var in list(os.environ.keys()):
-        if env_var.startswith("ADCP_RECORDER_") and env_var != "ADCP_RECORDER_OUTPUT_DIR":
-            monkeypatch.delenv(env_var, raising=False)
+    for env_var in _CONFIG_ENV_VARS & os.environ.keys():
+        monkeypatch.delenv(env_var)
 
     return tmp_path
+
+
+@pytest.fixture
+def restore_modules():
+    """Undo a test's sys.modules surgery once it finishes.
+
+    Tests that drop adcp_recorder modules for a fresh import would otherwise
+    leave the fresh copies installed, so later tests patch a different module
+    object than the one they imported.
+    """
+    saved = dict(sys.modules)
+    yield
+    sys.modules.clear()
+    sys.modules.update(saved)
+    # Re-point package attributes at the original submodules too
+    for name, module in saved.items():
+        parent, _, child = name.rpartition(".")
+        if name.startswith("adcp_recorder.") and parent in saved:
+            setattr(saved[parent], child, module)
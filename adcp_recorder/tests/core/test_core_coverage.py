@@ -1,5 +1,7 @@
 import json
-import runpy
+import threading
+import time
+from collections import namedtuple
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,82 +13,74 @@ from adcp_recorder.config import RecorderConfig
 from adcp_recorder.core.recorder import AdcpRecorder
 from adcp_recorder.db import DatabaseManager
 
+# Plain stand-in for pyserial's ListPortInfo; the CLI only reads these attributes
+PortStub = namedtuple("PortStub", ["device", "description", "hwid"])
+
+
+@pytest.fixture(scope="class")
+def runner():
+    """One CliRunner shared by the CLI tests of a class."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_config():
+    """Patch RecorderConfig in the CLI and return the config its load() hands out."""
+    with patch("adcp_recorder.cli.main.RecorderConfig") as mock_conf_cls:
+        conf = mock_conf_cls.load.return_value
+        conf.serial_port = "/dev/ttyUSB0"
+        conf.baudrate = 9600
+        conf.output_dir = "/tmp/out"
+        conf.log_level = "INFO"
+        conf.db_path = None
+        conf.get_config_path.return_value = "/tmp/config.json"
+        yield conf
+
 
 class TestCoreCoverage:
     # --- CLI Tests ---
-    def test_cli_list_ports(self):
+    def test_cli_list_ports(self, runner):
         """Test list_ports command."""
-        runner = CliRunner()
         # Mock empty ports
-        with patch("adcp_recorder.cli.main.list_serial_ports", return_value=[]):
+        with patch("adcp_recorder.serial.port_manager.list_serial_ports", return_value=[]):
             result = runner.invoke(cli, ["list-ports"])
             assert "No serial ports found" in result.output
 
         # Mock ports found
-        mock_port = MagicMock()
-        mock_port.device = "/dev/ttyUSB0"
-        mock_port.description = "Test Device"
-        mock_port.hwid = "123"
-        with patch("adcp_recorder.cli.main.list_serial_ports", return_value=[mock_port]):
+        mock_port = PortStub("/dev/ttyUSB0", "Test Device", "123")
+        with patch("adcp_recorder.serial.port_manager.list_serial_ports", return_value=[mock_port]):
             result = runner.invoke(cli, ["list-ports"])
             assert "Found 1 ports" in result.output
             assert "/dev/ttyUSB0" in result.output
 
-    def test_cli_configure_full(self):
+    def test_cli_configure_full(self, runner, mock_config):
         """Test configure command with all options."""
-        runner = CliRunner()
-        with patch("adcp_recorder.cli.main.RecorderConfig") as mock_conf:
-            mock_inst = mock_conf.load.return_value
-            mock_inst.get_config_path.return_value = "/tmp/config.json"
-
-            result = runner.invoke(
-                cli,
-                [
-                    "configure",
-                    "--port",
-                    "/dev/ttyTest",
-                    "--baud",
-                    "115200",
-                    "--output",
-                    "/tmp/out",
-                    "--debug",
-                ],
-            )
-            assert result.exit_code == 0
-            assert "Configuration updated" in result.output
-
-            mock_inst.update.assert_called()
-
-    def test_cli_configure_no_changes(self):
+        result = runner.invoke(
+            cli,
+            [
+                "configure",
+                "--port",
+                "/dev/ttyTest",
+                "--baud",
+                "115200",
+                "--output",
+                "/tmp/out",
+                "--debug",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "Configuration updated" in result.output
+
+        mock_config.update.assert_called()
+
+    def test_cli_configure_no_changes(self, runner, mock_config):
         """Test configure command with no options."""
-        runner = CliRunner()
-        with patch("adcp_recorder.cli.main.RecorderConfig") as mock_conf:
-            mock_inst = mock_conf.load.return_value
-            # Set defaults to avoid NoneType errors in string formatting if accessed
-            mock_inst.get_config_path.return_value = "/tmp/config.json"
-            mock_inst.serial_port = "/dev/ttyUSB0"
-            mock_inst.baudrate = 9600
-            mock_inst.output_dir = "/tmp/out"
-            mock_inst.log_level = "INFO"
-
-            result = runner.invoke(cli, ["configure"])
-            assert "No changes specified" in result.output
-
-    def test_cli_start_success(self):
-        """Test start command success."""
-        runner = CliRunner()
-        with (
-            patch("adcp_recorder.cli.main.RecorderConfig.load") as mock_load,
-            patch("adcp_recorder.cli.main.AdcpRecorder") as mock_rec_cls,
-        ):
-            # Fix: Set valid log level
-            mock_conf = mock_load.return_value
-            mock_conf.log_level = "INFO"
-            mock_conf.serial_port = "/dev/ttyUSB0"
-            mock_conf.baudrate = 9600
-            mock_conf.output_dir = "/tmp/out"
-            mock_conf.db_path = None
+        result = runner.invoke(cli, ["configure"])
+        assert "No changes specified" in result.output
 
+    def test_cli_start_success(self, runner, mock_config):
+        """Test start command success."""
+        with patch("adcp_recorder.core.recorder.AdcpRecorder") as mock_rec_cls:
             mock_recorder = mock_rec_cls.return_value
             result = runner.invoke(cli, ["start"])
 
@@ -96,31 +90,21 @@ class TestCoreCoverage:
             assert result.exit_code == 0
             mock_recorder.run_blocking.assert_called_once()
 
-    def test_cli_status_success(self):
+    def test_cli_status_success(self, runner, mock_config):
         """Test status command success."""
-        runner = CliRunner()
-        with patch("adcp_recorder.cli.main.RecorderConfig.load") as mock_load:
-            conf = mock_load.return_value
-            conf.output_dir = "/tmp/out"
-            conf.serial_port = "/dev/ttyTest"
-            conf.log_level = "INFO"
-            conf.baudrate = 9600
-            conf.get_config_path.return_value = "/tmp/cfg"
-
-            with patch("adcp_recorder.cli.main.Path.exists", return_value=True):
-                # Patch source because status() does a local import
-                with patch("adcp_recorder.serial.port_manager.list_serial_ports") as mock_list:
-                    mock_port = MagicMock()
-                    mock_port.device = "/dev/ttyTest"
-                    mock_list.return_value = [mock_port]
-
-                    result = runner.invoke(cli, ["status"])
-                    assert "[OK] Output directory exists" in result.output
-                    assert "[OK] Serial port /dev/ttyTest found" in result.output
-
-    def test_cli_generate_service_windows_error(self):
+        mock_config.serial_port = "/dev/ttyTest"
+
+        with patch("adcp_recorder.cli.main.Path.exists", return_value=True):
+            # Patch source because status() does a local import
+            with patch("adcp_recorder.serial.port_manager.list_serial_ports") as mock_list:
+                mock_list.return_value = [PortStub("/dev/ttyTest", "Test Device", "123")]
+
+                result = runner.invoke(cli, ["status"])
+                assert "[OK] Output directory exists" in result.output
+                assert "[OK] Serial port /dev/ttyTest found" in result.output
+
+    def test_cli_generate_service_windows_error(self, runner):
         """Test generate_service failure on Windows."""
-        runner = CliRunner()
         # Mocking open to raise exception
         with patch("builtins.open", side_effect=Exception("Write Error")):
             result = runner.invoke(
@@ -129,18 +113,16 @@ class TestCoreCoverage:
             # Should not crash, just print error
             assert "Error generating script" in result.output
 
-    def test_cli_generate_service_linux_error(self):
+    def test_cli_generate_service_linux_error(self, runner):
         """Test generate_service failure on Linux."""
-        runner = CliRunner()
         with patch("shutil.copy", side_effect=Exception("Copy Error")):
             result = runner.invoke(
                 cli, ["generate-service", "--platform", "linux", "--out", "/tmp"]
             )
             assert "Error generating template" in result.output
 
-    def test_cli_generate_service_success(self):
+    def test_cli_generate_service_success(self, runner):
         """Test generate_service success for both platforms."""
-        runner = CliRunner()
 
         # Windows Success
         with patch("builtins.open", new_callable=MagicMock) as mock_open:
@@ -159,27 +141,20 @@ class TestCoreCoverage:
                 assert "Generated adcp-recorder.service" in result.output
                 mock_copy.assert_called()
 
-    def test_cli_status_warnings(self):
+    def test_cli_status_warnings(self, runner, mock_config):
         """Test status command warnings."""
-        runner = CliRunner()
-        with patch("adcp_recorder.cli.main.RecorderConfig.load") as mock_load:
-            conf = mock_load.return_value
-            conf.output_dir = "/non/existent/dir"
-            conf.serial_port = "COM99"
-            conf.log_level = "INFO"
-            conf.baudrate = 9600
-            conf.get_config_path.return_value = "/tmp/cfg"
-
-            with patch("adcp_recorder.cli.main.Path.exists", return_value=False):
-                mock_port = MagicMock()
-                mock_port.device = "/dev/ttyOther"
-                # Patch source because status() does a local import
-                with patch(
-                    "adcp_recorder.serial.port_manager.list_serial_ports", return_value=[mock_port]
-                ):
-                    result = runner.invoke(cli, ["status"])
-                    assert "[WARNING] Output directory does not exist" in result.output
-                    assert "not found in available ports" in result.output
+        mock_config.output_dir = "/non/existent/dir"
+        mock_config.serial_port = "COM99"
+
+        with patch("adcp_recorder.cli.main.Path.exists", return_value=False):
+            mock_port = PortStub("/dev/ttyOther", "Other Device", "456")
+            # Patch source because status() does a local import
+            with patch(
+                "adcp_recorder.serial.port_manager.list_serial_ports", return_value=[mock_port]
+            ):
+                result = runner.invoke(cli, ["status"])
+                assert "[WARNING] Output directory does not exist" in result.output
+                assert "not found in available ports" in result.output
 
     # --- Config Tests ---
     def test_config_windows_path(self):
@@ -266,10 +241,22 @@ class TestCoreCoverage:
 
         with patch.object(recorder, "start"):
             with patch.object(recorder, "stop") as mock_stop:
-                with patch("adcp_recorder.core.recorder.time.sleep", side_effect=KeyboardInterrupt):
+                with patch.object(recorder._stop_event, "wait", side_effect=KeyboardInterrupt):
                     recorder.run_blocking()
                     mock_stop.assert_called()
 
+    def test_recorder_run_blocking_returns_on_stop_event(self):
+        """Test that run_blocking wakes as soon as the stop event is set."""
+        config = RecorderConfig()
+        config.db_path = ":memory:"
+        recorder = AdcpRecorder(config)
+
+        with patch.object(recorder, "start"):
+            threading.Timer(0.05, recorder._stop_event.set).start()
+            start = time.monotonic()
+            recorder.run_blocking()
+            assert time.monotonic() - start < 0.9
+
     def test_recorder_verify_lifecycle(self):
         """Test start and stop sequences."""
         config = RecorderConfig()
@@ -319,15 +306,60 @@ class TestCoreCoverage:
                 mock_dir = MagicMock()
                 mock_dir.is_dir.return_value = True
                 mock_dir.name = "PNORS"
+                mock_dir.rglob.return_value = iter([MagicMock()])
                 mock_iter.return_value = [mock_dir]
 
                 with patch.object(db, "get_connection") as mock_conn_getter:
                     db.initialize_ducklake()
-                    mock_conn_getter.return_value.execute.assert_called()
-                    assert (
-                        "CREATE OR REPLACE VIEW view_pnors"
-                        in mock_conn_getter.return_value.execute.call_args[0][0]
-                    )
+                    execute = mock_conn_getter.return_value.execute
+                    # BEGIN plus one combined script for all views
+                    assert execute.call_count == 2
+                    assert "CREATE OR REPLACE VIEW view_pnors" in execute.call_args[0][0]
+                    mock_conn_getter.return_value.commit.assert_called_once()
+
+    def test_db_ducklake_views_created_in_one_script(self, tmp_path):
+        """Test that views for every record type are created from real Parquet files."""
+        import duckdb
+
+        for prefix in ("PNORS", "PNORC"):
+            day_dir = tmp_path / "parquet" / prefix / "2025-01-01"
+            day_dir.mkdir(parents=True)
+            duckdb.sql("SELECT 1 AS x").write_parquet(str(day_dir / "part.parquet"))
+
+        db = DatabaseManager(str(tmp_path / "adcp.duckdb"))
+        db.initialize_ducklake()
+
+        conn = db.get_connection()
+        for view in ("view_pnors", "view_pnorc"):
+            row = conn.execute(f"SELECT x FROM {view}").fetchone()
+            assert row == (1,)
+        db.close()
+
+    def test_db_ducklake_skips_empty_record_dir(self, tmp_path):
+        """Test that a record type without Parquet files does not block the other views."""
+        import duckdb
+
+        day_dir = tmp_path / "parquet" / "PNORS" / "2025-01-01"
+        day_dir.mkdir(parents=True)
+        duckdb.sql("SELECT 1 AS x").write_parquet(str(day_dir / "part.parquet"))
+        (tmp_path / "parquet" / "PNORC").mkdir()
+
+        db = DatabaseManager(str(tmp_path / "adcp.duckdb"))
+        db.initialize_ducklake()
+
+        conn = db.get_connection()
+        assert conn.execute("SELECT x FROM view_pnors").fetchone() == (1,)
+        views = {row[0] for row in conn.execute("SELECT view_name FROM duckdb_views()").fetchall()}
+        assert "view_pnorc" not in views
+        db.close()
+
+    def test_db_ducklake_no_record_dirs(self, tmp_path):
+        """Test that an empty parquet folder issues no statements."""
+        (tmp_path / "parquet").mkdir()
+        db = DatabaseManager(str(tmp_path / "adcp.duckdb"))
+        with patch.object(db, "get_connection") as mock_conn_getter:
+            db.initialize_ducklake()
+            mock_conn_getter.return_value.execute.assert_not_called()
 
     def test_db_ducklake_error(self):
         """Test DuckLake error handling."""
@@ -367,12 +399,18 @@ class TestCoreCoverage:
         mock_conn = MagicMock()
         with patch.object(db, "get_connection", return_value=mock_conn):
             db.checkpoint()
-            mock_conn.execute.assert_any_call("CHECKPOINT;")
-            mock_conn.execute.assert_any_call("ANALYZE;")
+            mock_conn.execute.assert_called_once_with("CHECKPOINT;\nANALYZE;")
 
             db.vacuum()
             mock_conn.execute.assert_any_call("VACUUM;")
 
+    def test_db_checkpoint_on_file_database(self, tmp_path):
+        """Test that the combined maintenance script runs against a real database."""
+        db = DatabaseManager(str(tmp_path / "maint.duckdb"))
+        db.initialize_schema()
+        db.checkpoint()
+        db.close()
+
     def test_db_schema_already_initialized(self):
         """Test schema init skipped if already done."""
         db = DatabaseManager(":memory:")
@@ -383,15 +421,7 @@ class TestCoreCoverage:
             mock_get.assert_not_called()
 
     def test_cli_entry_point(self):
-        """Cover __name__ == '__main__' block in cli/main.py."""
-        import sys
-
-        # Remove from sys.modules to avoid RuntimeWarning when runpy executes it
-        # We only remove the main module to trigger re-execution, not the package
-        if "adcp_recorder.cli.main" in sys.modules:
-            del sys.modules["adcp_recorder.cli.main"]
-
-        with patch("sys.argv", ["adcp-recorder", "--help"]):
-            with pytest.raises(SystemExit) as excinfo:
-                runpy.run_module("adcp_recorder.cli.main", run_name="__main__")
-            assert excinfo.value.code == 0
+        """Test that the CLI group runs as a standalone program."""
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main(args=["--help"], prog_name="adcp-recorder", standalone_mode=True)
+        assert excinfo.value.code == 0
@@ -3,6 +3,7 @@
 import pytest
 
 from adcp_recorder.core.nmea import (
+    _prefix_of,
     compute_checksum,
     extract_prefix,
     is_binary_data,
@@ -47,6 +48,15 @@ class TestComputeChecksum:
         assert checksum == checksum.upper()
         assert len(checksum) == 2
 
+    def test_checksum_matches_bytewise_xor_for_any_length(self):
+        """Test the word-at-a-time XOR against a plain byte loop, including partial words."""
+        body = "PNORC,102115,090715,1,0.5,0.1,0.2,0.3,1.5,180.0,C,100,101,102,103"
+        for length in range(len(body) + 1):
+            expected = 0
+            for char in body[:length]:
+                expected ^= ord(char)
+            assert compute_checksum("$" + body[:length]) == f"{expected:02X}"
+
 
 class TestValidateChecksum:
     """Tests for validate_checksum function."""
@@ -113,6 +123,19 @@ class TestExtractPrefix:
         sentence = "  $PNORI,4,Test*50  "
         assert extract_prefix(sentence) == "PNORI"
 
+    def test_extract_prefix_longer_than_cached_head(self):
+        """Test that a prefix running past the cached head is still extracted."""
+        assert extract_prefix("$PVERYLONGVENDORTAG,1,2*00") == "PVERYLONGVENDORTAG"
+        with pytest.raises(ValueError, match=","):
+            extract_prefix("$PVERYLONGVENDORTAG")
+
+    def test_extract_prefix_caches_heads(self):
+        """Test that repeated heads are served from the prefix cache."""
+        extract_prefix("$PNORS,102115,090715*00")
+        hits = _prefix_of.cache_info().hits
+        extract_prefix("$PNORS,102115,090716*00")
+        assert _prefix_of.cache_info().hits == hits + 1
+
 
 class TestSplitSentence:
     """Tests for split_sentence function."""
@@ -141,6 +164,13 @@ class TestSplitSentence:
         assert fields == ["$PNORI", "4", "Test", "4"]
         assert checksum == "50"
 
+    def test_split_sentence_trims_non_space_whitespace(self):
+        """Test that tabs and other whitespace around fields are trimmed too."""
+        fields, checksum = split_sentence("$PNORI,\t4,Test\t,4*50")
+
+        assert fields == ["$PNORI", "4", "Test", "4"]
+        assert checksum == "50"
+
     def test_split_minimal_sentence(self):
         """Test splitting minimal sentence."""
         sentence = "$PNORI*50"
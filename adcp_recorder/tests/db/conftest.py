@@ -0,0 +1,26 @@
+import pytest
+
+from adcp_recorder.db.db import DatabaseManager
+
+
+@pytest.fixture(scope="module")
+def _memory_db():
+    """Create the in-memory database and its schema once per test module."""
+    manager = DatabaseManager(":memory:")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def conn(_memory_db):
+    """Hand each test the module's shared connection, emptied of the previous test's rows.
+
+    The insert helpers commit, so isolation comes from clearing the tables
+    afterwards rather than from rolling back a transaction.
+    """
+    conn = _memory_db.get_connection()
+    yield conn
+    tables = conn.execute(
+        "SELECT table_name FROM duckdb_tables() WHERE NOT internal AND NOT temporary"
+    ).fetchall()
+    conn.execute("".join(f"DELETE FROM {name};" for (name,) in tables))
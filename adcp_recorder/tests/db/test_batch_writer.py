@@ -0,0 +1,299 @@
+"""Tests for the batched database writer."""
+
+import time
+from unittest.mock import MagicMock
+
+import duckdb
+import pytest
+
+from adcp_recorder.db import (
+    BatchedWriter,
+    build_header_insert,
+    build_parse_error_insert,
+    build_pnora_insert,
+    build_pnorb_insert,
+    build_pnore_insert,
+    build_pnorf_insert,
+    build_pnori_insert,
+    build_pnorw_insert,
+    build_pnorwd_insert,
+    build_raw_line_insert,
+    build_sensor_insert,
+    build_velocity_insert,
+    query_pnori_configurations,
+)
+from adcp_recorder.parsers import (
+    PNORA,
+    PNORB,
+    PNORC,
+    PNORE,
+    PNORF,
+    PNORH3,
+    PNORI,
+    PNORS,
+    PNORW,
+    PNORWD,
+)
+
+BULK_CASES = [
+    (
+        PNORS,
+        build_sensor_insert,
+        "pnors_df100",
+        "$PNORS,102115,090715,00000000,2A480000,14.4,1523.0,275.9,15.7,2.3,0.0,22.45,0,0*XX",
+    ),
+    (
+        PNORC,
+        build_velocity_insert,
+        "pnorc_df100",
+        "$PNORC,102115,090715,1,0.5,0.1,0.2,0.3,1.5,180.0,C,100,101,102,103,90,91,92,93*41",
+    ),
+    (
+        PNORH3,
+        build_header_insert,
+        "pnorh",
+        "$PNORH3,DATE=211021,TIME=090715,EC=0,SC=2A4C0000*XX",
+    ),
+    (
+        PNORW,
+        build_pnorw_insert,
+        "pnorw_data",
+        "$PNORW,102115,090715,1,1,1.5,1.6,1.7,2.5,5.0,6.0,5.5,180.0,10.0,"
+        "180.0,1.0,10.0,0,0,0.5,90.0,0000*XX",
+    ),
+    (
+        PNORB,
+        build_pnorb_insert,
+        "pnorb_data",
+        "$PNORB,102115,090715,1,4,0.02,0.20,0.27,7.54,12.00,82.42,75.46,82.10,0000*XX",
+    ),
+    (
+        PNORE,
+        build_pnore_insert,
+        "pnore_data",
+        "$PNORE,102115,090715,1,0.02,0.01,5,1.5,2.5,3.5,4.5,5.5*XX",
+    ),
+    (
+        PNORF,
+        build_pnorf_insert,
+        "pnorf_data",
+        "$PNORF,A1,102115,090715,1,0.02,0.01,3,0.5,1.5,2.5*XX",
+    ),
+    (
+        PNORWD,
+        build_pnorwd_insert,
+        "pnorwd_data",
+        "$PNORWD,MD,102115,090715,1,0.02,0.01,3,45.0,90.0,135.0*XX",
+    ),
+    (
+        PNORA,
+        build_pnora_insert,
+        "pnora_data",
+        "$PNORA,151021,090715,10.5,15.50,1,00,0.0,5.5*XX",
+    ),
+]
+
+
+def _count(conn, table: str) -> int:
+    row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+    assert row is not None
+    return row[0]
+
+
+class TestBatchedWriter:
+    """Test BatchedWriter buffering and flushing."""
+
+    def test_rows_buffered_until_flush(self, conn):
+        """Test that appended rows are only written on flush."""
+        writer = BatchedWriter(conn, batch_size=100, max_age=60.0)
+
+        for i in range(5):
+            writer.append(*build_raw_line_insert(f"$PNORI,{i}*2E", "OK", "PNORI", True))
+
+        assert writer.pending == 5
+        assert _count(conn, "raw_lines") == 0
+
+        writer.flush()
+
+        assert writer.pending == 0
+        rows = conn.execute("SELECT raw_sentence FROM raw_lines ORDER BY line_id").fetchall()
+        assert [r[0] for r in rows] == [f"$PNORI,{i}*2E" for i in range(5)]
+
+    def test_flush_on_batch_size(self, conn):
+        """Test that reaching batch_size triggers a flush."""
+        writer = BatchedWriter(conn, batch_size=3, max_age=60.0)
+
+        for i in range(3):
+            writer.append(*build_raw_line_insert(f"$LINE{i}"))
+
+        assert writer.pending == 0
+        assert _count(conn, "raw_lines") == 3
+
+    def test_flush_if_due_respects_max_age(self, conn):
+        """Test that flush_if_due only writes once rows are old enough."""
+        writer = BatchedWriter(conn, batch_size=100, max_age=0.05)
+
+        writer.append(*build_raw_line_insert("$LINE"))
+        writer.flush_if_due()
+        assert writer.pending == 1
+
+        time.sleep(0.06)
+        writer.flush_if_due()
+        assert writer.pending == 0
+        assert _count(conn, "raw_lines") == 1
+
+    def test_multiple_tables_in_one_flush(self, conn):
+        """Test that rows for different tables are flushed together."""
+        writer = BatchedWriter(conn)
+
+        sentence = "$PNORI,4,Signature1000900001,4,20,0.20,1.00,0*2E"
+        data = PNORI.from_nmea(sentence).to_dict()
+        writer.append(*build_pnori_insert(sentence, data))
+        writer.append(*build_raw_line_insert(sentence, "OK", "PNORI", True))
+        writer.append(*build_parse_error_insert("$BAD", "PARSE_ERROR", "boom"))
+        writer.flush()
+
+        configs = query_pnori_configurations(conn)
+        assert len(configs) == 1
+        assert configs[0]["head_id"] == "Signature1000900001"
+        assert _count(conn, "raw_lines") == 1
+        assert _count(conn, "parse_errors") == 1
+
+    def test_bad_row_does_not_lose_batch(self, conn):
+        """Test that a failing row is dropped while the rest are written."""
+        writer = BatchedWriter(conn)
+
+        writer.append(*build_raw_line_insert("$GOOD1", "OK"))
+        # parse_status has a CHECK constraint; this row must be rejected
+        writer.append(*build_raw_line_insert("$BAD", "NOT_A_STATUS"))
+        writer.append(*build_raw_line_insert("$GOOD2", "OK"))
+        writer.flush()
+
+        rows = conn.execute("SELECT raw_sentence FROM raw_lines ORDER BY line_id").fetchall()
+        assert [r[0] for r in rows] == ["$GOOD1", "$GOOD2"]
+
+    def test_bad_row_does_not_lose_other_tables(self, conn, caplog):
+        """Test that a failed flush transaction is retried per statement."""
+        writer = BatchedWriter(conn)
+
+        writer.append(*build_parse_error_insert("$ERR1", "PARSE_ERROR", "boom"))
+        writer.append(*build_parse_error_insert("$ERR2", "PARSE_ERROR", "boom"))
+        writer.append(*build_raw_line_insert("$GOOD", "OK"))
+        writer.append(*build_raw_line_insert("$BAD", "NOT_A_STATUS"))
+        writer.flush()
+
+        assert "retrying per statement" in caplog.text
+        assert _count(conn, "parse_errors") == 2
+        rows = conn.execute("SELECT raw_sentence FROM raw_lines").fetchall()
+        assert rows == [("$GOOD",)]
+
+    def test_begin_failure_keeps_batch(self, conn):
+        """Test that rows stay buffered when the flush transaction cannot start."""
+        flaky = MagicMock(wraps=conn)
+        writer = BatchedWriter(flaky, batch_size=100, max_age=60.0)
+
+        for i in range(3):
+            writer.append(*build_raw_line_insert(f"$LINE{i}", "OK"))
+        flaky.execute.side_effect = duckdb.ConnectionException("connection lost")
+
+        with pytest.raises(duckdb.ConnectionException):
+            writer.flush()
+        assert writer.pending == 3
+
+        flaky.execute.side_effect = None
+        writer.flush()
+
+        assert writer.pending == 0
+        assert _count(conn, "raw_lines") == 3
+
+    def test_dropped_row_names_table_and_sentence(self, conn, caplog):
+        """Test that a typed row dropped on replay is logged with its table and sentence."""
+        writer = BatchedWriter(conn)
+
+        sentence = "$PNORI,4,Signature1000900001,4,20,0.20,1.00,0*2E"
+        sql, params = build_pnori_insert(sentence, PNORI.from_nmea(sentence).to_dict())
+        # beam_count has a CHECK constraint; this row must be rejected
+        writer.append(sql, params[:4] + (99,) + params[5:])
+        writer.append(*build_raw_line_insert(sentence, "OK", "PNORI", True))
+        writer.flush()
+
+        assert _count(conn, "raw_lines") == 1
+        assert "Dropping row for pnori that failed to insert" in caplog.text
+        assert sentence in caplog.text
+
+    def test_flush_empty_is_noop(self, conn):
+        """Test that flushing with nothing pending does not touch the connection."""
+        writer = BatchedWriter(conn)
+        writer.flush()
+        assert writer.pending == 0
+
+    @pytest.mark.parametrize(("parser", "build", "table", "sentence"), BULK_CASES)
+    def test_bulk_insert_every_message_type(self, conn, caplog, parser, build, table, sentence):
+        """Test that multi-row flushes go through INSERT ... SELECT for every table."""
+        writer = BatchedWriter(conn, batch_size=100, max_age=60.0)
+
+        data = parser.from_nmea(sentence).to_dict()
+        for _ in range(3):
+            writer.append(*build(sentence, data))
+        writer.flush()
+
+        assert _count(conn, table) == 3
+        assert "retrying" not in caplog.text
+
+    @pytest.mark.parametrize(("parser", "build", "table", "sentence"), BULK_CASES)
+    def test_bulk_insert_large_batch(self, conn, caplog, parser, build, table, sentence):
+        """Test that a 10k-row flush lands in a single INSERT ... SELECT per table."""
+        writer = BatchedWriter(conn, batch_size=100_000, max_age=600.0)
+
+        sql, params = build(sentence, parser.from_nmea(sentence).to_dict())
+        for _ in range(10_000):
+            writer.append(sql, params)
+        writer.flush()
+
+        assert _count(conn, table) == 10_000
+        assert "retrying" not in caplog.text
+
+    def test_bulk_insert_preserves_nulls(self, conn):
+        """Test that None parameters are stored as NULL in a bulk flush."""
+        writer = BatchedWriter(conn, batch_size=100, max_age=60.0)
+
+        writer.append(*build_raw_line_insert("$A", "OK", "PNORI", True))
+        writer.append(*build_raw_line_insert("$B"))
+        writer.flush()
+
+        rows = conn.execute(
+            "SELECT raw_sentence, record_type, checksum_valid FROM raw_lines ORDER BY line_id"
+        ).fetchall()
+        assert rows == [("$A", "PNORI", True), ("$B", None, None)]
+
+    def test_bulk_insert_matches_direct_bind_for_floats(self, conn):
+        """Test that bulk-flushed floats round into DECIMAL columns like bound parameters."""
+        writer = BatchedWriter(conn, batch_size=100, max_age=60.0)
+
+        sentence = BULK_CASES[3][3]
+        sql, params = build_pnorw_insert(sentence, PNORW.from_nmea(sentence).to_dict())
+        hm0_values = [1.005, None, 2.675]
+        for hm0 in hm0_values:
+            writer.append(sql, params[:6] + (hm0,) + params[7:])
+        writer.flush()
+        for hm0 in hm0_values:
+            conn.execute(sql, params[:6] + (hm0,) + params[7:])
+
+        rows = conn.execute("SELECT hm0 FROM pnorw_data ORDER BY record_id").fetchall()
+        assert rows[:3] == rows[3:]
+        assert rows[1] == (None,)
+
+    def test_bulk_insert_rejects_nan_like_direct_bind(self, conn, caplog):
+        """Test that a NaN is not silently stored as NULL by a bulk flush."""
+        writer = BatchedWriter(conn, batch_size=100, max_age=60.0)
+
+        sentence = BULK_CASES[3][3]
+        sql, params = build_pnorw_insert(sentence, PNORW.from_nmea(sentence).to_dict())
+        for hm0 in (1.5, float("nan"), None):
+            writer.append(sql, params[:6] + (hm0,) + params[7:])
+        writer.flush()
+
+        # DECIMAL cannot hold NaN, so the row is rejected as a bound parameter would be
+        rows = conn.execute("SELECT hm0 FROM pnorw_data ORDER BY record_id").fetchall()
+        assert [r[0] for r in rows] == [pytest.approx(1.5), None]
+        assert "Dropping row for pnorw_data" in caplog.text
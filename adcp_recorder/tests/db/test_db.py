@@ -1,8 +1,12 @@
 """Tests for database manager and schema initialization."""
 
+from unittest.mock import MagicMock, patch
+
+import duckdb
 import pytest
 
 from adcp_recorder.db import DatabaseManager
+from adcp_recorder.db.schema import ALL_SCHEMA_SQL
 
 
 class TestDatabaseManager:
@@ -28,17 +32,10 @@ class TestDatabaseManager:
         db = DatabaseManager(":memory:")
         conn = db.get_connection()
 
-        # Query table schema
-        result = conn.execute(
-            """
-            SELECT column_name, data_type
-            FROM information_schema.columns
-            WHERE table_name = 'raw_lines'
-            ORDER BY ordinal_position
-            """
-        ).fetchall()
+        # Query table schema; rows are (cid, name, type, notnull, default, pk)
+        result = conn.execute("PRAGMA table_info('raw_lines')").fetchall()
 
-        column_names = [row[0] for row in result]
+        column_names = [row[1] for row in result]
 
         assert "line_id" in column_names
         assert "received_at" in column_names
@@ -54,16 +51,9 @@ class TestDatabaseManager:
         conn = db.get_connection()
 
         # Query table schema
-        result = conn.execute(
-            """
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_name = 'parse_errors'
-            ORDER BY ordinal_position
-            """
-        ).fetchall()
+        result = conn.execute("PRAGMA table_info('parse_errors')").fetchall()
 
-        column_names = [row[0] for row in result]
+        column_names = [row[1] for row in result]
 
         assert "error_id" in column_names
         assert "received_at" in column_names
@@ -122,6 +112,39 @@ class TestDatabaseManager:
         assert result is not None
         assert result[0] == 0
 
+    def test_schema_failure_falls_back_per_statement(self, tmp_path, caplog):
+        """Test that one failing schema statement does not stop the rest."""
+        db_path = tmp_path / "legacy.db"
+        with duckdb.connect(str(db_path)) as conn:
+            # A legacy pnorh table the header views and indexes cannot use
+            conn.execute("CREATE TABLE pnorh (record_id BIGINT)")
+
+        db = DatabaseManager(str(db_path))
+        conn = db.get_connection()
+
+        assert "Schema initialization warning" in caplog.text
+        tables = {row[0] for row in conn.execute("SHOW TABLES").fetchall()}
+        assert {"raw_lines", "parse_errors", "pnora_data"} <= tables
+        db.close()
+
+    def test_schema_begin_failure_skips_rollback(self, caplog):
+        """Test that a failed BEGIN is reported as-is and never followed by a rollback."""
+        db = DatabaseManager(":memory:")
+        db._schema_initialized = False
+
+        mock_conn = MagicMock()
+        mock_conn.execute.side_effect = duckdb.ConnectionException("connection lost")
+
+        with (
+            patch.object(db, "get_connection", return_value=mock_conn),
+            patch.object(db, "initialize_ducklake"),
+        ):
+            db.initialize_schema()
+
+        mock_conn.rollback.assert_not_called()
+        assert "Schema transaction not started (connection lost)" in caplog.text
+        assert mock_conn.execute.call_count == 1 + len(ALL_SCHEMA_SQL)
+
     def test_close_connection(self):
         """Test that close() properly closes the connection."""
         db = DatabaseManager(":memory:")
@@ -157,14 +180,13 @@ class TestDatabaseConstraints:
         db = DatabaseManager(":memory:")
         conn = db.get_connection()
 
-        # Valid values should work
+        # Valid values should work (autocommit, no explicit commit needed)
         conn.execute(
             """
             INSERT INTO raw_lines (line_id, raw_sentence, parse_status)
             VALUES (nextval('raw_lines_seq'), 'test', 'OK')
             """
         )
-        conn.commit()
 
         conn.execute(
             """
@@ -172,7 +194,6 @@ class TestDatabaseConstraints:
             VALUES (nextval('raw_lines_seq'), 'test', 'FAIL')
             """
         )
-        conn.commit()
 
         conn.execute(
             """
@@ -180,17 +201,15 @@ class TestDatabaseConstraints:
             VALUES (nextval('raw_lines_seq'), 'test', 'PENDING')
             """
         )
-        conn.commit()
 
         # Invalid value should fail
-        with pytest.raises(Exception):
+        with pytest.raises(duckdb.ConstraintException):
             conn.execute(
                 """
                 INSERT INTO raw_lines (line_id, raw_sentence, parse_status)
                 VALUES (nextval('raw_lines_seq'), 'test', 'INVALID')
                 """
             )
-            conn.commit()
 
     def test_not_null_constraints(self):
         """Test NOT NULL constraints."""
@@ -198,21 +217,19 @@ class TestDatabaseConstraints:
         conn = db.get_connection()
 
         # Missing raw_sentence should fail
-        with pytest.raises(Exception):
+        with pytest.raises(duckdb.ConstraintException):
             conn.execute(
                 """
                 INSERT INTO raw_lines (line_id, parse_status)
                 VALUES (nextval('raw_lines_seq'), 'OK')
                 """
             )
-            conn.commit()
 
         # Missing raw_sentence in parse_errors should fail
-        with pytest.raises(Exception):
+        with pytest.raises(duckdb.ConstraintException):
             conn.execute(
                 """
                 INSERT INTO parse_errors (error_id, error_type)
                 VALUES (nextval('parse_errors_seq'), 'TEST')
                 """
             )
-            conn.commit()
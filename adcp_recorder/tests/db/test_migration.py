@@ -8,6 +8,88 @@ import pytest
 
 from adcp_recorder.db.migration import migrate_database, verify_migration
 
+# Sample values for the old-schema columns the migration reads or converts
+_COLUMN_VALUES: dict[str, Any] = {
+    "original_sentence": "dummy",
+    "instrument_type_name": "dummy",
+    "head_id": "dummy",
+    "coord_system_name": "ENU",
+    "measurement_date": "190126",
+    "measurement_time": "234500",
+    "cell_index": 1,
+    "beam_count": 4,
+    "cell_count": 4,
+    "instrument_type_code": 0,
+    "coord_system_code": 0,
+    "blanking_distance": 1.0,
+    "cell_size": 1.0,
+    "heading": 90.0,
+    **dict.fromkeys(("pitch", "roll", "pressure", "temperature", "battery", "sound_speed"), 1.0),
+    **dict.fromkeys(("hm0", "hmax", "tm02", "tp", "mean_period", "peak_dir", "mean_dir"), 1.0),
+    "spectrum_basis": 1,
+    "num_frequencies": 1,
+    "energy_densities": "[1.0]",
+    "values": "[1.0]",
+}
+
+
+# Old per-variant tables; each column list is shared by the tables that used it
+_OLD_VARIANT_TABLES = [
+    (
+        ("pnori1", "pnori2"),
+        "config_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
+        "original_sentence TEXT, instrument_type_name VARCHAR, instrument_type_code TINYINT, "
+        "head_id VARCHAR, beam_count TINYINT, cell_count SMALLINT, blanking_distance DECIMAL, "
+        "cell_size DECIMAL, coord_system_name VARCHAR, coord_system_code TINYINT, checksum VARCHAR",
+    ),
+    (
+        ("pnors_df101", "pnors_df102"),
+        "record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
+        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
+        "error_code VARCHAR, status_code VARCHAR, battery DECIMAL, sound_speed DECIMAL, "
+        "heading_std_dev DECIMAL, heading DECIMAL, pitch DECIMAL, pitch_std_dev DECIMAL, "
+        "roll DECIMAL, roll_std_dev DECIMAL, pressure DECIMAL, pressure_std_dev DECIMAL, "
+        "temperature DECIMAL, checksum VARCHAR",
+    ),
+    (
+        ("pnors_df103", "pnors_df104"),
+        "record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
+        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
+        "battery DECIMAL, sound_speed DECIMAL, heading DECIMAL, pitch DECIMAL, roll DECIMAL, "
+        "pressure DECIMAL, temperature DECIMAL, checksum VARCHAR",
+    ),
+    (
+        ("pnorc_df101", "pnorc_df102"),
+        "record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
+        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
+        "cell_index SMALLINT, cell_distance DECIMAL, vel1 DECIMAL, vel2 DECIMAL, "
+        "vel3 DECIMAL, vel4 DECIMAL, amp1 DECIMAL, amp2 DECIMAL, amp3 DECIMAL, amp4 DECIMAL, "
+        "corr1 SMALLINT, corr2 SMALLINT, corr3 SMALLINT, corr4 SMALLINT, checksum VARCHAR",
+    ),
+    (
+        ("pnorc_df103", "pnorc_df104"),
+        "record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
+        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
+        "cell_index SMALLINT, cell_distance DECIMAL, speed DECIMAL, direction DECIMAL, "
+        "checksum VARCHAR",
+    ),
+    (
+        ("pnorh_df103", "pnorh_df104"),
+        "record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
+        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
+        "error_code INTEGER, status_code CHAR(8), checksum VARCHAR",
+    ),
+]
+
+
+def _type_default(col_type: str, nullable: str) -> Any:
+    """Fill any other column: NULL when allowed, else a type-appropriate dummy."""
+    if "VARCHAR" in col_type or "CHAR" in col_type or "TEXT" in col_type:
+        return "dummy" if nullable == "NO" else None
+    if "INT" in col_type or "DECIMAL" in col_type or "DOUBLE" in col_type:
+        return 0 if nullable == "NO" else None
+    return None
+
 
 @pytest.fixture
 def old_db_path(tmp_path):
@@ -28,88 +110,13 @@ def old_db_path(tmp_path):
         )
     """)
 
-    # PNORI family
-    conn.execute(
-        "CREATE TABLE pnori1 (config_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, instrument_type_name VARCHAR, instrument_type_code TINYINT, "
-        "head_id VARCHAR, beam_count TINYINT, cell_count SMALLINT, blanking_distance DECIMAL, "
-        "cell_size DECIMAL, coord_system_name VARCHAR, coord_system_code TINYINT, checksum VARCHAR)"
-    )
-    conn.execute(
-        "CREATE TABLE pnori2 (config_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, instrument_type_name VARCHAR, instrument_type_code TINYINT, "
-        "head_id VARCHAR, beam_count TINYINT, cell_count SMALLINT, blanking_distance DECIMAL, "
-        "cell_size DECIMAL, coord_system_name VARCHAR, coord_system_code TINYINT, checksum VARCHAR)"
-    )
-
-    # PNORS family
-    conn.execute(
-        "CREATE TABLE pnors_df101 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "error_code VARCHAR, status_code VARCHAR, battery DECIMAL, sound_speed DECIMAL, "
-        "heading_std_dev DECIMAL, heading DECIMAL, pitch DECIMAL, pitch_std_dev DECIMAL, "
-        "roll DECIMAL, roll_std_dev DECIMAL, pressure DECIMAL, pressure_std_dev DECIMAL, "
-        "temperature DECIMAL, checksum VARCHAR)"
-    )
+    # Per-variant tables of the old schema, one CREATE TABLE per variant
     conn.execute(
-        "CREATE TABLE pnors_df102 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "error_code VARCHAR, status_code VARCHAR, battery DECIMAL, sound_speed DECIMAL, "
-        "heading_std_dev DECIMAL, heading DECIMAL, pitch DECIMAL, pitch_std_dev DECIMAL, "
-        "roll DECIMAL, roll_std_dev DECIMAL, pressure DECIMAL, pressure_std_dev DECIMAL, "
-        "temperature DECIMAL, checksum VARCHAR)"
-    )
-    conn.execute(
-        "CREATE TABLE pnors_df103 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "battery DECIMAL, sound_speed DECIMAL, heading DECIMAL, pitch DECIMAL, roll DECIMAL, "
-        "pressure DECIMAL, temperature DECIMAL, checksum VARCHAR)"
-    )
-    conn.execute(
-        "CREATE TABLE pnors_df104 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "battery DECIMAL, sound_speed DECIMAL, heading DECIMAL, pitch DECIMAL, roll DECIMAL, "
-        "pressure DECIMAL, temperature DECIMAL, checksum VARCHAR)"
-    )
-
-    # PNORC family
-    conn.execute(
-        "CREATE TABLE pnorc_df101 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "cell_index SMALLINT, cell_distance DECIMAL, vel1 DECIMAL, vel2 DECIMAL, "
-        "vel3 DECIMAL, vel4 DECIMAL, amp1 DECIMAL, amp2 DECIMAL, amp3 DECIMAL, amp4 DECIMAL, "
-        "corr1 SMALLINT, corr2 SMALLINT, corr3 SMALLINT, corr4 SMALLINT, checksum VARCHAR)"
-    )
-    conn.execute(
-        "CREATE TABLE pnorc_df102 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "cell_index SMALLINT, cell_distance DECIMAL, vel1 DECIMAL, vel2 DECIMAL, "
-        "vel3 DECIMAL, vel4 DECIMAL, amp1 DECIMAL, amp2 DECIMAL, amp3 DECIMAL, amp4 DECIMAL, "
-        "corr1 SMALLINT, corr2 SMALLINT, corr3 SMALLINT, corr4 SMALLINT, checksum VARCHAR)"
-    )
-    conn.execute(
-        "CREATE TABLE pnorc_df103 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "cell_index SMALLINT, cell_distance DECIMAL, speed DECIMAL, direction DECIMAL, "
-        "checksum VARCHAR)"
-    )
-    conn.execute(
-        "CREATE TABLE pnorc_df104 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "cell_index SMALLINT, cell_distance DECIMAL, speed DECIMAL, direction DECIMAL, "
-        "checksum VARCHAR)"
-    )
-
-    # PNORH family
-    conn.execute(
-        "CREATE TABLE pnorh_df103 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "error_code INTEGER, status_code CHAR(8), checksum VARCHAR)"
-    )
-    conn.execute(
-        "CREATE TABLE pnorh_df104 (record_id BIGINT PRIMARY KEY, received_at TIMESTAMP, "
-        "original_sentence TEXT, measurement_date VARCHAR, measurement_time VARCHAR, "
-        "error_code INTEGER, status_code CHAR(8), checksum VARCHAR)"
+        "".join(
+            f"CREATE TABLE {table} ({columns});"
+            for names, columns in _OLD_VARIANT_TABLES
+            for table in names
+        )
     )
 
     conn.execute("""
@@ -153,72 +160,19 @@ def old_db_path(tmp_path):
 
     # Insert data into ALL tables
     t = datetime.now()
-    tables = [
-        "pnori1",
-        "pnori2",
-        "pnors_df101",
-        "pnors_df102",
-        "pnors_df103",
-        "pnors_df104",
-        "pnorc_df101",
-        "pnorc_df102",
-        "pnorc_df103",
-        "pnorc_df104",
-        "pnorh_df103",
-        "pnorh_df104",
-    ]
+    tables = [table for names, _ in _OLD_VARIANT_TABLES for table in names]
     for tbl in tables:
         # Generic insertion for testing row count
         cols = conn.execute(f"DESCRIBE {tbl}").fetchall()
-        # cols: (column_name, column_type, null, key, default, extra)
         # DuckDB DESCRIBE format: [column_name, column_type, null, key, default, extra]
-        data: list[Any] = []
-        for i, col in enumerate(cols):
-            name, col_type, nullable = col[0], col[1], col[2]
-            if i == 0:  # record_id / config_id
-                data.append(1)
-            elif name == "received_at":
+        data: list[Any] = [1]  # record_id / config_id
+        for name, col_type, nullable, *_ in cols[1:]:
+            if name == "received_at":
                 data.append(t)
-            elif name in ("original_sentence", "instrument_type_name"):
-                data.append("dummy")
-            elif name == "head_id":
-                data.append("dummy")
-            elif name == "coord_system_name":
-                data.append("ENU")
-            elif name == "measurement_date":
-                data.append("190126")
-            elif name == "measurement_time":
-                data.append("234500")
-            elif name == "cell_index":
-                data.append(1)
-            elif name in ("beam_count", "cell_count"):
-                data.append(4)
-            elif name == "instrument_type_code":
-                data.append(0)
-            elif name == "coord_system_code":
-                data.append(0)
-            elif name in ("blanking_distance", "cell_size"):
-                data.append(1.0)
-            elif name == "heading":
-                data.append(90.0)
-            elif name in ("pitch", "roll", "pressure", "temperature", "battery", "sound_speed"):
-                data.append(1.0)
-            elif name in ("hm0", "hmax", "tm02", "tp", "mean_period", "peak_dir", "mean_dir"):
-                data.append(1.0)
-            elif name == "spectrum_basis":
-                data.append(1)
-            elif name == "num_frequencies":
-                data.append(1)
-            elif name == "energy_densities":
-                data.append("[1.0]")
-            elif name == "values":
-                data.append("[1.0]")
-            elif "VARCHAR" in col_type or "CHAR" in col_type or "TEXT" in col_type:
-                data.append("dummy" if nullable == "NO" else None)
-            elif "INT" in col_type or "DECIMAL" in col_type or "DOUBLE" in col_type:
-                data.append(0 if nullable == "NO" else None)
+            elif name in _COLUMN_VALUES:
+                data.append(_COLUMN_VALUES[name])
             else:
-                data.append(None)
+                data.append(_type_default(col_type, nullable))
 
         placeholders = ", ".join(["?"] * len(data))
         conn.execute(f"INSERT INTO {tbl} VALUES ({placeholders})", data)
@@ -311,8 +265,7 @@ def test_migration_already_migrated(tmp_path):
     # Create new schema
     from adcp_recorder.db.schema import ALL_SCHEMA_SQL
 
-    for sql in ALL_SCHEMA_SQL:
-        conn.execute(sql)
+    conn.execute("\n".join(ALL_SCHEMA_SQL))
     conn.close()
 
     stats = migrate_database(db_path, in_place=True)
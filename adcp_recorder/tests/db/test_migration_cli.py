@@ -1,20 +1,22 @@
 """Tests for migration.py CLI."""
 
-import subprocess
+from unittest.mock import patch
 
 import duckdb
+import pytest
 
+from adcp_recorder.db.migration import main
 
-def test_migration_cli_help():
+
+def test_migration_cli_help(capsys):
     """Test migration.py --help."""
-    result = subprocess.run(
-        ["python", "-m", "adcp_recorder.db.migration", "--help"], capture_output=True, text=True
-    )
-    assert result.returncode == 0
-    assert "Migrate ADCP database schema" in result.stdout
+    with patch("sys.argv", ["migration.py", "--help"]), pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 0
+    assert "Migrate ADCP database schema" in capsys.readouterr().out
 
 
-def test_migration_cli_basic(tmp_path):
+def test_migration_cli_basic(tmp_path, capsys):
     """Test migration.py CLI basic run."""
     old_db = tmp_path / "old.duckdb"
     new_db = tmp_path / "new.duckdb"
@@ -45,13 +47,9 @@ def test_migration_cli_basic(tmp_path):
     conn.close()
 
     # Run migration CLI
-    result = subprocess.run(
-        ["python", "-m", "adcp_recorder.db.migration", str(old_db), "-t", str(new_db)],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "Migration Statistics:" in result.stdout
+    with patch("sys.argv", ["migration.py", str(old_db), "-t", str(new_db)]):
+        main()
+    assert "Migration Statistics:" in capsys.readouterr().out
 
     # Verify new DB
     conn = duckdb.connect(str(new_db))
@@ -1,6 +1,8 @@
 """Tests for ORM models."""
 
 import pytest
+from sqlalchemy import inspect
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from adcp_recorder.db.models import (
@@ -23,13 +25,221 @@ from adcp_recorder.db.models import (
     RawLine,
 )
 
+_SENTENCE_TIME = {"measurement_date": "190126", "measurement_time": "234500"}
+
+# (model, constructor kwargs, attributes expected after commit + refresh)
+ROUNDTRIP_CASES = [
+    pytest.param(
+        ParseError,
+        {
+            "raw_sentence": "$PNORI,4*FF",
+            "error_type": "CHECKSUM_FAILED",
+            "error_message": "Invalid checksum",
+            "attempted_prefix": "PNORI",
+            "checksum_expected": "2E",
+            "checksum_actual": "FF",
+        },
+        {"error_type": "CHECKSUM_FAILED"},
+        id="parse_error",
+    ),
+    pytest.param(
+        Pnori,
+        {
+            "original_sentence": "$PNORI,4,Test*2E",
+            "instrument_type_name": "Test",
+            "instrument_type_code": 4,
+            "head_id": "TEST-001",
+            "beam_count": 4,
+            "cell_count": 100,
+            "blanking_distance": 0.5,
+            "cell_size": 1.0,
+            "coord_system_name": "ENU",
+            "coord_system_code": 0,
+            "checksum": "2E",
+        },
+        {"head_id": "TEST-001"},
+        id="pnori",
+    ),
+    pytest.param(
+        Pnori12,
+        {
+            "data_format": 101,
+            "original_sentence": "$PNORI1,4,Test*2E",
+            "instrument_type_name": "Test",
+            "instrument_type_code": 4,
+            "head_id": "TEST-001",
+            "beam_count": 4,
+            "cell_count": 100,
+            "blanking_distance": 0.5,
+            "cell_size": 1.0,
+            "coord_system_name": "ENU",
+            "coord_system_code": 0,
+            "checksum": "2E",
+        },
+        {"data_format": 101},
+        id="pnori12",
+    ),
+    pytest.param(
+        PnorsDf100,
+        {"original_sentence": "$PNORS,...", **_SENTENCE_TIME, "battery": 12.5, "temperature": 15.2},
+        {"battery": 12.5},
+        id="pnors_df100",
+    ),
+    pytest.param(
+        Pnors12,
+        {
+            "data_format": 101,
+            "original_sentence": "$PNORS1,...",
+            **_SENTENCE_TIME,
+            "battery": 12.5,
+            "heading": 180.0,
+        },
+        {"data_format": 101},
+        id="pnors12",
+    ),
+    pytest.param(
+        Pnors34,
+        {"data_format": 103, "original_sentence": "$PNORS3,...", **_SENTENCE_TIME, "battery": 12.5},
+        {"data_format": 103},
+        id="pnors34",
+    ),
+    pytest.param(
+        PnorcDf100,
+        {"original_sentence": "$PNORC,...", **_SENTENCE_TIME, "cell_index": 1, "speed": 1.5},
+        {"cell_index": 1},
+        id="pnorc_df100",
+    ),
+    pytest.param(
+        Pnorc12,
+        {
+            "data_format": 101,
+            "original_sentence": "$PNORC1,...",
+            **_SENTENCE_TIME,
+            "cell_index": 1,
+            "vel1": 0.5,
+        },
+        {"vel1": 0.5},
+        id="pnorc12",
+    ),
+    pytest.param(
+        Pnorc34,
+        {
+            "data_format": 103,
+            "original_sentence": "$PNORC3,...",
+            **_SENTENCE_TIME,
+            "cell_index": 1,
+            "speed": 1.2,
+        },
+        {"speed": 1.2},
+        id="pnorc34",
+    ),
+    pytest.param(
+        Pnorh,
+        {
+            "data_format": 103,
+            "original_sentence": "$PNORH3,...",
+            **_SENTENCE_TIME,
+            "status_code": "00000000",
+        },
+        {"status_code": "00000000"},
+        id="pnorh",
+    ),
+    pytest.param(
+        PnoreData,
+        {
+            "sentence_type": "PNORE",
+            "original_sentence": "$PNORE,...",
+            **_SENTENCE_TIME,
+            "spectrum_basis": 1,
+            "num_frequencies": 10,
+            "energy_densities": [1.0, 2.0, 3.0],
+        },
+        {"energy_densities": [1.0, 2.0, 3.0]},
+        id="pnore",
+    ),
+    pytest.param(
+        PnorwData,
+        {"sentence_type": "PNORW", "original_sentence": "$PNORW,...", **_SENTENCE_TIME, "hm0": 1.5},
+        {"hm0": 1.5},
+        id="pnorw",
+    ),
+    pytest.param(
+        PnorbData,
+        {
+            "sentence_type": "PNORB",
+            "original_sentence": "$PNORB,...",
+            **_SENTENCE_TIME,
+            "spectrum_basis": 1,
+            "processing_method": 1,
+            "hmo": 1.2,
+        },
+        {"hmo": 1.2},
+        id="pnorb",
+    ),
+    pytest.param(
+        PnorfData,
+        {
+            "sentence_type": "PNORF",
+            "original_sentence": "$PNORF,...",
+            **_SENTENCE_TIME,
+            "coefficient_flag": "A1",
+            "spectrum_basis": 1,
+            "num_frequencies": 5,
+            "coefficients": [0.1, 0.2, 0.3],
+        },
+        {"coefficients": [0.1, 0.2, 0.3]},
+        id="pnorf",
+    ),
+    pytest.param(
+        PnorwdData,
+        {
+            "sentence_type": "PNORWD",
+            "original_sentence": "$PNORWD,...",
+            **_SENTENCE_TIME,
+            "direction_type": "MD",
+            "spectrum_basis": 1,
+            "num_frequencies": 5,
+            "values": [10.0, 20.0, 30.0],
+        },
+        {"values": [10.0, 20.0, 30.0]},
+        id="pnorwd",
+    ),
+    pytest.param(
+        PnoraData,
+        {
+            "sentence_type": "PNORA",
+            "original_sentence": "$PNORA,...",
+            **_SENTENCE_TIME,
+            "altimeter_distance": 10.5,
+        },
+        {"altimeter_distance": 10.5},
+        id="pnora",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Create the in-memory engine and all model tables once for the module."""
+    # StaticPool keeps the one in-memory database behind every session
+    engine = create_engine("duckdb:///:memory:", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
 
 @pytest.fixture(name="session")
-def session_fixture():
-    engine = create_engine("duckdb:///:memory:")
-    SQLModel.metadata.create_all(engine)
+def session_fixture(engine):
+    """Open a session on the shared engine and empty every table afterwards.
+
+    Tests commit through the session and DuckDB has no SAVEPOINT, so rows are
+    deleted after each test instead of rolled back.
+    """
     with Session(engine) as session:
         yield session
+    with engine.begin() as conn:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            conn.execute(table.delete())
 
 
 def test_raw_line_roundtrip(session: Session):
@@ -49,255 +259,13 @@ def test_raw_line_roundtrip(session: Session):
     assert db_raw.raw_sentence == "$PNORI,4,Test*2E"
 
 
-def test_parse_error_roundtrip(session: Session):
-    error = ParseError(
-        raw_sentence="$PNORI,4*FF",
-        error_type="CHECKSUM_FAILED",
-        error_message="Invalid checksum",
-        attempted_prefix="PNORI",
-        checksum_expected="2E",
-        checksum_actual="FF",
-    )
-    session.add(error)
-    session.commit()
-    session.refresh(error)
-    assert error.error_id is not None
-    assert error.error_type == "CHECKSUM_FAILED"
-
-
-def test_pnori_roundtrip(session: Session):
-    config = Pnori(
-        original_sentence="$PNORI,4,Test*2E",
-        instrument_type_name="Test",
-        instrument_type_code=4,
-        head_id="TEST-001",
-        beam_count=4,
-        cell_count=100,
-        blanking_distance=0.5,
-        cell_size=1.0,
-        coord_system_name="ENU",
-        coord_system_code=0,
-        checksum="2E",
-    )
-    session.add(config)
-    session.commit()
-    session.refresh(config)
-    assert config.config_id is not None
-    assert config.head_id == "TEST-001"
-
-
-def test_pnori12_roundtrip(session: Session):
-    config = Pnori12(
-        data_format=101,
-        original_sentence="$PNORI1,4,Test*2E",
-        instrument_type_name="Test",
-        instrument_type_code=4,
-        head_id="TEST-001",
-        beam_count=4,
-        cell_count=100,
-        blanking_distance=0.5,
-        cell_size=1.0,
-        coord_system_name="ENU",
-        coord_system_code=0,
-        checksum="2E",
-    )
-    session.add(config)
-    session.commit()
-    session.refresh(config)
-    assert config.data_format == 101
-
-
-def test_pnors_df100_roundtrip(session: Session):
-    data = PnorsDf100(
-        original_sentence="$PNORS,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        battery=12.5,
-        temperature=15.2,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.record_id is not None
-    assert data.battery == 12.5
-
-
-def test_pnors12_roundtrip(session: Session):
-    data = Pnors12(
-        data_format=101,
-        original_sentence="$PNORS1,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        battery=12.5,
-        heading=180.0,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.record_id is not None
-
-
-def test_pnors34_roundtrip(session: Session):
-    data = Pnors34(
-        data_format=103,
-        original_sentence="$PNORS3,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        battery=12.5,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.record_id is not None
-
-
-def test_pnorc_df100_roundtrip(session: Session):
-    data = PnorcDf100(
-        original_sentence="$PNORC,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        cell_index=1,
-        speed=1.5,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.cell_index == 1
-
-
-def test_pnorc12_roundtrip(session: Session):
-    data = Pnorc12(
-        data_format=101,
-        original_sentence="$PNORC1,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        cell_index=1,
-        vel1=0.5,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.vel1 == 0.5
-
-
-def test_pnorc34_roundtrip(session: Session):
-    data = Pnorc34(
-        data_format=103,
-        original_sentence="$PNORC3,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        cell_index=1,
-        speed=1.2,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.speed == pytest.approx(1.2)
-
-
-def test_pnorh_roundtrip(session: Session):
-    data = Pnorh(
-        data_format=103,
-        original_sentence="$PNORH3,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        status_code="00000000",
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.status_code == "00000000"
-
-
-def test_pnore_data_roundtrip(session: Session):
-    data = PnoreData(
-        sentence_type="PNORE",
-        original_sentence="$PNORE,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        spectrum_basis=1,
-        num_frequencies=10,
-        energy_densities=[1.0, 2.0, 3.0],
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.energy_densities == [1.0, 2.0, 3.0]
-
-
-def test_pnorw_data_roundtrip(session: Session):
-    data = PnorwData(
-        sentence_type="PNORW",
-        original_sentence="$PNORW,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        hm0=1.5,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.hm0 == 1.5
-
-
-def test_pnorb_data_roundtrip(session: Session):
-    data = PnorbData(
-        sentence_type="PNORB",
-        original_sentence="$PNORB,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        spectrum_basis=1,
-        processing_method=1,
-        hmo=1.2,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.hmo == pytest.approx(1.2)
-
-
-def test_pnorf_data_roundtrip(session: Session):
-    data = PnorfData(
-        sentence_type="PNORF",
-        original_sentence="$PNORF,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        coefficient_flag="A1",
-        spectrum_basis=1,
-        num_frequencies=5,
-        coefficients=[0.1, 0.2, 0.3],
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.coefficients == [0.1, 0.2, 0.3]
-
-
-def test_pnorwd_data_roundtrip(session: Session):
-    data = PnorwdData(
-        sentence_type="PNORWD",
-        original_sentence="$PNORWD,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        direction_type="MD",
-        spectrum_basis=1,
-        num_frequencies=5,
-        values=[10.0, 20.0, 30.0],
-    )
-    session.add(data)
+@pytest.mark.parametrize(("model", "kwargs", "expected"), ROUNDTRIP_CASES)
+def test_model_roundtrip(session: Session, model, kwargs, expected):
+    obj = model(**kwargs)
+    session.add(obj)
     session.commit()
-    session.refresh(data)
-    assert data.values == [10.0, 20.0, 30.0]
-
+    session.refresh(obj)
 
-def test_pnora_data_roundtrip(session: Session):
-    data = PnoraData(
-        sentence_type="PNORA",
-        original_sentence="$PNORA,...",
-        measurement_date="190126",
-        measurement_time="234500",
-        altimeter_distance=10.5,
-    )
-    session.add(data)
-    session.commit()
-    session.refresh(data)
-    assert data.altimeter_distance == 10.5
+    assert inspect(obj).identity is not None  # primary key assigned by the sequence
+    for attr, value in expected.items():
+        assert getattr(obj, attr) == (pytest.approx(value) if isinstance(value, float) else value)
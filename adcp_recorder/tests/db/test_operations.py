@@ -1,7 +1,8 @@
 """Tests for database operations."""
 
+import duckdb
+
 from adcp_recorder.db import (
-    DatabaseManager,
     batch_insert_raw_lines,
     insert_parse_error,
     insert_pnori_configuration,
@@ -17,11 +18,8 @@ from adcp_recorder.parsers import PNORI, PNORI1, PNORI2
 class TestInsertOperations:
     """Test database insert operations."""
 
-    def test_insert_raw_line(self):
+    def test_insert_raw_line(self, conn):
         """Test inserting a single raw line."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         sentence = "$PNORI,4,Signature1000900001,4,20,0.20,1.00,0*2E"
         line_id = insert_raw_line(conn, sentence, "OK", "PNORI", True, None)
 
@@ -38,11 +36,8 @@ class TestInsertOperations:
         assert result[1] == "OK"
         assert result[2] == "PNORI"
 
-    def test_insert_raw_line_with_defaults(self):
+    def test_insert_raw_line_with_defaults(self, conn):
         """Test inserting raw line with default values."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         sentence = "$PNORI,4,Test*2E"
         line_id = insert_raw_line(conn, sentence)
 
@@ -59,11 +54,8 @@ class TestInsertOperations:
         assert result[1] is None
         assert result[2] is None
 
-    def test_insert_raw_line_with_error(self):
+    def test_insert_raw_line_with_error(self, conn):
         """Test inserting raw line with error message."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         sentence = "$INVALID*FF"
         error_msg = "Invalid checksum"
         line_id = insert_raw_line(conn, sentence, "FAIL", None, False, error_msg)
@@ -79,11 +71,8 @@ class TestInsertOperations:
         assert result is not None
         assert result[0] == error_msg
 
-    def test_batch_insert_raw_lines(self):
+    def test_batch_insert_raw_lines(self, conn):
         """Test batch inserting multiple raw lines."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         records = [
             {
                 "sentence": f"$PNORI,{i},Test*2E",
@@ -104,20 +93,14 @@ class TestInsertOperations:
         assert result is not None
         assert result[0] == 10
 
-    def test_batch_insert_empty_list(self):
+    def test_batch_insert_empty_list(self, conn):
         """Test batch insert with empty list."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         count = batch_insert_raw_lines(conn, [])
 
         assert count == 0
 
-    def test_insert_parse_error(self):
+    def test_insert_parse_error(self, conn):
         """Test inserting a parse error."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         sentence = "$PNORI,4,Invalid*FF"
         error_id = insert_parse_error(
             conn,
@@ -153,11 +136,8 @@ class TestInsertOperations:
 class TestUpdateOperations:
     """Test database update operations."""
 
-    def test_update_raw_line_status(self):
+    def test_update_raw_line_status(self, conn):
         """Test updating raw line status."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert a line
         sentence = "$PNORI,4,Test*2E"
         line_id = insert_raw_line(conn, sentence, "PENDING")
@@ -176,11 +156,8 @@ class TestUpdateOperations:
         assert result is not None
         assert result[0] == "OK"
 
-    def test_update_raw_line_status_with_error(self):
+    def test_update_raw_line_status_with_error(self, conn):
         """Test updating raw line status with error message."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert a line
         sentence = "$INVALID*FF"
         line_id = insert_raw_line(conn, sentence, "PENDING")
@@ -205,11 +182,8 @@ class TestUpdateOperations:
 class TestQueryOperations:
     """Test database query operations."""
 
-    def test_query_raw_lines_all(self):
+    def test_query_raw_lines_all(self, conn):
         """Test querying all raw lines."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert test data
         for i in range(5):
             insert_raw_line(conn, f"$PNORI,{i},Test*2E", "OK", "PNORI", True)
@@ -220,11 +194,8 @@ class TestQueryOperations:
         assert len(results) == 5
         assert all(r["record_type"] == "PNORI" for r in results)
 
-    def test_query_raw_lines_by_record_type(self):
+    def test_query_raw_lines_by_record_type(self, conn):
         """Test querying by record type."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert mixed types
         insert_raw_line(conn, "$PNORI,1*2E", "OK", "PNORI", True)
         insert_raw_line(conn, "$PNORS,1*2E", "OK", "PNORS", True)
@@ -236,11 +207,8 @@ class TestQueryOperations:
         assert len(results) == 2
         assert all(r["record_type"] == "PNORI" for r in results)
 
-    def test_query_raw_lines_by_parse_status(self):
+    def test_query_raw_lines_by_parse_status(self, conn):
         """Test querying by parse status."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert mixed statuses
         insert_raw_line(conn, "$PNORI,1*2E", "OK", "PNORI", True)
         insert_raw_line(conn, "$INVALID*FF", "FAIL", None, False)
@@ -252,11 +220,8 @@ class TestQueryOperations:
         assert len(results) == 2
         assert all(r["parse_status"] == "OK" for r in results)
 
-    def test_query_raw_lines_with_limit(self):
+    def test_query_raw_lines_with_limit(self, conn):
         """Test query limit parameter."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert 10 lines
         for i in range(10):
             insert_raw_line(conn, f"$PNORI,{i}*2E", "OK", "PNORI", True)
@@ -266,22 +231,16 @@ class TestQueryOperations:
 
         assert len(results) == 5
 
-    def test_query_raw_lines_empty_result(self):
+    def test_query_raw_lines_empty_result(self, conn):
         """Test query with no matching records."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Query empty database
         results = query_raw_lines(conn, record_type="NONEXISTENT")
 
         assert len(results) == 0
         assert isinstance(results, list)
 
-    def test_query_parse_errors(self):
+    def test_query_parse_errors(self, conn):
         """Test querying parse errors."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert errors
         insert_parse_error(conn, "$INVALID*FF", "CHECKSUM_FAILED", "Bad checksum", "PNORI")
         insert_parse_error(conn, "$MALFORMED", "INVALID_FORMAT", "Malformed sentence")
@@ -292,11 +251,8 @@ class TestQueryOperations:
         assert len(results) == 2
         assert all("error_type" in r for r in results)
 
-    def test_query_parse_errors_by_type(self):
+    def test_query_parse_errors_by_type(self, conn):
         """Test querying parse errors by error type."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert mixed error types
         insert_parse_error(conn, "$INVALID*FF", "CHECKSUM_FAILED")
         insert_parse_error(conn, "$MALFORMED", "INVALID_FORMAT")
@@ -312,14 +268,12 @@ class TestQueryOperations:
 class TestPerformance:
     """Test performance of batch operations."""
 
-    def test_batch_insert_performance(self):
+    def test_batch_insert_performance(self, conn):
         """Test that batch insert is faster than individual inserts."""
         import time
 
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
-        # Prepare data
+        # Prepare data; insert_raw_line commits every row, so the individual
+        # path costs milliseconds per row and a few thousand rows show the gap
         records = [
             {
                 "sentence": f"$PNORI,{i},Test*2E",
@@ -328,7 +282,7 @@ class TestPerformance:
                 "checksum_valid": True,
                 "error_message": None,
             }
-            for i in range(20000)
+            for i in range(2000)
         ]
 
         # Batch insert
@@ -367,11 +321,8 @@ class TestPerformance:
 class TestPNORIConfigurationOperations:
     """Test PNORI configuration database operations."""
 
-    def test_insert_pnori_configuration(self):
+    def test_insert_pnori_configuration(self, conn):
         """Test inserting PNORI configuration."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         sentence = "$PNORI,4,Signature1000900001,4,20,0.20,1.00,0*2E"
         config = PNORI.from_nmea(sentence)
         config_id = insert_pnori_configuration(conn, config.to_dict(), sentence)
@@ -394,11 +345,8 @@ class TestPNORIConfigurationOperations:
         assert result[2] == 4
         assert result[3] == "ENU"
 
-    def test_insert_pnori1_configuration(self):
+    def test_insert_pnori1_configuration(self, conn):
         """Test inserting PNORI1 configuration (stored in pnori12 table)."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         sentence = "$PNORI1,4,123456,4,30,1.00,5.00,BEAM*5B"
         config = PNORI1.from_nmea(sentence)
         config_id = insert_pnori_configuration(conn, config.to_dict(), sentence)
@@ -419,11 +367,8 @@ class TestPNORIConfigurationOperations:
         assert result[1] == 2  # BEAM maps to 2
         assert result[2] == 101  # PNORI1 => data_format 101
 
-    def test_insert_pnori2_configuration(self):
+    def test_insert_pnori2_configuration(self, conn):
         """Test inserting PNORI2 tagged configuration (stored in pnori12 table)."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         sentence = "$PNORI2,IT=4,SN=789012,NB=4,NC=25,BD=0.50,CS=2.00,CY=XYZ*00"
         config = PNORI2.from_nmea(sentence)
         config_id = insert_pnori_configuration(conn, config.to_dict(), sentence)
@@ -444,11 +389,8 @@ class TestPNORIConfigurationOperations:
         assert result[1] == "XYZ"
         assert result[2] == 102  # PNORI2 => data_format 102
 
-    def test_query_pnori_configurations_all(self):
+    def test_query_pnori_configurations_all(self, conn):
         """Test querying all PNORI configurations."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert multiple configurations
         sentences = [
             "$PNORI,4,12345,4,20,0.20,1.00,0*00",
@@ -474,11 +416,8 @@ class TestPNORIConfigurationOperations:
         assert all("sentence_type" in r for r in results)
         assert all("head_id" in r for r in results)
 
-    def test_query_pnori_by_head_id(self):
+    def test_query_pnori_by_head_id(self, conn):
         """Test querying PNORI configurations by head ID."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert configurations with different head IDs
         sentence1 = "$PNORI,4,1001,4,20,0.20,1.00,0*00"
         sentence2 = "$PNORI,4,1002,4,20,0.20,1.00,0*00"
@@ -495,11 +434,8 @@ class TestPNORIConfigurationOperations:
         assert len(results) == 1
         assert results[0]["head_id"] == "1001"
 
-    def test_query_pnori_by_sentence_type(self):
+    def test_query_pnori_by_sentence_type(self, conn):
         """Test querying PNORI configurations by sentence type."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert mixed sentence types
         sentence1 = "$PNORI,4,2001,4,20,0.20,1.00,0*00"
         sentence2 = "$PNORI1,4,2002,4,30,0.50,2.00,ENU*00"
@@ -525,11 +461,8 @@ class TestPNORIConfigurationOperations:
         assert len(results) == 1
         assert results[0]["sentence_type"] == "PNORI1"
 
-    def test_query_pnori_with_limit(self):
+    def test_query_pnori_with_limit(self, conn):
         """Test query limit parameter."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Insert multiple configurations
         for i in range(10):
             sentence = f"$PNORI,4,{1000 + i},4,20,0.20,1.00,0*00"
@@ -541,15 +474,12 @@ class TestPNORIConfigurationOperations:
 
         assert len(results) == 5
 
-    def test_pnori_database_constraints(self):
+    def test_pnori_database_constraints(self, conn):
         """Test that database enforces PNORI constraints."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         # Test invalid instrument type code (not in 0, 2, 4)
         import pytest
 
-        with pytest.raises(Exception):  # DuckDB constraint violation
+        with pytest.raises(duckdb.ConstraintException):
             conn.execute(
                 """
                 INSERT INTO pnori (
@@ -562,15 +492,12 @@ class TestPNORIConfigurationOperations:
                 """
             )
 
-    def test_pnori_cross_field_validation(self):
+    def test_pnori_cross_field_validation(self, conn):
         """Test cross-field constraint: Signature must have 4 beams."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         import pytest
 
         # Signature (type 4) with invalid beam count (3)
-        with pytest.raises(Exception):  # DuckDB constraint violation
+        with pytest.raises(duckdb.ConstraintException):
             conn.execute(
                 """
                 INSERT INTO pnori (
@@ -583,15 +510,12 @@ class TestPNORIConfigurationOperations:
                 """
             )
 
-    def test_pnori_coordinate_system_mapping(self):
+    def test_pnori_coordinate_system_mapping(self, conn):
         """Test that coordinate system mappings are enforced on pnori12."""
-        db = DatabaseManager(":memory:")
-        conn = db.get_connection()
-
         import pytest
 
         # Invalid mapping: ENU with code 1 (should be 0)
-        with pytest.raises(Exception):  # DuckDB constraint violation
+        with pytest.raises(duckdb.ConstraintException):
             conn.execute(
                 """
                 INSERT INTO pnori12 (
@@ -2,7 +2,6 @@
 
 import pytest
 
-from adcp_recorder.db import DatabaseManager
 from adcp_recorder.db.operations import (
     expand_coefficients,
     expand_energy_densities,
@@ -28,12 +27,6 @@ from adcp_recorder.db.operations import (
 )
 
 
-@pytest.fixture
-def conn():
-    db = DatabaseManager(":memory:")
-    return db.get_connection()
-
-
 def test_insert_sensor_data_all_variants(conn):
     """Test insert_sensor_data for all PNORS variants."""
     base_data = {
@@ -42,6 +42,24 @@ class TestBinaryBlobWriterCoverage:
         with open(path, "rb") as f:
             assert f.read() == b"startextra"
 
+    def test_chunks_buffered_until_flush(self, tmp_path):
+        """Test that appended chunks reach the file on flush, not per chunk."""
+        writer = BinaryBlobWriter(str(tmp_path))
+        path = writer.start_blob(b"start")
+        for _ in range(3):
+            writer.append_chunk(b"\x00\xff")
+
+        assert os.path.getsize(path) == 0
+        writer.flush()
+        assert os.path.getsize(path) == 11
+        writer.finish_blob()
+
+    def test_flush_without_blob_is_noop(self, tmp_path):
+        """Test that flush with no open blob does nothing."""
+        writer = BinaryBlobWriter(str(tmp_path))
+        writer.flush()
+        assert writer._current_file is None
+
     def test_finish_blob_none(self, tmp_path):
         """Test finish_blob when no file is open."""
         writer = BinaryBlobWriter(str(tmp_path))
@@ -120,6 +138,34 @@ class TestFileWriterCoverage:
                 writer.write_invalid_record("PNORI", "data")
                 mock_logger.error.assert_called()
 
+    def test_error_dir_created_once(self, tmp_path):
+        """Test that repeated invalid records only create the error directory once."""
+        writer = FileWriter(str(tmp_path))
+        with patch("adcp_recorder.export.file_writer.os.makedirs") as mock_makedirs:
+            mock_makedirs.side_effect = lambda path, exist_ok: Path(path).mkdir(
+                parents=True, exist_ok=exist_ok
+            )
+            for i in range(5):
+                writer.write_invalid_record("PNORI", f"$PNORI,{i}")
+
+        assert mock_makedirs.call_count == 1
+        error_file = next((tmp_path / "errors" / "nmea").iterdir())
+        assert len(error_file.read_text().splitlines()) == 5
+
+    def test_error_dir_recreated_after_removal(self, tmp_path):
+        """Test that a removed error directory is recreated on the next record."""
+        writer = FileWriter(str(tmp_path))
+        writer.write_invalid_record("PNORI", "$PNORI,1")
+        error_dir = tmp_path / "errors" / "nmea"
+        for f in error_dir.iterdir():
+            f.unlink()
+        error_dir.rmdir()
+
+        writer.write_invalid_record("PNORI", "$PNORI,2")  # fails, drops the cached dir
+        writer.write_invalid_record("PNORI", "$PNORI,3")
+
+        assert "$PNORI,3" in next(error_dir.iterdir()).read_text()
+
     def test_close_exception_logging(self, tmp_path):
         """Test exception handling in close."""
         writer = FileWriter(str(tmp_path))
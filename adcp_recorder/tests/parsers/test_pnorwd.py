@@ -1,5 +1,7 @@
 """Tests for PNORWD wave directional spectra parser."""
 
+import tracemalloc
+
 import pytest
 
 from adcp_recorder.parsers.pnorwd import PNORWD
@@ -75,6 +77,18 @@ class TestPNORWDParser:
         with pytest.raises(ValueError, match="Missing value"):
             PNORWD.from_nmea(sentence)
 
+    def test_huge_count_rejected_without_allocating(self):
+        """Test that a corrupt frequency count is rejected before any allocation."""
+        sentence = "$PNORWD,MD,120720,093150,1,0.05,0.02,50000000,45.0,90.0,135.0*00"
+        tracemalloc.start()
+        try:
+            with pytest.raises(ValueError, match="Missing value"):
+                PNORWD.from_nmea(sentence)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 1024 * 1024
+
     def test_to_dict(self):
         """Test conversion to dictionary."""
         sentence = "$PNORWD,DS,120720,093150,3,0.03,0.01,4,30.5,45.2,60.8,75.1*00"
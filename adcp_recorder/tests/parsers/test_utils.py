@@ -33,6 +33,16 @@ class TestParserUtils:
         with pytest.raises(ValueError, match="Invalid date:"):
             validate_date_mm_dd_yy("013220")
 
+    def test_validate_date_repeated_calls_stay_consistent(self):
+        # Results are cached per (value, format); a string valid in one format must
+        # not leak into another
+        for _ in range(3):
+            validate_date_mm_dd_yy("123120")
+            with pytest.raises(ValueError, match="Invalid date:"):
+                validate_date_yy_mm_dd("123120")
+            with pytest.raises(ValueError, match="Invalid date:"):
+                validate_date_mm_dd_yy("133120")
+
     def test_validate_date_yy_mm_dd_valid(self):
         validate_date_yy_mm_dd("151021")
         validate_date_yy_mm_dd("200101")
@@ -8,6 +8,7 @@ from adcp_recorder.export.file_writer import FileWriter
 from adcp_recorder.serial.consumer import MessageRouter, SerialConsumer
 from adcp_recorder.serial.port_manager import SerialConnectionManager
 from adcp_recorder.serial.producer import SerialProducer
+from adcp_recorder.serial.ring_buffer import RingBufferQueue
 
 
 class FakeConnectionManager:
@@ -66,6 +67,24 @@ def test_queue_drop_oldest_behavior():
     assert items_str == ["line3", "line4", "line5"]
 
 
+def test_ring_buffer_drop_oldest_behavior():
+    # Same scenario through the recorder's RingBufferQueue overwrite path
+    q = RingBufferQueue(maxsize=3)
+    lines = [f"line{i}\n".encode("ascii") for i in range(1, 6)]
+
+    manager = FakeConnectionManager(lines)
+    producer = SerialProducer(
+        connection_manager=cast(SerialConnectionManager, manager), queue=q, max_line_length=1024
+    )
+
+    producer.start()
+    time.sleep(0.5)
+    producer.stop()
+
+    items = [q.get_nowait().decode("ascii") for _ in range(q.qsize())]
+    assert items == ["line3", "line4", "line5"]
+
+
 def test_binary_blob_streaming(tmp_path):
     base = str(tmp_path)
     # create binary chunks (many zero bytes to be detected as binary)
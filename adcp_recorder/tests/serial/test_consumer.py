@@ -487,3 +487,50 @@ class TestSerialConsumer:
             with caplog.at_level(logging.WARNING):
                 consumer.stop()
                 assert "Consumer thread did not exit cleanly within timeout" in caplog.text
+
+    def test_consume_drains_queue_in_batches(self, db_path):
+        """Test that one blocking get() is followed by non-blocking drains."""
+        queue: Queue[Any] = Queue()
+        db = DatabaseManager(db_path)
+        router = MessageRouter()
+        router.register_parser("PNORI", PNORI)
+        consumer = SerialConsumer(queue, db, router)
+
+        for i in range(600):
+            queue.put(f"$PNORI,4,Dev{i},4,20,0.20,1.00,0*2E".encode("ascii"))
+
+        # Not running: the loop exits once the queue is empty
+        with patch.object(queue, "get", wraps=queue.get) as mock_get:
+            consumer._consume_loop()
+
+        # Queue.get_nowait() calls get(block=False); only count the blocking waits
+        blocking = [c for c in mock_get.call_args_list if "timeout" in c.kwargs]
+        # 600 items in batches of 256 plus the final empty poll
+        assert len(blocking) == 4
+        conn = DatabaseManager(db_path).get_connection()
+        row = conn.execute("SELECT COUNT(*) FROM pnori").fetchone()
+        assert row is not None
+        assert row[0] == 600
+
+    def test_line_errors_are_throttled(self, db_path, caplog):
+        """Test that a burst of failing lines logs a bounded number of tracebacks."""
+        import logging
+
+        queue: Queue[Any] = Queue()
+        db = DatabaseManager(db_path)
+        consumer = SerialConsumer(queue, db, MessageRouter())
+
+        for _ in range(50):
+            queue.put(b"$PNORI,4,Test,4,20,0.20,1.00,0*2E")
+
+        with (
+            patch.object(consumer, "_process_line", side_effect=RuntimeError("boom")),
+            caplog.at_level(logging.ERROR),
+        ):
+            consumer._consume_loop()
+            assert caplog.text.count("Error processing line: boom") == 10
+
+            # The next error after the window reports how many were swallowed
+            consumer._error_window_start -= 2.0
+            consumer._log_line_error(RuntimeError("boom"))
+            assert "Suppressed 40 further line processing errors" in caplog.text
@@ -45,8 +45,7 @@ def test_producer_unicode_decode_error_threshold(tmp_path):
         time.sleep(0.2)
         producer.stop()
 
-        # Fix bytes formatting issue
-        mock_logger.warning.assert_any_call(f"Failed to decode ASCII: {invalid_data[:50]!r}")
+        mock_logger.warning.assert_any_call("Failed to decode ASCII: %r", invalid_data[:50])
         assert queue.qsize() == 1
 
 
@@ -1,7 +1,10 @@
 """Tests for serial port management."""
 
+import contextlib
+import os
 from unittest.mock import MagicMock, Mock, patch
 
+import pytest
 import serial
 
 from adcp_recorder.serial import (
@@ -259,14 +262,15 @@ class TestSerialConnectionManager:
         with patch("serial.Serial") as mock_serial:
             mock_instance = Mock()
             mock_instance.is_open = True
-            mock_instance.readline.return_value = b"$PNORI,4,Test*2E\\r\\n"
+            mock_instance.in_waiting = 0
+            mock_instance.read.return_value = b"$PNORI,4,Test*2E\r\n"
             mock_serial.return_value = mock_instance
 
             manager.connect()
             line = manager.read_line()
 
-            assert line == b"$PNORI,4,Test*2E\\r\\n"
-            mock_instance.readline.assert_called_once()
+            assert line == b"$PNORI,4,Test*2E\r\n"
+            mock_instance.read.assert_called_once_with(1)
 
     def test_read_line_timeout(self):
         """Test read_line when timeout occurs."""
@@ -275,7 +279,8 @@ class TestSerialConnectionManager:
         with patch("serial.Serial") as mock_serial:
             mock_instance = Mock()
             mock_instance.is_open = True
-            mock_instance.readline.return_value = b""  # Empty = timeout
+            mock_instance.in_waiting = 0
+            mock_instance.read.return_value = b""  # Empty = timeout
             mock_serial.return_value = mock_instance
 
             manager.connect()
@@ -291,6 +296,23 @@ class TestSerialConnectionManager:
 
         assert line is None
 
+    def test_read_line_bounds_unterminated_data(self):
+        """Test that a stream without newlines is returned once the buffer cap is hit."""
+        manager = SerialConnectionManager("/dev/ttyUSB0")
+
+        with patch("serial.Serial") as mock_serial:
+            mock_instance = Mock()
+            mock_instance.is_open = True
+            mock_instance.in_waiting = 4096
+            mock_instance.read.return_value = b"\xff" * 4096
+            mock_serial.return_value = mock_instance
+
+            manager.connect()
+            line = manager.read_line()
+
+            assert line == b"\xff" * 65536
+            assert mock_instance.read.call_count == 16
+
     def test_read_line_with_timeout_override(self):
         """Test read_line with custom timeout."""
         manager = SerialConnectionManager("/dev/ttyUSB0", timeout=1.0)
@@ -299,7 +321,8 @@ class TestSerialConnectionManager:
             mock_instance = Mock()
             mock_instance.is_open = True
             mock_instance.timeout = 1.0
-            mock_instance.readline.return_value = b"$TEST*00\\r\\n"
+            mock_instance.in_waiting = 0
+            mock_instance.read.return_value = b"$TEST*00\r\n"
             mock_serial.return_value = mock_instance
 
             manager.connect()
@@ -307,7 +330,7 @@ class TestSerialConnectionManager:
 
             # Timeout should be set to 5.0 and restored to 1.0
             assert mock_instance.timeout == 1.0
-            assert line == b"$TEST*00\\r\\n"
+            assert line == b"$TEST*00\r\n"
 
     def test_read_line_handles_serial_exception(self):
         """Test read_line handles SerialException by disconnecting."""
@@ -316,7 +339,8 @@ class TestSerialConnectionManager:
         with patch("serial.Serial") as mock_serial:
             mock_instance = Mock()
             mock_instance.is_open = True
-            mock_instance.readline.side_effect = serial.SerialException("Read error")
+            mock_instance.in_waiting = 0
+            mock_instance.read.side_effect = serial.SerialException("Read error")
             mock_serial.return_value = mock_instance
 
             manager.connect()
@@ -324,3 +348,164 @@ class TestSerialConnectionManager:
 
             assert line is None
             assert not manager.is_connected()
+
+    def test_read_line_splits_burst(self):
+        """Test that one bulk read serves several lines from the buffer."""
+        manager = SerialConnectionManager("/dev/ttyUSB0")
+
+        with patch("serial.Serial") as mock_serial:
+            mock_instance = Mock()
+            mock_instance.is_open = True
+            mock_instance.in_waiting = 30
+            mock_instance.read.side_effect = [b"$A*00\r\n$B*00\r\n$C*0", b"0\r\n"]
+            mock_serial.return_value = mock_instance
+
+            manager.connect()
+            lines = [manager.read_line() for _ in range(3)]
+
+            assert lines == [b"$A*00\r\n", b"$B*00\r\n", b"$C*00\r\n"]
+            mock_instance.read.assert_called_with(30)
+            assert mock_instance.read.call_count == 2
+
+    def test_read_line_returns_partial_on_timeout(self):
+        """Test that a partial line is returned once the read times out."""
+        manager = SerialConnectionManager("/dev/ttyUSB0")
+
+        with patch("serial.Serial") as mock_serial:
+            mock_instance = Mock()
+            mock_instance.is_open = True
+            mock_instance.in_waiting = 0
+            mock_instance.read.side_effect = [b"$PART", b""]
+            mock_serial.return_value = mock_instance
+
+            manager.connect()
+
+            assert manager.read_line() == b"$PART"
+
+    def test_read_lines_yields_buffered_lines(self):
+        """Test that read_lines yields all complete lines from one burst."""
+        manager = SerialConnectionManager("/dev/ttyUSB0")
+
+        with patch("serial.Serial") as mock_serial:
+            mock_instance = Mock()
+            mock_instance.is_open = True
+            mock_instance.in_waiting = 20
+            mock_instance.read.side_effect = [b"$A*00\n$B*00\n$C", b""]
+            mock_serial.return_value = mock_instance
+
+            manager.connect()
+
+            assert list(manager.read_lines()) == [b"$A*00\n", b"$B*00\n"]
+            assert mock_instance.read.call_count == 1
+
+    def test_read_available_splits_on_newline_only(self):
+        """Test that a bare carriage return does not split a line."""
+        manager = SerialConnectionManager("/dev/ttyUSB0")
+
+        with patch("serial.Serial") as mock_serial:
+            mock_instance = Mock()
+            mock_instance.is_open = True
+            mock_instance.in_waiting = 24
+            mock_instance.read.return_value = b"$A\r*00\r\n$B\x0b*00\n$C"
+            mock_serial.return_value = mock_instance
+
+            manager.connect()
+
+            assert manager.read_available() == [b"$A\r*00\r\n", b"$B\x0b*00\n"]
+            assert bytes(manager._rxbuf) == b"$C"
+
+    def test_read_available_bounds_unterminated_data(self):
+        """Test that data without newlines is returned once the buffer cap is hit."""
+        manager = SerialConnectionManager("/dev/ttyUSB0")
+
+        with patch("serial.Serial") as mock_serial:
+            mock_instance = Mock()
+            mock_instance.is_open = True
+            mock_instance.in_waiting = 40000
+            mock_instance.read.return_value = b"\xff" * 40000
+            mock_serial.return_value = mock_instance
+
+            manager.connect()
+
+            assert manager.read_available() == []
+            assert manager.read_available() == [b"\xff" * 80000]
+            assert len(manager._rxbuf) == 0
+
+    def test_disconnect_discards_buffered_data(self):
+        """Test that buffered bytes from a closed port are not returned later."""
+        manager = SerialConnectionManager("/dev/ttyUSB0")
+
+        with patch("serial.Serial") as mock_serial:
+            mock_instance = Mock()
+            mock_instance.is_open = True
+            mock_instance.in_waiting = 20
+            mock_instance.read.side_effect = [b"$A*00\n$STALE", b"$NEW*00\n"]
+            mock_serial.return_value = mock_instance
+
+            manager.connect()
+            assert manager.read_line() == b"$A*00\n"
+            manager.disconnect()
+            manager.connect()
+
+            assert manager.read_line() == b"$NEW*00\n"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="direct fd reads are POSIX-only")
+class TestSerialConnectionManagerFd:
+    """Test direct file-descriptor reads on a pseudo-terminal."""
+
+    @pytest.fixture
+    def pty_manager(self):
+        """Yield (manager, master_fd) with the manager's port backed by a pty."""
+        import tty  # POSIX-only
+
+        master, slave = os.openpty()
+        # pyserial would put the port in raw mode; do the same for the pty
+        tty.setraw(slave)
+        fake_serial = Mock()
+        fake_serial.is_open = True
+        fake_serial.fileno.return_value = slave
+
+        manager = SerialConnectionManager("/dev/ttyFake", timeout=0.05)
+        with patch("serial.Serial", return_value=fake_serial):
+            manager.connect()
+        yield manager, master
+
+        for fd in (master, slave):
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    def test_fileno_exposed(self, pty_manager):
+        """Test that the descriptor is used when pyserial provides one."""
+        manager, _ = pty_manager
+        assert isinstance(manager.fileno(), int)
+
+    def test_fileno_none_without_native_descriptor(self):
+        """Test that backends without an int fileno fall back to pyserial reads."""
+        manager = SerialConnectionManager("/dev/ttyUSB0")
+        with patch("serial.Serial", return_value=Mock(is_open=True)):
+            manager.connect()
+        assert manager.fileno() is None
+
+    def test_read_line_from_fd(self, pty_manager):
+        """Test that lines written to the pty are split from one os.read."""
+        manager, master = pty_manager
+        os.write(master, b"$A*00\r\n$B*00\r\n")
+
+        assert manager.read_line() == b"$A*00\r\n"
+        assert manager.read_line() == b"$B*00\r\n"
+
+    def test_read_line_fd_timeout(self, pty_manager):
+        """Test that an idle descriptor times out with None."""
+        manager, _ = pty_manager
+        assert manager.read_line(timeout=0.01) is None
+        assert manager.is_connected()
+
+    def test_read_line_fd_hangup_disconnects(self, pty_manager):
+        """Test that a hung-up device disconnects the manager."""
+        manager, master = pty_manager
+        os.close(master)
+
+        assert manager.read_line() is None
+        assert not manager.is_connected()
+        assert manager.fileno() is None
@@ -1,12 +1,21 @@
 """Tests for serial producer."""
 
+import contextlib
 import itertools
+import os
 import time
 from queue import Queue
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from adcp_recorder.serial import SerialConnectionManager, SerialProducer
+import pytest
+
+from adcp_recorder.serial import (
+    RingBufferQueue,
+    SerialConnectionManager,
+    SerialMultiplexProducer,
+    SerialProducer,
+)
 
 
 class TestSerialProducer:
@@ -182,6 +191,25 @@ class TestSerialProducer:
         # Heartbeat should have been updated
         assert producer.last_heartbeat > initial_heartbeat
 
+    def test_heartbeat_throttled_by_time(self):
+        """Test that a steady stream refreshes the heartbeat every half interval."""
+        manager = Mock(spec=SerialConnectionManager)
+        queue: Queue[Any] = Queue(maxsize=100)
+        producer = SerialProducer(manager, queue, heartbeat_interval=5.0)
+
+        with patch("adcp_recorder.serial.producer.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            producer.handle_line(b"$A*00\r\n")
+            assert producer.last_heartbeat == 100.0
+
+            monotonic.return_value = 102.0
+            producer.handle_line(b"$B*00\r\n")
+            assert producer.last_heartbeat == 100.0
+
+            monotonic.return_value = 102.5
+            producer.handle_line(b"$C*00\r\n")
+            assert producer.last_heartbeat == 102.5
+
     def test_queue_overflow_drops_oldest(self):
         """Test that queue overflow drops oldest items."""
         manager = Mock(spec=SerialConnectionManager)
@@ -288,3 +316,71 @@ class TestSerialProducer:
 
         assert isinstance(item, BinaryChunk)
         assert item.data == invalid_data
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="multiplexing needs POSIX file descriptors")
+class TestSerialMultiplexProducer:
+    """Test SerialMultiplexProducer over pseudo-terminals."""
+
+    @pytest.fixture
+    def pty_ports(self):
+        """Yield a list of (manager, master_fd) pairs backed by connected ptys."""
+        import tty  # POSIX-only
+
+        opened: list[int] = []
+        ports = []
+        for i in range(2):
+            master, slave = os.openpty()
+            tty.setraw(slave)
+            opened += [master, slave]
+            fake_serial = Mock(is_open=True)
+            fake_serial.fileno.return_value = slave
+
+            manager = SerialConnectionManager(f"/dev/ttyFake{i}", timeout=0.05)
+            with patch("serial.Serial", return_value=fake_serial):
+                manager.connect()
+            ports.append((manager, master))
+        yield ports
+
+        for fd in opened:
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    def test_reads_all_ports_on_one_thread(self, pty_ports):
+        """Test that lines from every port reach the shared queue."""
+        queue = RingBufferQueue(maxsize=100)
+        producer = SerialMultiplexProducer([m for m, _ in pty_ports], queue)
+
+        os.write(pty_ports[0][1], b"$PNORI,4,A*00\r\n$PNORS,1*00\r\n")
+        os.write(pty_ports[1][1], b"$PNORI,4,B*00\r\n$PNOR")
+
+        producer.start()
+        _wait_for(lambda: queue.qsize() >= 3)
+        os.write(pty_ports[1][1], b"C,1*00\r\n")
+        _wait_for(lambda: queue.qsize() >= 4)
+        producer.stop()
+
+        items = sorted(queue.get_nowait() for _ in range(queue.qsize()))
+        assert items == [b"$PNORC,1*00", b"$PNORI,4,A*00", b"$PNORI,4,B*00", b"$PNORS,1*00"]
+        assert producer.last_heartbeat > 0
+
+    def test_hung_up_port_does_not_stop_others(self, pty_ports):
+        """Test that losing one port leaves the remaining ports readable."""
+        queue = RingBufferQueue(maxsize=100)
+        producer = SerialMultiplexProducer([m for m, _ in pty_ports], queue, reconnect_interval=60)
+
+        producer.start()
+        os.close(pty_ports[0][1])
+        _wait_for(lambda: not pty_ports[0][0].is_connected())
+        os.write(pty_ports[1][1], b"$PNORI,4,B*00\r\n")
+        _wait_for(lambda: queue.qsize() >= 1)
+        producer.stop()
+
+        assert not pty_ports[0][0].is_connected()
+        assert queue.get_nowait() == b"$PNORI,4,B*00"
@@ -0,0 +1,93 @@
+"""Tests for the deque-backed ring buffer queue."""
+
+import threading
+import time
+from queue import Empty, Full
+
+import pytest
+
+from adcp_recorder.serial import RingBufferQueue
+
+
+class TestRingBufferQueue:
+    """Test RingBufferQueue."""
+
+    def test_fifo_order(self):
+        """Test that items come out in insertion order."""
+        q = RingBufferQueue(maxsize=10)
+        for i in range(5):
+            q.put_nowait(i)
+
+        assert q.qsize() == 5
+        assert [q.get_nowait() for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert q.empty()
+
+    def test_put_nowait_raises_full(self):
+        """Test that a bounded queue rejects items beyond maxsize."""
+        q = RingBufferQueue(maxsize=2)
+        q.put_nowait(b"a")
+        q.put_nowait(b"b")
+
+        assert q.full()
+        with pytest.raises(Full):
+            q.put_nowait(b"c")
+
+    def test_unbounded_queue_never_full(self):
+        """Test that maxsize=0 means unbounded."""
+        q = RingBufferQueue()
+        for i in range(2000):
+            q.put_nowait(i)
+        assert not q.full()
+        assert q.qsize() == 2000
+
+    def test_get_nowait_raises_empty(self):
+        """Test that get_nowait raises Empty on an empty queue."""
+        q = RingBufferQueue()
+        with pytest.raises(Empty):
+            q.get_nowait()
+
+    def test_get_timeout_raises_empty(self):
+        """Test that get() gives up after the timeout."""
+        q = RingBufferQueue()
+        start = time.monotonic()
+        with pytest.raises(Empty):
+            q.get(timeout=0.05)
+        assert time.monotonic() - start >= 0.05
+
+    def test_get_wakes_on_put_from_other_thread(self):
+        """Test that a blocked get() returns as soon as an item is put."""
+        q = RingBufferQueue()
+
+        def delayed_put():
+            time.sleep(0.05)
+            q.put(b"$PNORI,4,Test,4,20,0.20,1.00,0*2E")
+
+        threading.Thread(target=delayed_put).start()
+        assert q.get(timeout=2.0) == b"$PNORI,4,Test,4,20,0.20,1.00,0*2E"
+
+    def test_put_blocking_timeout_raises_full(self):
+        """Test that a blocking put on a full queue times out."""
+        q = RingBufferQueue(maxsize=1)
+        q.put(1)
+        with pytest.raises(Full):
+            q.put(2, timeout=0.01)
+
+    def test_put_overwrite_drops_oldest(self):
+        """Test that put_overwrite discards the oldest item when full."""
+        q = RingBufferQueue(maxsize=3)
+        dropped = [q.put_overwrite(f"line{i}") for i in range(1, 6)]
+
+        assert dropped == [False, False, False, True, True]
+        assert [q.get_nowait() for _ in range(3)] == ["line3", "line4", "line5"]
+
+    def test_put_overwrite_unbounded_never_drops(self):
+        """Test that put_overwrite on an unbounded queue keeps everything."""
+        q = RingBufferQueue()
+        assert not any(q.put_overwrite(i) for i in range(100))
+        assert q.qsize() == 100
+
+    def test_put_overwrite_wakes_blocked_get(self):
+        """Test that put_overwrite signals a waiting consumer."""
+        q = RingBufferQueue(maxsize=1)
+        threading.Timer(0.05, q.put_overwrite, args=(b"data",)).start()
+        assert q.get(timeout=2.0) == b"data"
@@ -126,11 +126,8 @@ class TestSerialServiceCoverage:
             mock_recorder.producer.is_running = False
 
             sup = ServiceSupervisor(config)
-            # Make sleep trigger shutdown to exit loop
-            with patch(
-                "adcp_recorder.service.supervisor.time.sleep",
-                side_effect=lambda x: sup._shutdown_event.set(),
-            ):
+            # Make the health-check wait report shutdown to exit loop
+            with patch.object(sup._shutdown_event, "wait", return_value=True):
                 with patch("adcp_recorder.service.supervisor.logger") as mock_logger:
                     sup.run()
                     mock_logger.warning.assert_any_call("Producer thread is dead!")
@@ -189,7 +186,7 @@ class TestSerialServiceCoverage:
                 "Unexpected error getting from queue: Generic Queue Error", exc_info=True
             )
 
-    def test_supervisor_entry_point(self):
+    def test_supervisor_entry_point(self, restore_modules):
         """Cover __name__ == '__main__' block in supervisor.py."""
         # Patch AdcpRecorder to avoid starting real threads
         # Make start() raise an exception so the supervisor crashes and exits
@@ -1,4 +1,9 @@
+import io
+import logging
+import logging.handlers
 import signal
+import threading
+import time
 from unittest.mock import PropertyMock, patch
 
 import pytest
@@ -31,7 +36,7 @@ def test_supervisor_init_starts_recorder(mock_recorder, service_supervisor):
     # Set up is_running to return True first, then False to exit the loop
     type(mock_recorder).is_running = PropertyMock(side_effect=[True, False])
 
-    with patch("time.sleep"):
+    with patch("adcp_recorder.service.supervisor._HEALTH_CHECK_INTERVAL", 0.01):
         supervisor.run()
 
         mock_recorder.start.assert_called_once()
@@ -48,6 +53,39 @@ def test_signal_handling(mock_recorder, service_supervisor):
     assert supervisor._shutdown_event.is_set()
 
 
+def test_signal_interrupts_health_check_wait(mock_recorder, service_supervisor):
+    config = RecorderConfig()
+    supervisor = service_supervisor(config)
+
+    # Recorder stays healthy; only the signal can end the loop
+    threading.Timer(0.05, supervisor._handle_signal, args=(signal.SIGTERM, None)).start()
+
+    start = time.monotonic()
+    with patch("adcp_recorder.service.supervisor._HEALTH_CHECK_INTERVAL", 30.0):
+        supervisor.run()
+
+    assert time.monotonic() - start < 5.0
+    mock_recorder.stop.assert_called_once()
+
+
+def test_signal_during_startup_skips_recorder_start(service_supervisor):
+    config = RecorderConfig()
+
+    def build_recorder(_config):
+        # The handler must already be installed while the recorder is built
+        signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+        return mock_instance
+
+    with patch("adcp_recorder.service.supervisor.AdcpRecorder") as mock_recorder_cls:
+        mock_instance = mock_recorder_cls.return_value
+        mock_recorder_cls.side_effect = build_recorder
+        supervisor = service_supervisor(config)
+        supervisor.run()
+
+    mock_instance.start.assert_not_called()
+    mock_instance.stop.assert_called_once()
+
+
 def test_supervisor_stops_on_recorder_crash(mock_recorder, service_supervisor):
     config = RecorderConfig()
     supervisor = service_supervisor(config)
@@ -59,3 +97,121 @@ def test_supervisor_stops_on_recorder_crash(mock_recorder, service_supervisor):
 
     # Should have stopped
     mock_recorder.stop.assert_called()
+
+
+def test_buffered_log_handler_batches_until_error():
+    from adcp_recorder.service.supervisor import _BufferedLogHandler
+
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    handler = _BufferedLogHandler(512, flushLevel=logging.ERROR, target=target)
+    log = logging.getLogger("adcp_recorder.tests.buffered")
+    log.propagate = False
+    log.addHandler(handler)
+    try:
+        log.warning("first")
+        log.warning("second")
+        assert stream.getvalue() == ""
+
+        log.error("third")
+        assert stream.getvalue().splitlines() == ["first", "second", "third"]
+    finally:
+        log.removeHandler(handler)
+        handler.close()
+
+
+def test_buffered_log_handler_flushes_stale_records():
+    from adcp_recorder.service.supervisor import _BufferedLogHandler
+
+    stream = io.StringIO()
+    handler = _BufferedLogHandler(512, target=logging.StreamHandler(stream))
+
+    old = logging.makeLogRecord({"msg": "old", "levelno": logging.INFO, "created": 100.0})
+    new = logging.makeLogRecord({"msg": "new", "levelno": logging.INFO, "created": 102.0})
+    handler.handle(old)
+    assert stream.getvalue() == ""
+    handler.handle(new)
+    assert stream.getvalue().splitlines() == ["old", "new"]
+    handler.close()
+
+
+def test_setup_logging_writes_from_listener_thread(capsys):
+    from adcp_recorder.service.supervisor import (
+        _BufferedLogHandler,
+        _setup_logging,
+        _stop_logging,
+    )
+
+    root = logging.getLogger()
+    with patch.object(root, "handlers", []), patch.object(root, "level", root.level):
+        listener = _setup_logging(RecorderConfig())
+        assert listener is not None
+        assert [type(h) for h in root.handlers] == [logging.handlers.QueueHandler]
+        assert isinstance(listener.handlers[0], _BufferedLogHandler)
+
+        logging.getLogger("adcp_recorder.tests.queued").info("queued line")
+        _stop_logging(listener)
+
+    assert "INFO - queued line" in capsys.readouterr().err
+
+
+def test_setup_logging_keeps_existing_configuration():
+    from adcp_recorder.service.supervisor import _setup_logging, _stop_logging
+
+    root = logging.getLogger()
+    existing = logging.NullHandler()
+    with patch.object(root, "handlers", [existing]):
+        assert _setup_logging(RecorderConfig()) is None
+        assert root.handlers == [existing]
+    _stop_logging(None)
+
+
+def test_setup_logging_uses_configured_level():
+    from adcp_recorder.service.supervisor import _setup_logging, _stop_logging
+
+    root = logging.getLogger()
+    with patch.object(root, "handlers", []), patch.object(root, "level", root.level):
+        listener = _setup_logging(RecorderConfig(log_level="debug"))
+        assert root.level == logging.DEBUG
+        _stop_logging(listener)
+
+    with patch.object(root, "handlers", []), patch.object(root, "level", root.level):
+        listener = _setup_logging(RecorderConfig(log_level="bogus"))
+        assert root.level == logging.INFO
+        _stop_logging(listener)
+
+
+def test_main_loads_config_once(mock_recorder):
+    from adcp_recorder.service.supervisor import main
+
+    with (
+        patch("adcp_recorder.service.supervisor.RecorderConfig.load") as mock_load,
+        patch("adcp_recorder.service.supervisor.ServiceSupervisor") as mock_supervisor_cls,
+    ):
+        main()
+
+    mock_load.assert_called_once()
+    mock_supervisor_cls.assert_called_once_with(mock_load.return_value)
+
+
+def test_main_drains_log_queue_on_crash(capsys):
+    from adcp_recorder.service.supervisor import main
+
+    def crash():
+        logging.getLogger("adcp_recorder.tests.queued").info("last words")
+        raise SystemExit(1)
+
+    root = logging.getLogger()
+    with (
+        patch.object(root, "handlers", []),
+        patch.object(root, "level", root.level),
+        patch(
+            "adcp_recorder.service.supervisor.RecorderConfig.load", return_value=RecorderConfig()
+        ),
+        patch("adcp_recorder.service.supervisor.ServiceSupervisor") as mock_supervisor_cls,
+    ):
+        mock_supervisor_cls.return_value.run.side_effect = crash
+        with pytest.raises(SystemExit):
+            main()
+
+    assert "INFO - last words" in capsys.readouterr().err
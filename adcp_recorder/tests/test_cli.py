@@ -35,7 +35,7 @@ def mock_config(tmp_path):
 
 
 def test_list_ports_empty(runner, cli):
-    with patch("adcp_recorder.cli.main.list_serial_ports", return_value=[]):
+    with patch("adcp_recorder.serial.port_manager.list_serial_ports", return_value=[]):
         result = runner.invoke(cli, ["list-ports"])
         assert result.exit_code == 0
         assert "No serial ports found" in result.output
@@ -47,7 +47,7 @@ def test_list_ports_found(runner, cli):
     mock_port.description = "FTDI Serial"
     mock_port.hwid = "12345"
 
-    with patch("adcp_recorder.cli.main.list_serial_ports", return_value=[mock_port]):
+    with patch("adcp_recorder.serial.port_manager.list_serial_ports", return_value=[mock_port]):
         result = runner.invoke(cli, ["list-ports"])
         assert result.exit_code == 0
         assert "Found 1 ports" in result.output
@@ -73,7 +73,7 @@ def test_configure_update(runner, mock_config, cli):
 
 
 def test_start(runner, mock_config, cli):
-    with patch("adcp_recorder.cli.main.AdcpRecorder") as mock_recorder_cls:
+    with patch("adcp_recorder.core.recorder.AdcpRecorder") as mock_recorder_cls:
         result = runner.invoke(cli, ["start"])
         assert result.exit_code == 0
         assert "Starting recorder" in result.output
@@ -84,10 +84,24 @@ def test_start(runner, mock_config, cli):
 
 def test_status(runner, mock_config, cli):
     # Mock list_serial_ports for the check inside status
-    with patch("adcp_recorder.cli.main.list_serial_ports", return_value=[]):
+    with patch("adcp_recorder.serial.port_manager.list_serial_ports", return_value=[]):
         result = runner.invoke(cli, ["status"])
         assert result.exit_code == 0
         assert "ADCP Recorder Status" in result.output
         assert "Serial Port:       /dev/ttyUSB0" in result.output
         # Since we returned empty ports list, it should warn
         assert "[WARNING] Serial port /dev/ttyUSB0 not found" in result.output
+
+
+def test_cli_import_does_not_load_database_stack():
+    """The CLI module defers recorder imports to the commands that need them."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, adcp_recorder.cli.main; print(sorted({'duckdb', 'numpy'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
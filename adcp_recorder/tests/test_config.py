@@ -1,3 +1,4 @@
+import json
 import logging
 from unittest.mock import patch
 
@@ -108,3 +109,28 @@ def test_invalid_env_override(monkeypatch, mock_config_path, caplog):
 
     assert "Ignoring ADCP_RECORDER_BAUDRATE" in caplog.text
     assert loaded.baudrate == baseline.baudrate
+
+
+def test_load_reuses_parsed_file_until_it_changes(mock_config_path):
+    RecorderConfig(serial_port="/dev/ttyUSB1").save()
+
+    with patch("adcp_recorder.config.json.load", wraps=json.load) as mock_load:
+        first = RecorderConfig.load()
+        second = RecorderConfig.load()
+        assert mock_load.call_count == 1
+        # Each load still hands out its own instance
+        assert first == second
+        assert first is not second
+
+        mock_config_path.write_text('{"serial_port": "/dev/ttyUSB9", "baudrate": 4800}')
+        changed = RecorderConfig.load()
+        assert mock_load.call_count == 2
+        assert changed.serial_port == "/dev/ttyUSB9"
+
+
+def test_cached_load_still_applies_env_overrides(mock_config_path, monkeypatch):
+    RecorderConfig(baudrate=9600).save()
+    assert RecorderConfig.load().baudrate == 9600
+
+    monkeypatch.setenv("ADCP_RECORDER_BAUDRATE", "19200")
+    assert RecorderConfig.load().baudrate == 19200
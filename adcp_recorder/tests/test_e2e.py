@@ -31,6 +31,12 @@ class MockSerial:
         time.sleep(0.1)
         return b""
 
+    # SerialConnectionManager reads in bulk; hand back one whole line per read
+    in_waiting = 0
+
+    def read(self, size=1):
+        return self.readline()
+
     def close(self):
         self.is_open = False
 
@@ -218,6 +224,11 @@ def test_reconnect_scenario(temp_recorder_dir):
                 return b"$PNORI,4,AfterReconnect,4,20,0.20,1.00,0*33\r\n"
             return b""
 
+        in_waiting = 0
+
+        def read(self, size: int = 1) -> bytes:
+            return self.readline()
+
         def close(self) -> None:
             self.is_open = False
 
@@ -14,7 +14,7 @@ def migration_utils():
 # --- CLI and Service Main Execution Tests ---
 
 
-def test_cli_main_execution():
+def test_cli_main_execution(restore_modules):
     """Test executing adcp_recorder.cli.main as a script."""
     # We pass --help so it runs arguments parsing and exits with 0
     # Remove from sys.modules to avoid RuntimeWarning when runpy executes it
@@ -31,7 +31,7 @@ def test_cli_main_execution():
         assert excinfo.value.code == 0
 
 
-def test_supervisor_main_execution():
+def test_supervisor_main_execution(restore_modules):
     """Test executing adcp_recorder.service.supervisor as a script."""
     # We patch the AdcpRecorder at the source so it gets picked up by the import in supervisor.py
     # We make start() raise an exception so the supervisor loop crashes and calls sys.exit(1)
@@ -279,7 +279,7 @@ def test_migration_main_inplace(tmp_path):
 @pytest.mark.filterwarnings(
     "ignore:'adcp_recorder.db.migration' found in sys.modules:RuntimeWarning"
 )
-def test_migration_main_block():
+def test_migration_main_block(restore_modules):
     """Test the if __name__ == '__main__': block using runpy using --help."""
     # Remove from sys.modules to avoid RuntimeWarning when runpy executes it
     import sys
@@ -299,7 +299,7 @@ def test_migration_main_block():
 # --- Config Coverage Tests ---
 
 
-def test_config_get_default_config_dir_windows():
+def test_config_get_default_config_dir_windows(restore_modules):
     """Test get_default_config_dir on Windows platform (lines 59-63)."""
     import importlib
     import sys
@@ -325,7 +325,7 @@ def test_config_get_default_config_dir_windows():
             assert "ProgramData" in str(config_dir)
 
 
-def test_config_get_default_config_dir_windows_fallback():
+def test_config_get_default_config_dir_windows_fallback(restore_modules):
     """Test get_default_config_dir on Windows with fallback path."""
     import importlib
     import os
@@ -356,7 +356,7 @@ def test_config_get_default_config_dir_windows_fallback():
             assert "ProgramData" in str(config_dir)
 
 
-def test_config_get_default_config_dir_linux():
+def test_config_get_default_config_dir_linux(restore_modules):
     """Test get_default_config_dir on Linux platform (line 63)."""
     import importlib
     import sys
@@ -40,6 +40,12 @@ class BulkMockSerial:
         time.sleep(0.1)
         return b""
 
+    # SerialConnectionManager reads in bulk; hand back one whole line per read
+    in_waiting = 0
+
+    def read(self, size=1):
+        return self.readline()
+
     def close(self):
         self.is_open = False
 